@@ -0,0 +1,25 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import text
+from app.models.database import engine
+
+def migrate():
+    print("🚀 Starting migration: Adding CANCELLED to the runstatus enum...")
+    # ALTER TYPE ... ADD VALUE cannot run inside a transaction block on older PostgreSQL
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        try:
+            # Check if value exists
+            result = conn.execute(text("SELECT 1 FROM pg_enum e JOIN pg_type t ON e.enumtypid = t.oid WHERE t.typname = 'runstatus' AND e.enumlabel = 'CANCELLED'"))
+            if not result.fetchone():
+                print("📝 Value 'CANCELLED' not found. Adding it...")
+                conn.execute(text("ALTER TYPE runstatus ADD VALUE 'CANCELLED'"))
+                print("✅ Value 'CANCELLED' added successfully!")
+            else:
+                print("ℹ️ Value 'CANCELLED' already exists.")
+        except Exception as e:
+            print(f"❌ Error during migration: {str(e)}")
+
+if __name__ == "__main__":
+    migrate()
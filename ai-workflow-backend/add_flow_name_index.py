@@ -0,0 +1,34 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import text
+from app.models.database import engine
+
+def migrate():
+    print("🚀 Starting migration: Indexing flows.name for flow search...")
+    with engine.connect() as conn:
+        try:
+            # Check if the index already exists
+            result = conn.execute(text("SELECT indexname FROM pg_indexes WHERE tablename='flows' AND indexname='ix_flows_name_trgm'"))
+            if result.fetchone():
+                print("ℹ️ Index 'ix_flows_name_trgm' already exists.")
+                return
+            # Trigram index: serves the case-insensitive substring search of GET /api/flows?q=
+            # (a btree cannot, the pattern starts with a wildcard)
+            print("📝 Creating trigram index 'ix_flows_name_trgm'...")
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            conn.execute(text("CREATE INDEX ix_flows_name_trgm ON flows USING gin (name gin_trgm_ops)"))
+            # Left by earlier runs of this script; it never served the search
+            conn.execute(text("DROP INDEX IF EXISTS ix_flows_name_lower"))
+            conn.commit()
+            print("✅ Index 'ix_flows_name_trgm' created successfully!")
+        except Exception as e:
+            conn.rollback()
+            print(f"❌ Error during migration: {str(e)}")
+            print("   Flow name search needs the pg_trgm extension (a superuser or an allow-listed extension); "
+                  "until it is indexed, GET /api/flows?q= scans every flow.")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    migrate()
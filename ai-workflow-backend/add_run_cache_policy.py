@@ -0,0 +1,25 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import text
+from app.models.database import engine
+
+def migrate():
+    print("🚀 Starting migration: Adding run_cache_ttl to flows table...")
+    with engine.connect() as conn:
+        try:
+            # Check if column exists
+            result = conn.execute(text("SELECT column_name FROM information_schema.columns WHERE table_name='flows' AND column_name='run_cache_ttl'"))
+            if not result.fetchone():
+                print("📝 Column 'run_cache_ttl' not found. Adding it...")
+                conn.execute(text("ALTER TABLE flows ADD COLUMN run_cache_ttl INTEGER NULL"))
+                conn.commit()
+                print("✅ Column 'run_cache_ttl' added successfully!")
+            else:
+                print("ℹ️ Column 'run_cache_ttl' already exists.")
+        except Exception as e:
+            print(f"❌ Error during migration: {str(e)}")
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,39 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import text
+from app.models.database import engine
+
+def migrate():
+    print("🚀 Starting migration: Adding run_checkpoints table...")
+    with engine.connect() as conn:
+        try:
+            # Check if table exists
+            result = conn.execute(text("SELECT table_name FROM information_schema.tables WHERE table_name='run_checkpoints'"))
+            if not result.fetchone():
+                print("📝 Table 'run_checkpoints' not found. Creating it...")
+                conn.execute(text("""
+                    CREATE TABLE run_checkpoints (
+                        id SERIAL PRIMARY KEY,
+                        flow_run_id INTEGER UNIQUE NOT NULL REFERENCES flow_runs(id) ON DELETE CASCADE,
+                        flow_data JSON NOT NULL,
+                        input_message TEXT NOT NULL,
+                        state JSON NOT NULL,
+                        completed_nodes JSON NOT NULL,
+                        inactive_nodes JSON NOT NULL,
+                        failed_nodes JSON NOT NULL,
+                        created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TIMESTAMP WITH TIME ZONE
+                    )
+                """))
+                conn.execute(text("CREATE INDEX idx_run_checkpoints_flow_run_id ON run_checkpoints(flow_run_id)"))
+                conn.commit()
+                print("✅ Table 'run_checkpoints' created successfully!")
+            else:
+                print("ℹ️ Table 'run_checkpoints' already exists.")
+        except Exception as e:
+            print(f"❌ Error during migration: {str(e)}")
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,59 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import text
+from app.models.database import engine, SessionLocal
+
+def migrate():
+    print("🚀 Starting migration: Run history index and flow_run_rollups table...")
+    with engine.connect() as conn:
+        try:
+            # Check if index exists
+            result = conn.execute(text("SELECT indexname FROM pg_indexes WHERE tablename='flow_runs' AND indexname='ix_flow_runs_flow_id_created_at'"))
+            if not result.fetchone():
+                print("📝 Index 'ix_flow_runs_flow_id_created_at' not found. Creating it...")
+                conn.execute(text("CREATE INDEX ix_flow_runs_flow_id_created_at ON flow_runs (flow_id, created_at, id)"))
+                conn.commit()
+                print("✅ Index 'ix_flow_runs_flow_id_created_at' created successfully!")
+            else:
+                print("ℹ️ Index 'ix_flow_runs_flow_id_created_at' already exists.")
+            
+            # Check if table exists
+            result = conn.execute(text("SELECT table_name FROM information_schema.tables WHERE table_name='flow_run_rollups'"))
+            if not result.fetchone():
+                print("📝 Table 'flow_run_rollups' not found. Creating it...")
+                conn.execute(text("""
+                    CREATE TABLE flow_run_rollups (
+                        id SERIAL PRIMARY KEY,
+                        flow_id INTEGER NOT NULL REFERENCES flows(id) ON DELETE CASCADE,
+                        day DATE NOT NULL,
+                        runs INTEGER NOT NULL DEFAULT 0,
+                        successes INTEGER NOT NULL DEFAULT 0,
+                        failures INTEGER NOT NULL DEFAULT 0,
+                        cancellations INTEGER NOT NULL DEFAULT 0,
+                        durations JSON NOT NULL,
+                        CONSTRAINT uq_flow_run_rollups_flow_day UNIQUE (flow_id, day)
+                    )
+                """))
+                conn.execute(text("CREATE INDEX ix_flow_run_rollups_id ON flow_run_rollups(id)"))
+                conn.commit()
+                print("✅ Table 'flow_run_rollups' created successfully!")
+            else:
+                print("ℹ️ Table 'flow_run_rollups' already exists.")
+        except Exception as e:
+            print(f"❌ Error during migration: {str(e)}")
+            return
+    
+    # Backfill from existing runs (one full scan; afterwards the rollups are kept up to date as runs finish)
+    try:
+        from app.services import run_rollups
+        print("📝 Backfilling flow_run_rollups from flow_runs...")
+        with SessionLocal() as db:
+            counted = run_rollups.rebuild(db)
+        print(f"✅ Rollups rebuilt from {counted} finished runs.")
+    except Exception as e:
+        print(f"❌ Error during backfill: {str(e)}")
+
+if __name__ == "__main__":
+    migrate()
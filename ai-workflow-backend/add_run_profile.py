@@ -0,0 +1,25 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import text
+from app.models.database import engine
+
+def migrate():
+    print("🚀 Starting migration: Adding profile to flow_runs table...")
+    with engine.connect() as conn:
+        try:
+            # Check if column exists
+            result = conn.execute(text("SELECT column_name FROM information_schema.columns WHERE table_name='flow_runs' AND column_name='profile'"))
+            if not result.fetchone():
+                print("📝 Column 'profile' not found. Adding it...")
+                conn.execute(text("ALTER TABLE flow_runs ADD COLUMN profile JSON NULL"))
+                conn.commit()
+                print("✅ Column 'profile' added successfully!")
+            else:
+                print("ℹ️ Column 'profile' already exists.")
+        except Exception as e:
+            print(f"❌ Error during migration: {str(e)}")
+
+if __name__ == "__main__":
+    migrate()
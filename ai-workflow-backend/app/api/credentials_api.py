@@ -8,6 +8,8 @@ from pydantic import BaseModel
 
 from app.models import Credential, get_db
 from app.services.encryption_service import encryption_service
+from app.services.credential_cache import credential_cache
+from app.services.execution_pool import execution_pool
 
 logger = logging.getLogger(__name__)
 
@@ -120,6 +122,8 @@ async def update_credential(
         db_credential.updated_at = datetime.now()
         db.commit()
         db.refresh(db_credential)
+        credential_cache.invalidate(credential_id)
+        execution_pool.invalidate_credential(credential_id)
         
         logger.info(f"Credential updated: {db_credential.id}")
         return db_credential
@@ -146,6 +150,8 @@ async def delete_credential(credential_id: int, db: Session = Depends(get_db)):
         
         db.delete(db_credential)
         db.commit()
+        credential_cache.invalidate(credential_id)
+        execution_pool.invalidate_credential(credential_id)
         
         logger.info(f"Credential deleted: {credential_id}")
         return {"message": "Credential deleted successfully"}
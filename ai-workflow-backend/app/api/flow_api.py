@@ -4,16 +4,27 @@ import asyncio
 import json
 import uuid
 from typing import List, Optional
-from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from fastapi.responses import StreamingResponse
+from datetime import datetime, timezone
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query, Header
+from fastapi.responses import StreamingResponse, Response
+from sqlalchemy import or_, and_
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
+from app.config import settings
 from app.models import Flow, FlowRun, RunStatus, get_db
 from app.services.flow_executor import flow_executor
+from app.services.execution_pool import execution_pool
+from app.services.run_writer import run_writer
+from app.services.checkpoint_service import checkpoint_service
+from app.services.run_cache import run_cache
+from app.services.run_journal import run_journals
+from app.services.whatsapp_triggers import whatsapp_triggers
+from app.services import run_rollups
+from app.services.event_protocol import EventEncoder, make_encoder
+from app.services.tracing import tracer, chrome_trace
+from app.services.run_scheduler import run_scheduler, RunTicket, QueueFull
 from app.services.python_exporter_service import python_exporter_service
-from app.services.ghost_recorder_service import ghost_recorder_service
 
 logger = logging.getLogger(__name__)
 
@@ -39,9 +50,26 @@ class FlowResponse(BaseModel):
         from_attributes = True
 
 
+class FlowListItem(BaseModel):
+    """A listed flow; ``flow_data`` is only present with ``include=flow_data``."""
+    id: int
+    name: str
+    description: Optional[str] = ""
+    share_token: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    flow_data: Optional[dict] = None
+
+
+class FlowPage(BaseModel):
+    items: List[FlowListItem]
+    next_cursor: Optional[int] = None  # Pass as ``cursor`` to get the next page; null on the last page
+
+
 class FlowRunRequest(BaseModel):
     flow_data: dict
     input: str
+    flow_id: Optional[int] = None  # Set when running a saved flow (enables plan caching per flow)
 
 
 class FlowRunResponse(BaseModel):
@@ -49,16 +77,27 @@ class FlowRunResponse(BaseModel):
     logs: List[dict] = []
 
 
-class FlowRunHistoryResponse(BaseModel):
+class FlowRunSummary(BaseModel):
+    """A run in a flow's history; output and logs only with ``include=output``/``include=logs``."""
     id: int
-    input_message: str
-    output_result: str
     status: str
-    execution_logs: List[dict] = []
-    created_at: datetime
-    
-    class Config:
-        from_attributes = True
+    input_message: Optional[str] = None
+    error_message: Optional[str] = None
+    created_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    duration_ms: Optional[float] = None
+    output_result: Optional[str] = None
+    execution_logs: Optional[List[dict]] = None
+
+
+class FlowRunPage(BaseModel):
+    items: List[FlowRunSummary]
+    next_cursor: Optional[int] = None  # Pass as ``cursor`` to get the next page; null on the last page
+
+
+class RunCachePolicy(BaseModel):
+    enabled: bool
+    ttl: Optional[int] = None  # Seconds a cached run is replayed; defaults to RUN_CACHE_TTL
 
 
 # Endpoints
@@ -81,6 +120,7 @@ async def save_flow(flow: FlowCreate, db: Session = Depends(get_db)):
         db.add(db_flow)
         db.commit()
         db.refresh(db_flow)
+        whatsapp_triggers.update(db_flow)
         
         logger.info(f"Flow saved: {db_flow.id}")
         return db_flow
@@ -114,6 +154,10 @@ async def update_flow(flow_id: int, flow: FlowCreate, db: Session = Depends(get_
         
         db.commit()
         db.refresh(db_flow)
+        whatsapp_triggers.update(db_flow)
+        flow_executor.plans.invalidate(flow_id)
+        execution_pool.invalidate_plan(flow_id)
+        await run_cache.purge(flow_id)
         
         logger.info(f"Flow updated: {db_flow.id}")
         return db_flow
@@ -136,6 +180,10 @@ async def delete_flow(flow_id: int, db: Session = Depends(get_db)):
         
         db.delete(db_flow)
         db.commit()
+        whatsapp_triggers.remove(flow_id)
+        flow_executor.plans.invalidate(flow_id)
+        execution_pool.invalidate_plan(flow_id)
+        await run_cache.purge(flow_id)
         
         logger.info(f"Flow deleted: {flow_id}")
         return {"status": "success", "message": f"Flow {flow_id} deleted"}
@@ -148,81 +196,332 @@ async def delete_flow(flow_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _finish_run(flow_run_id: int, status: RunStatus, logs: list = None, output: str = None, error: str = None, trace=None):
+    """Queue the outcome of a run (and its timing profile, if traced) for its FlowRun row."""
+    fields = {"status": status, "error_message": error, "completed_at": datetime.now(timezone.utc)}
+    if output is not None:
+        fields["output_result"] = output
+    if logs is not None:
+        fields["execution_logs"] = logs
+    if trace is not None and trace.sampled:
+        profile = trace.summary()
+        profile["status"] = status.value
+        fields["profile"] = profile
+    run_writer.update(flow_run_id, **fields)
+
+
+def _encoder(protocol: int, verbosity: str) -> EventEncoder:
+    """Event encoder for the request's ``protocol``/``verbosity`` query parameters."""
+    try:
+        return make_encoder(protocol, verbosity)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _admit(background_tasks: Optional[BackgroundTasks], source: str, flow_id: int = None, share_token: str = None) -> RunTicket:
+    """
+    Claim a run slot (possibly queued), answering 429 when the run queue is full.
+    Pass no ``background_tasks`` for detached runs, which outlive the response.
+    """
+    try:
+        ticket = run_scheduler.admit(source, flow_id=flow_id, share_token=share_token)
+    except QueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "5"})
+    if background_tasks is not None:
+        # Safety net for streams that end before their generator runs (release is idempotent)
+        background_tasks.add_task(run_scheduler.release, ticket)
+    return ticket
+
+
+async def _wait_for_slot(ticket: RunTicket, encoder: EventEncoder):
+    """SSE events reporting a queued ticket's position until it is granted."""
+    event_type = "start"
+    async for position in run_scheduler.positions(ticket):
+        yield f"data: {encoder.encode({'type': event_type, 'status': 'queued', 'queue_position': position, 'message': f'Waiting for a free slot (position {position})...'})}\n\n"
+        event_type = "queue"
+
+
+def _mark_running(flow_run_id: int):
+    """Move a queued FlowRun to RUNNING once it gets a slot."""
+    run_writer.update(flow_run_id, status=RunStatus.RUNNING)
+
+
+async def _stream_run(flow_run_id: int, flow_data: dict, user_input: str, background_tasks=None, flow_id: int = None,
+                      resume: dict = None, encoder: EventEncoder = None, ticket: RunTicket = None,
+                      cancel_reason: str = "client disconnected"):
+    """Run a flow as SSE and record the outcome on its FlowRun, waiting for ``ticket`` first if it is queued."""
+    encoder = encoder or EventEncoder()
+    trace = tracer.start_run(force=settings.flow_profiles)
+    final_result = None
+    error_event = None
+    # Node outcomes seen so far, kept in case the client disconnects mid-run
+    partial_logs = []
+    try:
+        if ticket is not None and not ticket.granted:
+            async for line in _wait_for_slot(ticket, encoder):
+                yield line
+            _mark_running(flow_run_id)
+        async for event_json in execution_pool.execute(
+            flow_data, 
+            user_input, 
+            background_tasks=background_tasks,
+            flow_run_id=flow_run_id,
+            flow_id=flow_id,
+            resume=resume,
+            encoder=encoder,
+            trace=trace
+        ):
+            # Unreduced event, so v2 runs still see full logs without re-parsing
+            event = encoder.last_event
+            if event["type"] == "final":
+                final_result = event
+            elif event["type"] == "error":
+                error_event = event
+            elif event["type"] == "node_finish":
+                partial_logs.append({k: event[k] for k in ("node_id", "status", "error", "loop_id", "iteration") if k in event})
+            
+            # Yield SSE formatted data
+            yield f"data: {event_json}\n\n"
+        
+        # Update DB after completion
+        if final_result:
+            logs = final_result.get("logs", [])
+            failed_nodes = final_result.get("failed_nodes", [])
+            # Logs restored from a checkpoint may hold errors that a resume has since fixed
+            errors = [log for log in logs if log.get("status") == "error" and log.get("node_id") in failed_nodes]
+            if errors:
+                error_message = f"Node {errors[-1]['node_id']}: {errors[-1].get('error')}"
+            elif failed_nodes:
+                error_message = f"Nodes failed: {', '.join(failed_nodes)}"
+            else:
+                error_message = None
+            # Failed nodes leave the run resumable from its checkpoint
+            _finish_run(
+                flow_run_id,
+                RunStatus.FAILED if failed_nodes else RunStatus.SUCCESS,
+                logs=logs,
+                output=final_result.get("output", ""),
+                error=error_message,
+                trace=trace
+            )
+        elif error_event:
+            _finish_run(flow_run_id, RunStatus.FAILED, logs=error_event.get("logs") or partial_logs, error=error_event.get("message"), trace=trace)
+    except (asyncio.CancelledError, GeneratorExit):
+        # Client went away (or a detached run was cancelled): the executor has already cancelled in-flight nodes
+        logger.warning(f"🛑 Flow run {flow_run_id} cancelled: {cancel_reason}")
+        _finish_run(flow_run_id, RunStatus.CANCELLED, logs=partial_logs, error=f"Cancelled: {cancel_reason}", trace=trace)
+        raise
+    except Exception as ex:
+        logger.error(f"Stream error: {ex}")
+        # Update DB with failure
+        _finish_run(flow_run_id, RunStatus.FAILED, error=str(ex), trace=trace)
+        yield f"data: {json.dumps({'type': 'error', 'message': str(ex)})}\n\n"
+    finally:
+        if ticket is not None:
+            run_scheduler.release(ticket)
+
+
+def _detach(flow_run_id: int, event_generator) -> dict:
+    """Run a ``_stream_run`` generator in the background, journaling its events for /events viewers."""
+    run_journals.start(flow_run_id, event_generator)
+    return {"run_id": flow_run_id, "events": f"/api/flow/run/{flow_run_id}/events"}
+
+
 @router.post("/flow/run")
-async def run_flow(request: FlowRunRequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
-    """Execute a flow with streaming progress."""
+async def run_flow(request: FlowRunRequest, background_tasks: BackgroundTasks, protocol: int = 1, verbosity: str = "normal", detach: bool = False):
+    """
+    Execute a flow with streaming progress (``protocol=2`` selects the compact event protocol).
+    
+    When every run slot is taken the stream starts with the caller's queue
+    position; a full queue answers 429. With ``detach=true`` the run ID is
+    returned at once and the run continues in the background; its events are
+    read (and re-read) from ``GET /api/flow/run/{id}/events``.
+    """
+    encoder = _encoder(protocol, verbosity)
+    ticket = _admit(None if detach else background_tasks, "editor", flow_id=request.flow_id)
     try:
         # Create flow run record
-        flow_run = FlowRun(
+        flow_run_id = await run_writer.create(
+            flow_id=request.flow_id,
             input_message=request.input,
-            status=RunStatus.RUNNING
+            status=RunStatus.RUNNING if ticket.granted else RunStatus.PENDING
         )
-        db.add(flow_run)
-        db.commit()
         
-        logger.info(f"Starting streaming flow execution: {flow_run.id}")
-
-        async def event_generator():
-            final_result = None
-            try:
-                async for event_json in flow_executor.execute(
-                    request.flow_data, 
-                    request.input, 
-                    background_tasks=background_tasks,
-                    flow_run_id=flow_run.id
-                ):
-                    import json
-                    event = json.loads(event_json)
-                    if event["type"] == "final":
-                        final_result = event
-                    
-                    # Yield SSE formatted data
-                    yield f"data: {event_json}\n\n"
-                
-                # Update DB after completion
-                if final_result:
-                    # Get fresh DB session since the original one might be closed or not thread-safe for async generator closure
-                    from app.models import SessionLocal
-                    with SessionLocal() as db_session:
-                        db_run = db_session.query(FlowRun).filter(FlowRun.id == flow_run.id).first()
-                        if db_run:
-                            db_run.output_result = final_result.get("output", "")
-                            db_run.execution_logs = final_result.get("logs", [])
-                            db_run.status = RunStatus.SUCCESS
-                            db_run.completed_at = datetime.now()
-                            db_session.commit()
-            except Exception as ex:
-                logger.error(f"Stream error: {ex}")
-                # Update DB with failure
-                from app.models import SessionLocal
-                with SessionLocal() as db_session:
-                    db_run = db_session.query(FlowRun).filter(FlowRun.id == flow_run.id).first()
-                    if db_run:
-                        db_run.status = RunStatus.FAILED
-                        db_run.error_message = str(ex)
-                        db_run.completed_at = datetime.now()
-                        db_session.commit()
-                yield f"data: {json.dumps({'type': 'error', 'message': str(ex)})}\n\n"
-
-        return StreamingResponse(event_generator(), media_type="text/event-stream")
+        logger.info(f"Starting {'detached' if detach else 'streaming'} flow execution: {flow_run_id}")
+
+        event_generator = _stream_run(
+            flow_run_id,
+            request.flow_data,
+            request.input,
+            # Background tasks run when the response is sent, long before a detached run ends
+            background_tasks=None if detach else background_tasks,
+            flow_id=request.flow_id,
+            encoder=encoder,
+            ticket=ticket,
+            cancel_reason="cancel requested" if detach else "client disconnected"
+        )
+        if detach:
+            return {**_detach(flow_run_id, event_generator), "status": "running" if ticket.granted else "pending"}
+        return StreamingResponse(event_generator, media_type="text/event-stream")
         
     except Exception as e:
+        run_scheduler.release(ticket)
         logger.error(f"Flow execution error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 
-@router.get("/flows", response_model=List[FlowResponse])
-async def list_flows(db: Session = Depends(get_db)):
-    """Get all saved flows."""
+@router.post("/flow/run/{run_id}/resume")
+async def resume_flow_run(run_id: int, background_tasks: BackgroundTasks, protocol: int = 1, verbosity: str = "normal", detach: bool = False, db: Session = Depends(get_db)):
+    """Resume a failed or interrupted run from its last checkpoint (``detach=true`` as for /flow/run)."""
+    encoder = _encoder(protocol, verbosity)
+    ticket = None
+    try:
+        flow_run = db.query(FlowRun).filter(FlowRun.id == run_id).first()
+        if not flow_run:
+            raise HTTPException(status_code=404, detail="Flow run not found")
+        if flow_run.status == RunStatus.SUCCESS:
+            raise HTTPException(status_code=409, detail="Flow run already completed successfully")
+        if run_journals.is_running(run_id):
+            raise HTTPException(status_code=409, detail="Flow run is still executing in the background")
+        
+        checkpoint = await asyncio.to_thread(checkpoint_service.load, run_id)
+        if not checkpoint:
+            raise HTTPException(status_code=404, detail="No checkpoint found for this run")
+        
+        ticket = _admit(None if detach else background_tasks, "editor", flow_id=flow_run.flow_id)
+        run_writer.update(
+            run_id,
+            status=RunStatus.RUNNING if ticket.granted else RunStatus.PENDING,
+            error_message=None,
+            completed_at=None
+        )
+        
+        logger.info(f"Resuming flow run {run_id}: {len(checkpoint['completed_nodes'])} nodes complete, retrying {checkpoint['failed_nodes']}")
+        event_generator = _stream_run(
+            run_id,
+            checkpoint["flow_data"],
+            checkpoint["input"],
+            background_tasks=None if detach else background_tasks,
+            flow_id=flow_run.flow_id,
+            resume=checkpoint,
+            encoder=encoder,
+            ticket=ticket,
+            cancel_reason="cancel requested" if detach else "client disconnected"
+        )
+        if detach:
+            return {**_detach(run_id, event_generator), "status": "running" if ticket.granted else "pending"}
+        return StreamingResponse(event_generator, media_type="text/event-stream")
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        if ticket is not None:
+            run_scheduler.release(ticket)
+        logger.error(f"Flow resume error: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/flow/run/{run_id}/events")
+async def get_flow_run_events(
+    run_id: int,
+    last_event_id: Optional[int] = Query(None, ge=0),
+    last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID")
+):
+    """
+    Events of a detached run as SSE: everything after ``Last-Event-ID`` (header
+    or ``last_event_id`` query parameter; from the start when absent), then new
+    events as they happen until the run ends. Any number of viewers may attach.
+    """
+    journal = run_journals.get(run_id)
+    if journal is None:
+        raise HTTPException(status_code=404, detail="No event journal for this run (not detached, or finished too long ago)")
+    after = last_event_id
+    if after is None and last_event_id_header:
+        try:
+            after = max(0, int(last_event_id_header))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Last-Event-ID must be an event number")
+    return StreamingResponse(journal.follow(after or 0), media_type="text/event-stream")
+
+
+@router.post("/flow/run/{run_id}/cancel")
+async def cancel_flow_run(run_id: int):
+    """Cancel a detached run; viewers see a final ``error`` event with reason ``cancelled``."""
+    if not run_journals.cancel(run_id):
+        raise HTTPException(status_code=404, detail="No detached run executing with this ID")
+    return {"run_id": run_id, "status": "cancelling"}
+
+
+@router.get("/flow/run/{run_id}/trace")
+async def get_flow_run_trace(run_id: int, db: Session = Depends(get_db)):
+    """Timing profile of a run in Chrome Trace Event format (open in ui.perfetto.dev or chrome://tracing)."""
+    flow_run = db.query(FlowRun).filter(FlowRun.id == run_id).first()
+    if not flow_run:
+        raise HTTPException(status_code=404, detail="Flow run not found")
+    if not flow_run.profile:
+        raise HTTPException(status_code=404, detail="No profile recorded for this run")
+    return chrome_trace(flow_run.profile)
+
+
+@router.get("/runs/queue")
+async def get_run_queue():
+    """Runs holding a slot and runs waiting for one, with the configured caps."""
+    return run_scheduler.snapshot()
+
+
+@router.get("/runs/{run_id}/artifacts/{artifact_id}")
+async def get_run_artifact(run_id: str, artifact_id: str):
+    """Large run output referenced from the v2 event stream."""
+    from app.services.artifact_store import artifact_store
+    
+    artifact = artifact_store.get(run_id, artifact_id)
+    if artifact is None:
+        raise HTTPException(status_code=404, detail="Artifact not found or expired")
+    content, media_type = artifact
+    # Content-addressed, so clients may cache it for as long as it lives
+    return Response(content=content, media_type=media_type, headers={"Cache-Control": f"private, max-age={settings.artifact_ttl}"})
+
+
+@router.get("/flows", response_model=FlowPage, response_model_exclude_unset=True)
+async def list_flows(
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[int] = None,
+    q: Optional[str] = None,
+    include: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    List saved flows, newest first, one page at a time.
+    
+    Pass the returned ``next_cursor`` as ``cursor`` for the next page. ``q``
+    filters by name (case-insensitive substring). Flow graphs are left out
+    unless requested with ``include=flow_data``.
+    """
+    fields = {field.strip() for field in include.split(",") if field.strip()} if include else set()
+    unknown = fields - {"flow_data"}
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unsupported include field(s): {', '.join(sorted(unknown))}")
     try:
-        flows = db.query(Flow).order_by(Flow.created_at.desc()).all()
-        print(f"📁 [API] Listing Flows: Found {len(flows)} flows in database.")
-        for f in flows:
-            print(f"  - Flow: {f.name} (ID: {f.id})")
-        return flows
+        # Only the listed columns are read, so large flow_data values stay in the database
+        columns = [Flow.id, Flow.name, Flow.description, Flow.share_token, Flow.created_at, Flow.updated_at]
+        if "flow_data" in fields:
+            columns.append(Flow.flow_data)
+        query = db.query(*columns)
+        if cursor is not None:
+            query = query.filter(Flow.id < cursor)
+        if q:
+            pattern = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            query = query.filter(Flow.name.ilike(f"%{pattern}%", escape="\\"))
+        # Keyset pagination on the primary key: every page costs the same however deep it is
+        rows = query.order_by(Flow.id.desc()).limit(limit + 1).all()
+        page = rows[:limit]
+        logger.debug("📁 Listing flows: %d on this page (cursor=%s, q=%r)", len(page), cursor, q)
+        return {
+            "items": [row._asdict() for row in page],
+            "next_cursor": page[-1].id if len(rows) > limit else None
+        }
     except Exception as e:
-        print(f"❌ [API] Error listing flows: {str(e)}")
         logger.error(f"Error listing flows: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -262,32 +561,143 @@ async def get_flow(flow_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/flow/{flow_id}/runs", response_model=List[FlowRunHistoryResponse])
-async def get_flow_runs(flow_id: int, db: Session = Depends(get_db)):
-    """Get execution history for a specific flow."""
+@router.get("/flow/{flow_id}/runs", response_model=FlowRunPage, response_model_exclude_unset=True)
+async def get_flow_runs(
+    flow_id: int,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[int] = None,
+    include: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Execution history of a flow, newest first, one page at a time.
+    
+    Pass the returned ``next_cursor`` as ``cursor`` for the next page.
+    Outputs and logs are left out unless requested with ``include=output,logs``.
+    """
+    fields = {field.strip() for field in include.split(",") if field.strip()} if include else set()
+    unknown = fields - {"output", "logs"}
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unsupported include field(s): {', '.join(sorted(unknown))}")
     try:
-        runs = db.query(FlowRun).filter(
-            FlowRun.flow_id == flow_id
-        ).order_by(FlowRun.created_at.desc()).all()
-        return runs
+        columns = [FlowRun.id, FlowRun.status, FlowRun.input_message, FlowRun.error_message, FlowRun.created_at, FlowRun.completed_at]
+        if "output" in fields:
+            columns.append(FlowRun.output_result)
+        if "logs" in fields:
+            columns.append(FlowRun.execution_logs)
+        query = db.query(*columns).filter(FlowRun.flow_id == flow_id)
+        if cursor is not None:
+            # Keyset on (created_at, id), read from the cursor row so timestamps compare in the database's own format
+            anchor = db.query(FlowRun.created_at).filter(FlowRun.id == cursor).scalar_subquery()
+            query = query.filter(or_(FlowRun.created_at < anchor, and_(FlowRun.created_at == anchor, FlowRun.id < cursor)))
+        # Served by ix_flow_runs_flow_id_created_at, however many runs the flow has
+        rows = query.order_by(FlowRun.created_at.desc(), FlowRun.id.desc()).limit(limit + 1).all()
+        page = rows[:limit]
+        items = []
+        for row in page:
+            item = row._asdict()
+            item["status"] = row.status.value if row.status else None
+            if row.created_at and row.completed_at:
+                item["duration_ms"] = round((run_rollups.as_utc(row.completed_at) - run_rollups.as_utc(row.created_at)).total_seconds() * 1000, 1)
+            items.append(item)
+        return {"items": items, "next_cursor": page[-1].id if len(rows) > limit else None}
     except Exception as e:
         logger.error(f"Error getting flow runs: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/flow/{flow_id}/runs/stats")
+async def get_flow_run_stats(flow_id: int, days: int = Query(30, ge=1, le=366), db: Session = Depends(get_db)):
+    """
+    Runs per day, success rate and p50/p95 duration of a flow's finished runs
+    over the last ``days`` UTC days, read from the incrementally maintained rollups.
+    """
+    try:
+        return run_rollups.flow_stats(db, flow_id, days)
+    except Exception as e:
+        logger.error(f"Error getting flow run stats: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.put("/flow/{flow_id}/run-cache")
+async def set_run_cache_policy(flow_id: int, policy: RunCachePolicy, db: Session = Depends(get_db)):
+    """
+    Turn the whole-run cache on or off for a flow's shared link: successful
+    runs are stored and replayed to later requests with the same (normalized)
+    input until the flow changes or ``ttl`` seconds pass.
+    """
+    if policy.ttl is not None and policy.ttl <= 0:
+        raise HTTPException(status_code=400, detail="ttl must be a positive number of seconds")
+    try:
+        db_flow = db.query(Flow).filter(Flow.id == flow_id).first()
+        if not db_flow:
+            raise HTTPException(status_code=404, detail="Flow not found")
+        
+        db_flow.run_cache_ttl = (policy.ttl or settings.run_cache_ttl) if policy.enabled else None
+        db.commit()
+        if not policy.enabled:
+            await run_cache.purge(flow_id)
+        return {"flow_id": flow_id, "enabled": policy.enabled, "ttl": db_flow.run_cache_ttl}
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error setting run cache policy: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.delete("/flow/{flow_id}/run-cache")
+async def purge_flow_run_cache(flow_id: int):
+    """Drop a flow's cached runs."""
+    return {"flow_id": flow_id, "purged": await run_cache.purge(flow_id)}
+
+
+@router.delete("/run-cache")
+async def purge_run_cache():
+    """Drop every cached run."""
+    return {"purged": await run_cache.purge()}
+
+
+@router.get("/executor/metrics")
+async def executor_metrics():
+    """Runner pool saturation, flow worker processes, detached runs, run writes and plan, node result, run and credential cache statistics."""
+    from app.services.runner_pools import runner_pools
+    from app.services.node_cache import node_cache
+    from app.services.credential_cache import credential_cache
+    
+    return {
+        **runner_pools.metrics(),
+        "plan_cache": flow_executor.plans.stats(),
+        "node_cache": node_cache.stats(),
+        "run_cache": run_cache.stats(),
+        "credential_cache": credential_cache.stats(),
+        "execution_pool": execution_pool.stats(),
+        "detached_runs": run_journals.stats(),
+        "run_writer": run_writer.stats(),
+        "checkpoints": checkpoint_service.stats()
+    }
 
 
 @router.get("/health")
 @router.get("/health")
 async def health_check():
     """Health check endpoint."""
-    from app.services.elasticsearch_service import elasticsearch_service
     
-    es_health = elasticsearch_service.health_check()
+    def check_elasticsearch():
+        from app.services.elasticsearch_service import elasticsearch_service
+        return elasticsearch_service.health_check()
+    
+    # Never let a slow or unreachable Elasticsearch hold up the health probe
+    try:
+        es_health = await asyncio.wait_for(asyncio.to_thread(check_elasticsearch), timeout=settings.health_check_timeout)
+        es_status = "connected" if es_health else "disconnected"
+    except asyncio.TimeoutError:
+        es_status = "timeout"
     
     return {
         "status": "healthy",
-        "elasticsearch": "connected" if es_health else "disconnected"
+        "elasticsearch": es_status,
+        "runners_loaded": len(flow_executor.runners.loaded())
     }
 
 
@@ -332,24 +742,49 @@ async def get_public_flow(share_token: str, db: Session = Depends(get_db)):
 
 
 @router.post("/public/execute/{share_token}")
-async def execute_public_flow(share_token: str, request: dict, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
+async def execute_public_flow(share_token: str, request: dict, background_tasks: BackgroundTasks, protocol: int = 1, verbosity: str = "normal", db: Session = Depends(get_db)):
     """Execute a shared flow with streaming progress."""
+    encoder = _encoder(protocol, verbosity)
     try:
         flow = db.query(Flow).filter(Flow.share_token == share_token).first()
         if not flow:
             raise HTTPException(status_code=404, detail="Shared flow not found")
             
         user_input = request.get("input", "")
+        cache_key = run_cache.make_key(flow.id, flow.flow_data, user_input) if flow.run_cache_ttl else None
+        cached = await run_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            # Replays need no run slot
+            async def replay_generator():
+                for event_json in run_cache.replay(cached, encoder):
+                    yield f"data: {event_json}\n\n"
+            return StreamingResponse(replay_generator(), media_type="text/event-stream")
+        
+        ticket = _admit(background_tasks, "public", flow_id=flow.id, share_token=share_token)
+        recording = run_cache.record(cache_key, flow.run_cache_ttl) if cache_key else None
         
         async def event_generator():
-            async for event_json in flow_executor.execute(
-                flow.flow_data, 
-                user_input, 
-                background_tasks=background_tasks
-            ):
-                yield f"data: {event_json}\n\n"
+            try:
+                async for line in _wait_for_slot(ticket, encoder):
+                    yield line
+                async for event_json in execution_pool.execute(
+                    flow.flow_data, 
+                    user_input, 
+                    background_tasks=background_tasks,
+                    flow_id=flow.id,
+                    encoder=encoder
+                ):
+                    if recording is not None:
+                        recording.add(encoder.last_event)
+                    yield f"data: {event_json}\n\n"
+                if recording is not None:
+                    await recording.save()
+            finally:
+                run_scheduler.release(ticket)
 
         return StreamingResponse(event_generator(), media_type="text/event-stream")
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Public execution error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -367,17 +802,21 @@ async def export_python(request: dict):
         raise HTTPException(status_code=500, detail=str(e))
 @router.post("/flow/ghost-record/start")
 async def start_ghost_record():
+    # Imported on demand: the recorder pulls in Playwright
+    from app.services.ghost_recorder_service import ghost_recorder_service
     asyncio.create_task(ghost_recorder_service.start_recording())
     return {"status": "started"}
 
 @router.post("/flow/ghost-record/stop")
 async def stop_ghost_record():
+    from app.services.ghost_recorder_service import ghost_recorder_service
     await ghost_recorder_service.stop_recording()
     return {"status": "stopped"}
 
 @router.get("/flow/ghost-record/events")
 async def ghost_record_events():
     from fastapi.responses import StreamingResponse
+    from app.services.ghost_recorder_service import ghost_recorder_service
     
     async def event_generator():
         async for event in ghost_recorder_service.get_events():
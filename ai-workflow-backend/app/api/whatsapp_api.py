@@ -1,12 +1,16 @@
 import logging
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from app.models import Flow, get_db, SessionLocal
 from app.services.whatsapp_service import whatsapp_service
-from app.services.flow_executor import flow_executor
+from app.services.execution_pool import execution_pool
+from app.services.run_scheduler import run_scheduler, RunTicket, QueueFull
+from app.services.whatsapp_triggers import whatsapp_triggers, sender_number
+from app.services.whatsapp_dispatcher import whatsapp_dispatcher
+from app.services.customer_service import customer_service
 
 logger = logging.getLogger(__name__)
 
@@ -17,11 +21,18 @@ class WhatsAppWebhookRequest(BaseModel):
     name: str = ""
     content: str
     timestamp: int
+    message_id: Optional[str] = Field(default=None, alias="id")  # Bridge message ID, for dropping redeliveries
 
 @router.get("/status")
 async def get_whatsapp_status():
-    """Get connection status and QR code."""
-    return whatsapp_service.get_status()
+    """Get connection status and QR code (plus the trigger index of flows with a WhatsApp Input node)."""
+    return {
+        **(await whatsapp_service.get_status()),
+        "triggers": whatsapp_triggers.stats(),
+        "dispatcher": whatsapp_dispatcher.stats(),
+        "outbound": whatsapp_service.stats(),
+        "customers": customer_service.stats()
+    }
 
 @router.post("/reset")
 async def reset_whatsapp_connection():
@@ -30,76 +41,62 @@ async def reset_whatsapp_connection():
     return {"status": "success" if success else "error"}
 
 @router.post("/webhook")
-async def whatsapp_webhook(request: WhatsAppWebhookRequest, background_tasks: BackgroundTasks):
+async def whatsapp_webhook(request: WhatsAppWebhookRequest):
     """Handle incoming messages from the bridge."""
-    # print(f"\n📢 [WEBHOOK] Message received from WhatsApp Bridge!")
-    # print(f"📢 [WEBHOOK] From: {request.sender}, Name: {request.name}")
-    # print(f"📢 [WEBHOOK] Content: {request.content}")
-    logger.info(f"📩 Received WhatsApp message from {request.sender}: {request.content}")
+    # Message bodies are user data and never logged
+    logger.debug("📩 Received WhatsApp message %s from %s (%d chars)", request.message_id, request.sender, len(request.content or ""))
     
-    # Run in background to respond quickly to the bridge
-    background_tasks.add_task(process_whatsapp_message, request.sender, request.content)
+    # Queued per sender so replies keep their order; answer the bridge at once
+    try:
+        accepted = whatsapp_dispatcher.submit(request.sender, request.content, message_id=request.message_id)
+    except QueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "5"})
     
-    return {"status": "received"}
+    return {"status": "received" if accepted else "duplicate"}
+
+async def handle_whatsapp_message(sender_jid: str, content: str):
+    """Dispatcher handler: run a message's flow once the run scheduler grants it a slot."""
+    # The dispatcher already bounds waiting messages, so a full run queue delays them instead of dropping them
+    ticket = await run_scheduler.admit_when_room("whatsapp")
+    await process_whatsapp_message(sender_jid, content, ticket)
 
-async def process_whatsapp_message(sender_jid: str, content: str):
-    """Find and execute flows that have a WhatsApp Input node."""
+async def process_whatsapp_message(sender_jid: str, content: str, ticket: RunTicket = None):
+    """
+    Execute the flow whose WhatsApp Input node accepts the sender (once
+    ``ticket`` holds a run slot). When several do, the most recently changed
+    flow wins, so only one flow replies.
+    """
     db = SessionLocal()
     try:
-        # Fetch flows ordered by updated_at (latest first)
-        flows = db.query(Flow).order_by(Flow.updated_at.desc(), Flow.id.desc()).all()
-        logger.info(f"🔍 Searching through {len(flows)} flows for WhatsApp triggers...")
+        if ticket is not None:
+            await run_scheduler.wait(ticket)
+        # Routed from the in-memory trigger index; only the matching flow is read
+        trigger = await whatsapp_triggers.match(sender_jid)
+        if trigger is None:
+            logger.warning("⚠️ No WhatsApp-triggered flow accepts messages from %s.", sender_number(sender_jid))
+            return
         
-        found_any = False
-        for flow in flows:
-            flow_data = flow.flow_data
-            nodes = flow_data.get("nodes", [])
-            
-            # Check if flow has a WhatsApp input node
-            wa_input_node = next((node for node in nodes if node.get("type") == "whatsAppInput"), None)
-            
-            if wa_input_node:
-                # 🛡️ Sender Filtering Logic
-                node_data = wa_input_node.get("data", {})
-                mode = node_data.get("mode", "everyone")
-                allowed_str = node_data.get("allowedNumbers", "")
-                
-                # Extract clean numbers (only digits) from JID
-                sender_number = "".join(filter(str.isdigit, sender_jid.split("@")[0]))
-                
-                logger.info(f"🛡️ [FILTER] Mode: {mode}, Sender JID: {sender_jid}, Sender Number Only: {sender_number}")
-                
-                should_trigger = True
-                if mode == "specific":
-                    # Clean the allowed numbers (remove +, spaces, etc. keep only digits)
-                    raw_list = [n.strip() for n in allowed_str.replace(",", " ").split() if n.strip()]
-                    allowed_list = ["".join(filter(str.isdigit, n)) for n in raw_list]
-                    
-                    # Check if sender number is in allowed list
-                    if sender_number not in allowed_list:
-                        logger.warning(f"🚫 [FILTER] Blocked! Sender {sender_number} not in allowed list.")
-                        should_trigger = False
-                    else:
-                        logger.info(f"✅ [FILTER] Allowed! Sender {sender_number} matched.")
-
-                if should_trigger:
-                    found_any = True
-                    logger.info(f"🚀 Triggering flow '{flow.name}' (ID: {flow.id}) via WhatsApp")
-                    
-                    # Execute the flow with initial state containing the sender's JID
-                    async for _ in flow_executor.execute(flow_data, content, initial_state={
-                        "whatsapp_jid": sender_jid,
-                        "from": sender_jid  # For phone number extraction
-                    }):
-                        pass
-                    
-                    # 🛑 Stop after first match to prevent double replies if multiple flows have WhatsApp triggers
-                    break
+        flow = db.query(Flow).filter(Flow.id == trigger.flow_id).first()
+        if flow is None:
+            # Deleted by another process since the index was built
+            whatsapp_triggers.remove(trigger.flow_id)
+            logger.warning("⚠️ WhatsApp-triggered flow %s no longer exists.", trigger.flow_id)
+            return
         
-        if not found_any:
-            logger.warning("⚠️ No flows found with a WhatsApp Trigger node.")
+        logger.debug("🚀 Triggering flow '%s' (ID: %s) via WhatsApp", flow.name, flow.id)
+        # Execute the flow with initial state containing the sender's JID
+        async for _ in execution_pool.execute(flow.flow_data, content, initial_state={
+            "whatsapp_jid": sender_jid,
+            "from": sender_jid  # For phone number extraction
+        }, flow_id=flow.id):
+            pass
                 
     except Exception as e:
-        logger.error(f"❌ Error processing WhatsApp message flow: {str(e)}", exc_info=True)
+        logger.error("❌ Error processing WhatsApp message flow: %s", e, exc_info=True)
     finally:
+        if ticket is not None:
+            run_scheduler.release(ticket)
         db.close()
+
+
+whatsapp_dispatcher.handler = handle_whatsapp_message
@@ -21,6 +21,10 @@ class Settings(BaseSettings):
     
     # Database Configuration
     database_url: str
+    db_pool_size: int = 10  # Connections kept open per process (ignored for SQLite)
+    db_max_overflow: int = 20  # Extra connections allowed under load (ignored for SQLite)
+    db_pool_timeout: float = 30  # Seconds to wait for a free connection before failing
+    db_pool_recycle: int = 1800  # Seconds after which a connection is replaced (-1 = never)
     
     # Elasticsearch Configuration
     elasticsearch_host: str = "localhost"
@@ -55,6 +59,60 @@ class Settings(BaseSettings):
     cloudinary_api_key: str = ""
     cloudinary_api_secret: str = ""
     
+    # Flow Execution Configuration
+    flow_max_concurrency: int = 8  # Max nodes running at once within a single run (1 = sequential)
+    flow_plan_cache_size: int = 256  # Compiled flow plans kept in the LRU
+    runner_thread_pool_size: int = 32  # Threads for blocking (I/O-bound) sync runners
+    runner_process_pool_size: int = 2  # Processes for CPU-bound sync runners (0 = use threads)
+    runner_prewarm: str = ""  # Comma-separated node types to import in the background at startup
+    health_check_timeout: float = 0.5  # Seconds /api/health waits on Elasticsearch
+    node_timeout: float = 300  # Default seconds a node may run before it fails (data.timeout overrides, 0 = no limit)
+    run_timeout: float = 1800  # Seconds a whole run may take before it is stopped (0 = no limit)
+    max_concurrent_runs: int = 8  # Runs executing at once; further runs wait in the queue (0 = no limit)
+    max_runs_per_flow: int = 4  # Concurrent runs of one saved flow (0 = no limit)
+    max_runs_per_share_token: int = 2  # Concurrent runs through one public share link (0 = no limit)
+    run_queue_size: int = 32  # Runs allowed to wait for a slot; beyond this requests get 429
+    execution_workers: int = 0  # Worker processes that execute runs (0 = run flows in the API process)
+    flow_loop_parallelism: int = 4  # Loop iterations run at once unless the node sets "parallelism"
+    sse_inline_limit: int = 4096  # Event protocol v2: strings longer than this are sent as artifact references
+    artifact_store_max_mb: int = 256  # Memory kept for referenced artifacts (LRU beyond this)
+    artifact_ttl: int = 3600  # Seconds an artifact stays fetchable
+    log_level: str = "INFO"  # Root log level; node-by-node engine and runner details log at DEBUG
+    trace_sample_rate: float = 0.0  # Fraction of runs whose per-node spans are logged (0 = off, 1 = every run)
+    credential_cache_ttl: float = 300  # Seconds a decrypted credential is reused before it is read again
+    credential_cache_max_entries: int = 256  # Decrypted credentials kept in memory (0 = no caching)
+    flow_profiles: bool = False  # Record a timing profile for every saved run (GET /api/flow/run/{id}/trace); off, only runs sampled by trace_sample_rate get one
+    flow_checkpoints: bool = True  # Checkpoint saved runs after every node so they can be resumed
+    checkpoint_write_ms: int = 200  # Checkpoints are collected this long (latest per run) and written in one commit
+    run_write_batch_ms: int = 50  # Run status/log updates are collected this long and written in one commit
+    run_write_batch_size: int = 200  # Pending run writes that are flushed without waiting
+    run_journal_ttl: int = 600  # Seconds the event journal of a finished detached run can still be replayed
+    run_journal_max_events: int = 10000  # Newest events kept per detached run journal
+    whatsapp_trigger_index_ttl: int = 300  # Seconds between full rebuilds of the WhatsApp trigger index (saves in this process apply at once)
+    whatsapp_max_concurrent_senders: int = 8  # Senders whose messages are processed at once (each sender's in order; 0 = no limit)
+    whatsapp_queue_size: int = 1000  # Messages waiting across senders before the webhook answers 429 (0 = no limit)
+    whatsapp_coalesce_ms: int = 0  # Join a sender's messages sent within this window into one flow run (0 = off)
+    whatsapp_dedupe_size: int = 10000  # Recent bridge message IDs remembered to drop redelivered messages
+    customer_cache_ttl: int = 300  # Seconds between full reloads of the in-memory WhatsApp customer states (this process's changes apply at once)
+    customer_flush_ms: int = 1000  # Customer link updates are collected this long and written in one transaction
+    customer_flush_batch_size: int = 200  # Queued customer updates that are written without waiting
+    whatsapp_bridge_autostart: bool = True  # Launch (and relaunch) the Node.js bridge from the API process; off to use a bridge run separately
+    whatsapp_bridge_pool_size: int = 10  # Keep-alive connections to the WhatsApp bridge
+    whatsapp_send_queue_size: int = 500  # Outbound messages waiting for the bridge before senders wait too
+    whatsapp_send_concurrency: int = 4  # Outbound requests to the bridge in flight at once
+    whatsapp_send_retries: int = 3  # Retries (with jittered backoff) when the bridge cannot be reached or answers 5xx/429; timeouts after sending are not retried
+    whatsapp_send_batch_size: int = 20  # Waiting messages sent in one /send-batch request (1 = one request per message)
+    whatsapp_status_cache_ttl: float = 2.0  # Seconds a bridge status result is reused by /api/whatsapp/status
+    node_cache_backend: str = "memory"  # Result cache for nodes with data.cache: "memory" or "sqlite"
+    node_cache_path: str = "storage/node_cache.sqlite3"  # SQLite file used by the "sqlite" backend
+    node_cache_max_entries: int = 2048  # Cached node results kept before LRU eviction
+    node_cache_ttl: int = 3600  # Default seconds a cached node result stays valid (data.cacheTtl overrides)
+    run_cache_backend: str = "memory"  # Replayed event streams of shared flows with a run-cache policy: "memory" or "sqlite"
+    run_cache_path: str = "storage/run_cache.sqlite3"  # SQLite file used by the "sqlite" backend
+    run_cache_max_entries: int = 512  # Cached runs kept before LRU eviction
+    run_cache_ttl: int = 3600  # Default seconds a cached run is replayed when a flow's policy sets no ttl
+    run_cache_max_entry_kb: int = 1024  # Runs whose event stream is larger than this are not cached
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -65,6 +123,11 @@ class Settings(BaseSettings):
         """Parse CORS origins from comma-separated string."""
         return [origin.strip() for origin in self.cors_origins.split(",")]
     
+    @property
+    def runner_prewarm_list(self) -> List[str]:
+        """Parse runner pre-warm node types from comma-separated string."""
+        return [t.strip() for t in self.runner_prewarm.split(",") if t.strip()]
+    
     @property
     def gemini_api_keys(self) -> List[str]:
         """Parse Gemini API keys from comma-separated string."""
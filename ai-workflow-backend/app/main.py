@@ -18,9 +18,12 @@ from app.api.credentials_api import router as credentials_router
 
 # Configure logging
 logging.basicConfig(
-    level=logging.INFO,  # Restore to INFO for debugging
+    level=settings.log_level.upper(),  # DEBUG for node-by-node engine and runner output
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
+# Handlers write from a background thread so logging never blocks a request
+from app.services.tracing import install_queue_logging
+install_queue_logging()
 
 # Silence specific loggers
 for logger_name in [
@@ -81,6 +84,15 @@ async def startup_event():
     """Initialize database on startup."""
     init_db()
     
+    # Bridge and runner warm-up happen in background threads so the app serves immediately
+    from app.services.whatsapp_service import whatsapp_service
+    from app.runners.registry import runner_registry
+    whatsapp_service.start()
+    runner_registry.prewarm_in_background(settings.runner_prewarm_list)
+    
+    from app.services.execution_pool import execution_pool
+    execution_pool.start()
+    
     # 🚀 Professional Clean Startup UI
     print("\n" + "="*50)
     print("🚀  AI WORKFLOW BACKEND IS READY!")
@@ -90,6 +102,27 @@ async def startup_event():
     print("="*50 + "\n")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Cancel detached runs and WhatsApp messages in flight, close bridge connections, write pending run records, checkpoints and customer updates and release runner worker pools and flow worker processes."""
+    from app.services.runner_pools import runner_pools
+    from app.services.execution_pool import execution_pool
+    from app.services.run_writer import run_writer
+    from app.services.run_journal import run_journals
+    from app.services.whatsapp_dispatcher import whatsapp_dispatcher
+    from app.services.whatsapp_service import whatsapp_service
+    from app.services.customer_service import customer_service
+    from app.services.checkpoint_service import checkpoint_service
+    await whatsapp_dispatcher.shutdown()
+    await run_journals.shutdown()
+    await whatsapp_service.close()
+    await run_writer.flush()
+    await checkpoint_service.close()
+    await customer_service.close()
+    runner_pools.shutdown()
+    execution_pool.shutdown()
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
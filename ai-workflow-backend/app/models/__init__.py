@@ -4,5 +4,7 @@ from app.models.flow_run import FlowRun, RunStatus
 from app.models.database import Base, get_db, init_db, SessionLocal
 from app.models.credential import Credential
 from app.models.customer import WhatsAppCustomer
+from app.models.run_checkpoint import RunCheckpoint
+from app.models.flow_run_rollup import FlowRunRollup
 
-__all__ = ["Flow", "FlowRun", "RunStatus", "Base", "get_db", "init_db", "Credential", "SessionLocal", "WhatsAppCustomer"]
+__all__ = ["Flow", "FlowRun", "RunStatus", "Base", "get_db", "init_db", "Credential", "SessionLocal", "WhatsAppCustomer", "RunCheckpoint", "FlowRunRollup"]
@@ -4,11 +4,20 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import settings
 
+# Pool sizing applies to server databases; SQLite keeps SQLAlchemy's default pool
+pool_options = {} if settings.database_url.startswith("sqlite") else {
+    "pool_size": settings.db_pool_size,
+    "max_overflow": settings.db_max_overflow,
+    "pool_timeout": settings.db_pool_timeout,
+    "pool_recycle": settings.db_pool_recycle
+}
+
 # Create database engine
 engine = create_engine(
     settings.database_url,
     pool_pre_ping=True,
-    echo=False  # Explicitly False to stop console noise
+    echo=False,  # Explicitly False to stop console noise
+    **pool_options
 )
 
 # Create session factory
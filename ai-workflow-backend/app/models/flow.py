@@ -14,6 +14,7 @@ class Flow(Base):
     description = Column(String, nullable=True)
     flow_data = Column(JSON, nullable=False)  # Stores nodes and edges
     share_token = Column(String, unique=True, nullable=True) # Unique token for sharing
+    run_cache_ttl = Column(Integer, nullable=True)  # Seconds shared runs are replayed from the run cache; null = off
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
@@ -1,5 +1,5 @@
 """Flow run model for storing execution history."""
-from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -12,12 +12,15 @@ class RunStatus(str, enum.Enum):
     RUNNING = "running"
     SUCCESS = "success"
     FAILED = "failed"
+    CANCELLED = "cancelled"
 
 
 class FlowRun(Base):
     """Model for storing flow execution history."""
     
     __tablename__ = "flow_runs"
+    # Serves a flow's run history, newest first
+    __table_args__ = (Index("ix_flow_runs_flow_id_created_at", "flow_id", "created_at", "id"),)
     
     id = Column(Integer, primary_key=True, index=True)
     flow_id = Column(Integer, ForeignKey("flows.id", ondelete="CASCADE"), nullable=True)
@@ -26,6 +29,7 @@ class FlowRun(Base):
     execution_logs = Column(JSON, nullable=True)  # Stores step-by-step logs
     status = Column(Enum(RunStatus), default=RunStatus.PENDING)
     error_message = Column(Text, nullable=True)
+    profile = Column(JSON, nullable=True)  # Per-node timing spans (served as a Chrome trace)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     completed_at = Column(DateTime(timezone=True), nullable=True)
     
@@ -0,0 +1,22 @@
+"""Per-flow, per-day rollup of finished runs."""
+from sqlalchemy import Column, Integer, Date, JSON, ForeignKey, UniqueConstraint
+from app.models.database import Base
+
+
+class FlowRunRollup(Base):
+    """Run counts and a duration histogram for one flow and day, updated as runs finish."""
+    
+    __tablename__ = "flow_run_rollups"
+    __table_args__ = (UniqueConstraint("flow_id", "day", name="uq_flow_run_rollups_flow_day"),)
+    
+    id = Column(Integer, primary_key=True, index=True)
+    flow_id = Column(Integer, ForeignKey("flows.id", ondelete="CASCADE"), nullable=False)
+    day = Column(Date, nullable=False)  # UTC day the runs started
+    runs = Column(Integer, nullable=False, default=0)
+    successes = Column(Integer, nullable=False, default=0)
+    failures = Column(Integer, nullable=False, default=0)
+    cancellations = Column(Integer, nullable=False, default=0)
+    durations = Column(JSON, nullable=False, default=dict)  # Histogram bucket index -> runs (see app.services.run_rollups)
+    
+    def __repr__(self):
+        return f"<FlowRunRollup(flow_id={self.flow_id}, day={self.day}, runs={self.runs})>"
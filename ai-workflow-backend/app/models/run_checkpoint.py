@@ -0,0 +1,24 @@
+"""Run checkpoint model for resuming failed flow runs."""
+from sqlalchemy import Column, Integer, Text, JSON, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from app.models.database import Base
+
+
+class RunCheckpoint(Base):
+    """Latest resumable snapshot of a flow run, rewritten after every node."""
+    
+    __tablename__ = "run_checkpoints"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    flow_run_id = Column(Integer, ForeignKey("flow_runs.id", ondelete="CASCADE"), unique=True, nullable=False, index=True)
+    flow_data = Column(JSON, nullable=False)  # Graph the run was started with
+    input_message = Column(Text, nullable=False)
+    state = Column(JSON, nullable=False)  # JSON-serializable part of the execution state
+    completed_nodes = Column(JSON, nullable=False)  # Node ids that finished successfully
+    inactive_nodes = Column(JSON, nullable=False)  # Node ids pruned by branching
+    failed_nodes = Column(JSON, nullable=False)  # Node ids that errored (re-run on resume)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<RunCheckpoint(flow_run_id={self.flow_run_id}, completed={len(self.completed_nodes or [])})>"
@@ -1,66 +1,52 @@
-"""All node runners."""
-from app.runners.base_runner import BaseRunner
-from app.runners.chat_input_runner import ChatInputRunner
-from app.runners.prompt_runner import PromptRunner
-from app.runners.openai_runner import OpenAIRunner
-from app.runners.gemini_runner import GeminiRunner
-from app.runners.claude_runner import ClaudeRunner
-from app.runners.llm_runner import LLMRunner
-from app.runners.elasticsearch_runner import ElasticsearchRunner
-from app.runners.output_runner import OutputRunner
-from app.runners.search_runner import SearchRunner
-from app.runners.http_runner import HttpRunner
-from app.runners.condition_runner import ConditionRunner
-from app.runners.pdf_runner import PdfRunner
-from app.runners.email_runner import run as email_runner
-from app.runners.knowledge_runner import KnowledgeRunner
-from app.runners.summarization_runner import SummarizationRunner
-from app.runners.document_generator_runner import DocumentGeneratorRunner
-from app.runners.code_runner import CodeRunner
-from app.runners.ui_components_runner import UIComponentsRunner
-from app.runners.prompt_generator_runner import PromptGeneratorRunner
-from app.runners.master_prompt_runner import MasterPromptRunner
-from app.runners.language_runner import LanguageRunner
-from app.runners.theme_runner import ThemeRunner
-from app.runners.zip_runner import ZipRunner
-from app.runners.browser_runner import BrowserRunner
-from app.runners.loop_runner import LoopRunner
-from app.runners.screenshot_runner import ScreenshotRunner
-from app.runners.ide_runner import IDERunner
-from app.runners.xpath_helper_runner import XPathHelperRunner
-from app.runners.css_selector_runner import CSSSelectorRunner
-from app.runners.json_path_runner import JSONPathRunner
+"""All node runners.
 
-__all__ = [
-    "BaseRunner",
-    "ChatInputRunner",
-    "PromptRunner",
-    "OpenAIRunner",
-    "GeminiRunner",
-    "ClaudeRunner",
-    "LLMRunner",
-    "ElasticsearchRunner",
-    "OutputRunner",
-    "SearchRunner",
-    "HttpRunner",
-    "ConditionRunner",
-    "PdfRunner",
-    "email_runner",
-    "KnowledgeRunner",
-    "SummarizationRunner",
-    "DocumentGeneratorRunner",
-    "CodeRunner",
-    "UIComponentsRunner",
-    "PromptGeneratorRunner",
-    "MasterPromptRunner",
-    "LanguageRunner",
-    "ThemeRunner",
-    "ZipRunner",
-    "BrowserRunner",
-    "LoopRunner",
-    "ScreenshotRunner",
-    "IDERunner",
-    "XPathHelperRunner",
-    "CSSSelectorRunner",
-    "JSONPathRunner"
-]
+Runner modules pull in heavy SDKs (Playwright, pandas, LLM clients), so they
+are imported lazily on first attribute access instead of with the package.
+"""
+import importlib
+
+_LAZY_EXPORTS = {
+    "BaseRunner": ("app.runners.base_runner", "BaseRunner"),
+    "ChatInputRunner": ("app.runners.chat_input_runner", "ChatInputRunner"),
+    "PromptRunner": ("app.runners.prompt_runner", "PromptRunner"),
+    "OpenAIRunner": ("app.runners.openai_runner", "OpenAIRunner"),
+    "GeminiRunner": ("app.runners.gemini_runner", "GeminiRunner"),
+    "ClaudeRunner": ("app.runners.claude_runner", "ClaudeRunner"),
+    "LLMRunner": ("app.runners.llm_runner", "LLMRunner"),
+    "ElasticsearchRunner": ("app.runners.elasticsearch_runner", "ElasticsearchRunner"),
+    "OutputRunner": ("app.runners.output_runner", "OutputRunner"),
+    "SearchRunner": ("app.runners.search_runner", "SearchRunner"),
+    "HttpRunner": ("app.runners.http_runner", "HttpRunner"),
+    "ConditionRunner": ("app.runners.condition_runner", "ConditionRunner"),
+    "PdfRunner": ("app.runners.pdf_runner", "PdfRunner"),
+    "email_runner": ("app.runners.email_runner", "run"),
+    "KnowledgeRunner": ("app.runners.knowledge_runner", "KnowledgeRunner"),
+    "SummarizationRunner": ("app.runners.summarization_runner", "SummarizationRunner"),
+    "DocumentGeneratorRunner": ("app.runners.document_generator_runner", "DocumentGeneratorRunner"),
+    "CodeRunner": ("app.runners.code_runner", "CodeRunner"),
+    "UIComponentsRunner": ("app.runners.ui_components_runner", "UIComponentsRunner"),
+    "PromptGeneratorRunner": ("app.runners.prompt_generator_runner", "PromptGeneratorRunner"),
+    "MasterPromptRunner": ("app.runners.master_prompt_runner", "MasterPromptRunner"),
+    "LanguageRunner": ("app.runners.language_runner", "LanguageRunner"),
+    "ThemeRunner": ("app.runners.theme_runner", "ThemeRunner"),
+    "ZipRunner": ("app.runners.zip_runner", "ZipRunner"),
+    "BrowserRunner": ("app.runners.browser_runner", "BrowserRunner"),
+    "LoopRunner": ("app.runners.loop_runner", "LoopRunner"),
+    "ScreenshotRunner": ("app.runners.screenshot_runner", "ScreenshotRunner"),
+    "IDERunner": ("app.runners.ide_runner", "IDERunner"),
+    "XPathHelperRunner": ("app.runners.xpath_helper_runner", "XPathHelperRunner"),
+    "CSSSelectorRunner": ("app.runners.css_selector_runner", "CSSSelectorRunner"),
+    "JSONPathRunner": ("app.runners.json_path_runner", "JSONPathRunner"),
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    """Import runner classes on first access (PEP 562)."""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = _LAZY_EXPORTS[name]
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
@@ -6,6 +6,18 @@ from typing import Dict, Any
 class BaseRunner(ABC):
     """Abstract base class for node runners."""
     
+    # How FlowExecutor schedules a synchronous ``run`` (async runners are awaited):
+    # "io" -> thread pool, "cpu" -> process pool, "inline" -> directly on the event loop
+    execution_mode = "io"
+    
+    # State keys a deterministic runner reads. Declaring them lets nodes opt into
+    # FlowExecutor's result cache with ``data.cache``; None means never cached.
+    cache_reads = None
+    
+    def cache_keys(self, node_data: Dict[str, Any], state: Dict[str, Any]):
+        """State keys that determine this call's result, or None if it must not be cached."""
+        return self.cache_reads
+    
     @abstractmethod
     def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
         """
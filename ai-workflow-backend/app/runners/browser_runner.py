@@ -13,13 +13,15 @@ logger = logging.getLogger(__name__)
 
 class BrowserSession:
     """Container for an active browser session."""
-    def __init__(self, playwright, browser: Browser, context: BrowserContext, page: Page, loop: asyncio.AbstractEventLoop, thread: Optional[threading.Thread] = None):
+    def __init__(self, playwright, browser: Browser, context: BrowserContext, page: Page, loop: asyncio.AbstractEventLoop, thread: Optional[threading.Thread] = None, owns_loop: bool = False):
         self.playwright = playwright
         self.browser = browser
         self.context = context
         self.page = page
         self.loop = loop
         self.thread = thread
+        # Only a dedicated loop (Windows persistent thread) may be stopped on close
+        self.owns_loop = owns_loop
         self.last_active = time.time()
 
 class BrowserSessionManager:
@@ -38,7 +40,7 @@ class BrowserSessionManager:
                     return session
                 else:
                     # Clean up if loop died
-                    logger.warning(f"Session {run_id} loop is not running. Cleaning up.")
+                    logger.warning("Session %s loop is not running. Cleaning up.", run_id)
                     cls._sessions.pop(run_id)
             return None
 
@@ -56,7 +58,7 @@ class BrowserSessionManager:
                     if session.loop.is_running():
                         asyncio.run_coroutine_threadsafe(cls._cleanup_session(session), session.loop)
                 except Exception as e:
-                    logger.error(f"Error closing session {run_id}: {e}")
+                    logger.error("Error closing session %s: %s", run_id, e)
 
     @staticmethod
     async def _cleanup_session(session: BrowserSession):
@@ -67,10 +69,11 @@ class BrowserSessionManager:
         except:
             pass
         finally:
-            try:
-                session.loop.stop()
-            except:
-                pass
+            if session.owns_loop:
+                try:
+                    session.loop.stop()
+                except:
+                    pass
 
 session_manager = BrowserSessionManager()
 
@@ -86,18 +89,23 @@ class BrowserRunner(BaseRunner):
         session = session_manager.get_session(run_id)
         
         if session:
-            print(f"♻️ [BrowserRunner] Reusing existing session for run_id: {run_id}")
+            logger.debug("♻️ [BrowserRunner] Reusing existing session for run_id: %s", run_id)
             future = asyncio.run_coroutine_threadsafe(
                 self._run_on_page(session.page, node_data, state), 
                 session.loop
             )
-            while not future.done():
-                await asyncio.sleep(0.1)
+            try:
+                while not future.done():
+                    await asyncio.sleep(0.1)
+            except asyncio.CancelledError:
+                # Node cancelled or timed out: stop the action on the session loop too
+                future.cancel()
+                raise
             return future.result()
 
         # No session exists, start a new one
         if sys.platform == 'win32':
-            print("🪟 [BrowserRunner] Starting persistent Proactor loop for Windows.")
+            logger.debug("🪟 [BrowserRunner] Starting persistent Proactor loop for Windows.")
             return await self._run_persistent_windows(node_data, state, run_id)
         else:
             return await self._run_new_session(node_data, state, run_id)
@@ -149,7 +157,7 @@ class BrowserRunner(BaseRunner):
         
         try:
             p = await async_playwright().start()
-            print(f"🌐 [BrowserRunner] Launching {mode.upper()} browser for: {url}")
+            logger.debug("🌐 [BrowserRunner] Launching %s browser for: %s", mode.upper(), url)
             
             browser = await p.chromium.launch(
                 headless=is_headless,
@@ -162,15 +170,15 @@ class BrowserRunner(BaseRunner):
             
             # Store session
             loop = provided_loop or asyncio.get_event_loop()
-            session = BrowserSession(p, browser, context, page, loop)
+            session = BrowserSession(p, browser, context, page, loop, owns_loop=provided_loop is not None)
             session_manager.set_session(run_id, session)
 
-            print(f"   [BrowserRunner] Loading initial page: {url}")
+            logger.debug("   [BrowserRunner] Loading initial page: %s", url)
             await page.goto(url, wait_until="networkidle", timeout=30000)
             
             return await self._run_on_page(page, node_data, state)
         except Exception as e:
-            logger.error(f"Browser Runner Error (New Session): {str(e)}")
+            logger.error("Browser Runner Error (New Session): %s", e)
             return {"output": f"Browser Error: {str(e)}", "status": "error"}
 
     async def _run_on_page(self, page: Page, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
@@ -185,10 +193,10 @@ class BrowserRunner(BaseRunner):
                 target_url = url.rstrip('/')
                 
                 if current_url != target_url and not current_url.startswith(target_url):
-                    print(f"   [BrowserRunner] Navigating to: {url}")
+                    logger.debug("   [BrowserRunner] Navigating to: %s", url)
                     await page.goto(url, wait_until="networkidle", timeout=30000)
                 else:
-                    print(f"   [BrowserRunner] Already at {url}, skipping navigation.")
+                    logger.debug("   [BrowserRunner] Already at %s, skipping navigation.", url)
             
             result = {"status": "success", "url": page.url}
             selector = node_data.get("selector")
@@ -218,7 +226,7 @@ class BrowserRunner(BaseRunner):
                 try:
                     # 1. Highlight element if selector exists (for click/type)
                     if selector:
-                        print(f"   [BrowserRunner] Manual Mode: Highlighting {selector}")
+                        logger.debug("   [BrowserRunner] Manual Mode: Highlighting %s", selector)
                         await page.evaluate("""(sel) => {
                             const el = document.querySelector(sel);
                             if (el) {
@@ -231,7 +239,7 @@ class BrowserRunner(BaseRunner):
                         await asyncio.sleep(0.5) # Let visual settle
                     
                     # 2. Take Snapshot (Captures full page, with highlight if applied)
-                    print(f"   [BrowserRunner] Manual Mode: Capturing Snapshot")
+                    logger.debug("   [BrowserRunner] Manual Mode: Capturing Snapshot")
                     screenshot_name = f"step_{node_data.get('id', 'temp')}_{int(time.time())}.png"
                     os.makedirs("static/screenshots", exist_ok=True)
                     screenshot_path = f"static/screenshots/{screenshot_name}"
@@ -248,7 +256,7 @@ class BrowserRunner(BaseRunner):
                             }
                         }""", selector)
                 except Exception as ex:
-                    logger.warning(f"Manual highlighting/capture failed: {ex}")
+                    logger.warning("Manual highlighting/capture failed: %s", ex)
 
             if action == "click":
                 if not selector: return {"output": "Error: No selector provided", "status": "error"}
@@ -256,14 +264,14 @@ class BrowserRunner(BaseRunner):
                 # Validation Logic
                 is_strict = node_data.get("strict", False)
                 try:
-                    print(f"   [BrowserRunner] Validating element: {selector}")
+                    logger.debug("   [BrowserRunner] Validating element: %s", selector)
                     await page.wait_for_selector(selector, state="visible", timeout=3000 if is_strict else 30000)
                 except Exception:
                     error_msg = f"❌ Error: Element not found or hidden: `{selector}`\nURL: {page.url}"
                     if is_strict:
                         return {"output": error_msg, "status": "error", "html_content": f"### ❌ Execution Failed\n\n{error_msg}"}
                 
-                print(f"   [BrowserRunner] Clicking element: {selector}")
+                logger.debug("   [BrowserRunner] Clicking element: %s", selector)
                 await page.click(selector)
                 result["output"] = f"Clicked element: {selector}"
                 try: await page.wait_for_load_state("networkidle", timeout=5000)
@@ -275,14 +283,14 @@ class BrowserRunner(BaseRunner):
                 # Validation Logic
                 is_strict = node_data.get("strict", False)
                 try:
-                    print(f"   [BrowserRunner] Validating input: {selector}")
+                    logger.debug("   [BrowserRunner] Validating input: %s", selector)
                     await page.wait_for_selector(selector, state="visible", timeout=3000 if is_strict else 30000)
                 except Exception:
                     error_msg = f"❌ Error: Input field not found: `{selector}`\nURL: {page.url}"
                     if is_strict:
                         return {"output": error_msg, "status": "error", "html_content": f"### ❌ Execution Failed\n\n{error_msg}"}
                 
-                print(f"   [BrowserRunner] Typing into: {selector}")
+                logger.debug("   [BrowserRunner] Typing into: %s", selector)
                 await page.fill(selector, str(value or ""))
                 result["output"] = f"Typed into: {selector}"
                 try: await page.wait_for_load_state("networkidle", timeout=2000)
@@ -292,7 +300,7 @@ class BrowserRunner(BaseRunner):
                 duration_val = node_data.get("value") or node_data.get("selector") or "30"
                 try: duration = float(duration_val)
                 except: duration = 30.0
-                print(f"   [BrowserRunner] Waiting for {duration}s as requested...")
+                logger.debug("   [BrowserRunner] Waiting for %ss as requested...", duration)
                 await asyncio.sleep(duration)
                 result["output"] = f"Waited for {duration}s"
             
@@ -332,9 +340,9 @@ class BrowserRunner(BaseRunner):
             return result
 
         except Exception as e:
-            logger.error(f"Browser Action Error: {str(e)}")
+            logger.error("Browser Action Error: %s", e)
             return {"output": f"Action Error: {str(e)}", "status": "error"}
                 
         except Exception as e:
-            logger.error(f"Browser Runner Error: {str(e)}")
+            logger.error("Browser Runner Error: %s", e)
             return {"output": f"Browser Error: {str(e)}", "status": "error"}
@@ -1,11 +1,16 @@
 """Chat Input node runner."""
+import logging
 from typing import Dict, Any
 from app.runners.base_runner import BaseRunner
 
+logger = logging.getLogger(__name__)
+
 
 class ChatInputRunner(BaseRunner):
     """Runner for Chat Input node."""
     
+    execution_mode = "inline"
+    
     def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process chat input node.
@@ -13,7 +18,7 @@ class ChatInputRunner(BaseRunner):
         The input is already in state['input'], just pass it through.
         """
         user_input = state.get("input", "")
-        print(f"💬 Chat Input: {user_input}")
+        logger.debug("💬 Chat Input: %s", user_input)
         
         return {
             "chat_input": user_input,
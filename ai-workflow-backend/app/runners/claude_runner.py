@@ -6,6 +6,8 @@ from app.runners.base_runner import BaseRunner
 class ClaudeRunner(BaseRunner):
     """Runner for Claude configuration node."""
     
+    execution_mode = "inline"
+    
     def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
         """
         Store Claude configuration in state.
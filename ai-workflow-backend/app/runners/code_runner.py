@@ -1,3 +1,4 @@
+import logging
 import os
 import sys
 import subprocess
@@ -9,6 +10,8 @@ from app.services.llm_service import LLMService
 from app.services.fastapi_validator import FastAPIValidator
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 # Persistent Virtual Environment Configuration
 VENV_PYTHON = r"D:\venvs\latest_2_env\Scripts\python.exe"
 
@@ -18,7 +21,7 @@ class CodeRunner(BaseRunner):
     def _generate_fastapi_success(self, files: List[Dict], validation_result: Dict) -> Dict:
         actual_port = validation_result.get("port", 8000)
         success_message = f"API working on port {actual_port}"
-        print(f"[CodeRunner] 🚀 Returning success data to workflow engine...")
+        logger.debug("[CodeRunner] 🚀 Returning success data to workflow engine...")
         return {
             "project_structure": files,
             "output": f"FastAPI Project validated successfully! {success_message}",
@@ -61,7 +64,7 @@ class CodeRunner(BaseRunner):
                 
                 # 1. Generate or Fix Code
                 if attempt == 1:
-                    print(f"\n[CodeRunner] 🚀 Starting Initial Generation (Language: {backend_lang})")
+                    logger.debug("[CodeRunner] 🚀 Starting Initial Generation (Language: %s)", backend_lang)
                     if is_node:
                         system_prompt = (
                             "You are a professional Node.js developer. "
@@ -262,7 +265,7 @@ class CodeRunner(BaseRunner):
                     user_msg = f"Write code for: {prompt}"
                 else:
                     last_error = error_history[-1]
-                    print(f"\n[CodeRunner] 🩹 Attempt {attempt}: Healing error -> {last_error[:100]}...")
+                    logger.debug("[CodeRunner] 🩹 Attempt %s: Healing error -> %s...", attempt, last_error[:100])
                     
                     # For FastAPI projects, include the full project structure in the healing prompt
                     if is_fastapi:
@@ -305,7 +308,7 @@ class CodeRunner(BaseRunner):
                 code = code.strip()
 
                 if not code:
-                    print("[CodeRunner] ❌ AI failed to generate code.")
+                    logger.error("[CodeRunner] ❌ AI failed to generate code.")
                     return {"output": "Error: AI failed to generate code", "status": "error"}
 
                 # 1.5 Smart Handling for JSON Project Structures
@@ -320,11 +323,11 @@ class CodeRunner(BaseRunner):
                     try:
                         files = json.loads(candidate)
                         if isinstance(files, list) and len(files) > 0 and "path" in files[0]:
-                            print(f"[CodeRunner] 📁 Detected Multi-file Project ({len(files)} files).")
+                            logger.debug("[CodeRunner] 📁 Detected Multi-file Project (%s files).", len(files))
                             
                             # FastAPI Validation & Self-Healing
                             if is_fastapi:
-                                print(f"[CodeRunner] 🔍 FastAPI detected - Starting runtime validation...")
+                                logger.debug("[CodeRunner] 🔍 FastAPI detected - Starting runtime validation...")
                                 
                                 # Create temporary project directory
                                 with tempfile.TemporaryDirectory() as temp_dir:
@@ -335,12 +338,12 @@ class CodeRunner(BaseRunner):
                                         with open(file_path, "w", encoding="utf-8") as f:
                                             f.write(file_obj["content"])
                                     
-                                    print(f"[CodeRunner] 📝 Created {len(files)} files in {temp_dir}")
+                                    logger.debug("[CodeRunner] 📝 Created %s files in %s", len(files), temp_dir)
                                     
                                     # Create a dummy .env file to prevent Settings validation errors
                                     env_file = os.path.join(temp_dir, ".env")
                                     if not os.path.exists(env_file):
-                                        print("[CodeRunner] 📝 Generating minimalist .env for validation...")
+                                        logger.debug("[CodeRunner] 📝 Generating minimalist .env for validation...")
                                         with open(env_file, "w", encoding="utf-8") as f:
                                             # Only add critical ones, others will be added by Smart Healing if needed
                                             f.write("SECRET_KEY=dummy_secret_for_validation_12345\n")
@@ -350,7 +353,7 @@ class CodeRunner(BaseRunner):
                                     # Install dependencies if requirements.txt exists
                                     req_file = os.path.join(temp_dir, "requirements.txt")
                                     if os.path.exists(req_file):
-                                        print(f"[CodeRunner] 📦 Installing dependencies from requirements.txt into {python_exe}...")
+                                        logger.debug("[CodeRunner] 📦 Installing dependencies from requirements.txt into %s...", python_exe)
                                         subprocess.run(
                                             [python_exe, "-m", "pip", "install", "-r", req_file],
                                             capture_output=True,
@@ -366,7 +369,7 @@ class CodeRunner(BaseRunner):
                                         actual_port = validation_result.get("port", 8000)
                                         success_message = f"API working on port {actual_port}"
                                         
-                                        print(f"[CodeRunner] ✅ FastAPI validation passed! {success_message}")
+                                        logger.debug("[CodeRunner] ✅ FastAPI validation passed! %s", success_message)
                                         return {
                                             "project_structure": files,
                                             "output": f"FastAPI Project validated successfully! {success_message}",
@@ -379,7 +382,7 @@ class CodeRunner(BaseRunner):
                                         }
                                     else:
                                         # Validation failed - analyze error type
-                                        print(f"[CodeRunner] ❌ Validation failed: {validation_result['errors']}")
+                                        logger.error("[CodeRunner] ❌ Validation failed: %s", validation_result['errors'])
                                         
                                         # Check if it's a package/dependency error
                                         error_text = " ".join(validation_result['errors']).lower()
@@ -398,7 +401,7 @@ class CodeRunner(BaseRunner):
                                         if is_pydantic_error:
                                             # Case 0: Extra inputs forbidden in Settings
                                             if "Extra inputs are not permitted" in error_text:
-                                                print("[CodeRunner] 🔧 Auto-fixing strict Settings (extra='ignore')...")
+                                                logger.debug("[CodeRunner] 🔧 Auto-fixing strict Settings (extra='ignore')...")
                                                 fixed_count = 0
                                                 for file_obj in files:
                                                     if "class Settings" in file_obj["content"]:
@@ -419,7 +422,7 @@ class CodeRunner(BaseRunner):
                                                                 fixed_count += 1
                                                 
                                                 if fixed_count > 0:
-                                                    print(f"[CodeRunner] ✅ Fixed 'extra=ignore' in {fixed_count} files, retrying...")
+                                                    logger.debug("[CodeRunner] ✅ Fixed 'extra=ignore' in %s files, retrying...", fixed_count)
                                                     candidate = json.dumps(files)
                                                     code = candidate
                                                     continue
@@ -430,17 +433,17 @@ class CodeRunner(BaseRunner):
                                                 # Improved regex: Case-insensitive and handles various layouts
                                                 missing_fields = re.findall(r"([a-zA-Z0-9_]+)\n\s*Field required", error_text)
                                                 if missing_fields:
-                                                    print(f"[CodeRunner] 🔧 Auto-fixing missing Settings fields: {missing_fields}")
+                                                    logger.debug("[CodeRunner] 🔧 Auto-fixing missing Settings fields: %s", missing_fields)
                                                     with open(env_file, "a", encoding="utf-8") as f:
                                                         for field in missing_fields:
                                                             f.write(f"{field}=dummy_value_for_{field}\n")
-                                                    print(f"[CodeRunner] ✅ Added {len(missing_fields)} fields to .env, retrying validation...")
+                                                    logger.debug("[CodeRunner] ✅ Added %s fields to .env, retrying validation...", len(missing_fields))
                                                     validation_result = validator.validate(temp_dir, max_wait=60)
                                                     if validation_result["success"]:
                                                         return self._generate_fastapi_success(files, validation_result)
                                             
                                             # Case 2: Pydantic V1 syntax in Pydantic V2 environment - auto-fix code
-                                            print("[CodeRunner] 🔧 Detected Pydantic V1/V2 compatibility issue - auto-fixing syntax...")
+                                            logger.debug("[CodeRunner] 🔧 Detected Pydantic V1/V2 compatibility issue - auto-fixing syntax...")
                                             fixed_count = 0
                                             for file_obj in files:
                                                 content = file_obj["content"]
@@ -458,35 +461,35 @@ class CodeRunner(BaseRunner):
                                                     fixed_count += 1
                                             
                                             if fixed_count > 0:
-                                                print(f"[CodeRunner] ✅ Auto-fixed Pydantic syntax in {fixed_count} files, retrying validation...")
+                                                logger.debug("[CodeRunner] ✅ Auto-fixed Pydantic syntax in %s files, retrying validation...", fixed_count)
                                                 candidate = json.dumps(files)
                                                 code = candidate
                                                 continue
                                         
                                         if is_package_error:
                                             # Extract package name and auto-install
-                                            print("[CodeRunner] 📦 Detected missing package error - auto-installing...")
+                                            logger.debug("[CodeRunner] 📦 Detected missing package error - auto-installing...")
                                             
                                             # Try to extract package name
                                             import re
                                             match = re.search(r"no module named ['\"]([^'\"]+)['\"]", error_text)
                                             if match:
                                                 package_name = match.group(1).split('.')[0]  # Get base package
-                                                print(f"[CodeRunner] 📦 Installing {package_name} into {python_exe}...")
+                                                logger.debug("[CodeRunner] 📦 Installing %s into %s...", package_name, python_exe)
                                                 try:
                                                     subprocess.run(
                                                         [python_exe, "-m", "pip", "install", package_name],
                                                         capture_output=True,
                                                         timeout=60
                                                     )
-                                                    print(f"[CodeRunner] ✅ Installed {package_name}, retrying validation immediately (No AI healing needed)...")
+                                                    logger.debug("[CodeRunner] ✅ Installed %s, retrying validation immediately (No AI healing needed)...", package_name)
                                                     # Re-run validation without AI call
                                                     validation_result = validator.validate(temp_dir, max_wait=60)
                                                     if validation_result["success"]:
                                                         # USE THE HELPER TO ENSURE CONSISTENCY AND LOGGING
                                                         return self._generate_fastapi_success(files, validation_result)
                                                 except Exception as e:
-                                                    print(f"[CodeRunner] ⚠️ Could not auto-install {package_name}: {e}")
+                                                    logger.warning("[CodeRunner] ⚠️ Could not auto-install %s: %s", package_name, e)
                                         
                                         # It's a coding error or persistent dependency error - send to AI for fixing
                                         error_msg = "FastAPI Runtime Validation Errors:\n"
@@ -496,7 +499,7 @@ class CodeRunner(BaseRunner):
                                             error_msg += "\n".join(f"- {warn}" for warn in validation_result["warnings"])
                                         
                                         error_history.append(error_msg)
-                                        print(f"[CodeRunner] 🔄 Triggering AI self-healing (attempt {attempt}/{max_retries})...")
+                                        logger.debug("[CodeRunner] 🔄 Triggering AI self-healing (attempt %s/%s)...", attempt, max_retries)
                                         continue  # Go back to healing loop
                             
                             # Non-FastAPI multi-file projects (no validation needed)
@@ -507,12 +510,12 @@ class CodeRunner(BaseRunner):
                                 "generated_code": candidate
                             }
                     except Exception as e:
-                        print(f"[CodeRunner] ⚠️ Found potential JSON but parsing failed: {str(e)}")
+                        logger.warning("[CodeRunner] ⚠️ Found potential JSON but parsing failed: %s", e)
                 
                 # If FastAPI is requested, we MUST have a JSON structure. 
                 # If we reached here, it means we don't have valid JSON.
                 if is_fastapi:
-                    print("[CodeRunner] ⚠️ FastAPI requested but AI didn't provide valid JSON structure. Injecting retry intent...")
+                    logger.warning("[CodeRunner] ⚠️ FastAPI requested but AI didn't provide valid JSON structure. Injecting retry intent...")
                     error_history.append("AI Error: You MUST output a JSON array of files for FastAPI projects. Do not provide a single script. Ensure the JSON is valid and not truncated.")
                     continue
 
@@ -520,7 +523,7 @@ class CodeRunner(BaseRunner):
                 if not is_fastapi and not is_node:
                     test_code = code.lower()
                     if "fastapi(" in test_code or "@app." in test_code or "import fastapi" in test_code:
-                        print("[CodeRunner] 🛑 Hallucination Detected: Standard mode generated FastAPI code. Forcing heal...")
+                        logger.debug("[CodeRunner] 🛑 Hallucination Detected: Standard mode generated FastAPI code. Forcing heal...")
                         error_history.append("AI Error: You generated FastAPI code but you are in STANDARD PYTHON mode. Do not use frameworks. Write a standard script with print().")
                         continue
 
@@ -535,7 +538,7 @@ class CodeRunner(BaseRunner):
                     if os.path.exists(backend_node_modules):
                         env["NODE_PATH"] = f"{backend_node_modules}{os.pathsep}{env.get('NODE_PATH', '')}".strip(os.pathsep)
 
-                    print(f"[CodeRunner] ⚡ Executing attempt {attempt}...")
+                    logger.debug("[CodeRunner] ⚡ Executing attempt %s...", attempt)
                     result = subprocess.run(
                         exec_cmd + [temp_file_path],
                         capture_output=True, text=True, timeout=30, env=env,
@@ -545,8 +548,8 @@ class CodeRunner(BaseRunner):
                     
                     if result.returncode == 0:
                         output_content = result.stdout.strip() or result.stderr.strip()
-                        print(f"[CodeRunner] ✅ Success on attempt {attempt}!")
-                        print(f"[CodeRunner] 📥 Output:\n{output_content}\n" + "-"*30)
+                        logger.debug("[CodeRunner] ✅ Success on attempt %s!", attempt)
+                        logger.debug("[CodeRunner] 📥 Output:\n%s\n%s", output_content, "-" * 30)
                         return {
                             "generated_code": code,
                             "output": output_content,
@@ -568,11 +571,11 @@ class CodeRunner(BaseRunner):
                         
                         error_to_send = "\n".join(cleaned_lines).strip() or raw_error.strip()
                         
-                        print(f"[CodeRunner] ⚠️ Execution failed (Attempt {attempt}): {error_to_send[:100]}...")
+                        logger.warning("[CodeRunner] ⚠️ Execution failed (Attempt %s): %s...", attempt, error_to_send[:100])
                         
                         if "modulenotfounderror: no module named" in error_to_send.lower():
                             package = error_to_send.lower().split("named '")[1].split("'")[0]
-                            print(f"[CodeRunner] 📦 Healing Dependencies: Installing {package}...")
+                            logger.debug("[CodeRunner] 📦 Healing Dependencies: Installing %s...", package)
                             subprocess.run([sys.executable, "-m", "pip", "install", package], capture_output=True)
                             error_history.append(f"Missing Python package: {package} (Installed, retrying...)")
                             continue 
@@ -580,7 +583,7 @@ class CodeRunner(BaseRunner):
                         if "cannot find module" in error_to_send.lower() and is_node:
                             try:
                                 package = error_to_send.lower().split("module '")[1].split("'")[0]
-                                print(f"[CodeRunner] 📦 Healing Dependencies: Installing {package} (NPM)...")
+                                logger.debug("[CodeRunner] 📦 Healing Dependencies: Installing %s (NPM)...", package)
                                 subprocess.run(["npm", "install", package], capture_output=True, cwd=os.getcwd())
                                 error_history.append(f"Missing Node.js module: {package} (Installed, retrying...)")
                                 continue
@@ -590,7 +593,7 @@ class CodeRunner(BaseRunner):
                 finally:
                     if os.path.exists(temp_file_path): os.remove(temp_file_path)
 
-            print(f"[CodeRunner] ❌ Exhausted all {max_retries} attempts.")
+            logger.error("[CodeRunner] ❌ Exhausted all %s attempts.", max_retries)
 
             return {
                 "output": f"Failed after {max_retries} attempts. Last error: {error_history[-1]}",
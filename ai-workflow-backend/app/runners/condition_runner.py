@@ -1,9 +1,14 @@
+import logging
 from typing import Dict, Any
 from app.runners.base_runner import BaseRunner
 
+logger = logging.getLogger(__name__)
+
 class ConditionRunner(BaseRunner):
     """Runner for branching logic (If/Else)."""
     
+    execution_mode = "inline"
+    
     def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
         condition_type = node_data.get("condition_type", "contains")
         target_value = node_data.get("value", "")
@@ -19,11 +24,11 @@ class ConditionRunner(BaseRunner):
                 raw_value = state["found"]
             else:
                 raw_value = state.get("context", state.get("mongodb_context", ""))
-                print(f"🔄 Output empty, falling back to context/mongodb_context check")
+                logger.debug("🔄 Output empty, falling back to context/mongodb_context check")
 
         current_value = str(raw_value) if raw_value is not None else ""
         
-        print(f"⚖️ Checking Condition: '{current_value[:50]}...' {condition_type} '{target_value}' (Raw type: {type(raw_value)})")
+        logger.debug("⚖️ Checking Condition: '%s...' %s '%s' (Raw type: %s)", current_value[:50], condition_type, target_value, type(raw_value))
         
         result = False
         # If raw_value is boolean, handle simple truthiness if target is blank
@@ -56,7 +61,7 @@ class ConditionRunner(BaseRunner):
                 else:
                     result = "found record" in c_val
             
-        print(f"🛤️  Condition Result: {result}")
+        logger.debug("🛤️  Condition Result: %s", result)
             
         return {
             "condition_result": result,
@@ -5,6 +5,9 @@ from app.runners.base_runner import BaseRunner
 class CSSSelectorRunner(BaseRunner):
     """Runner for extracting data from HTML using CSS Selectors."""
     
+    execution_mode = "cpu"
+    cache_reads = ("page_content", "output")
+    
     def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
         # Input HTML content
         html_content = state.get("page_content") or state.get("output") or ""
@@ -1,9 +1,12 @@
 """Document Generator Node Runner - Multi-format export."""
+import logging
 import os
 from datetime import datetime
 from typing import Dict, Any
 from app.runners.base_runner import BaseRunner
 
+logger = logging.getLogger(__name__)
+
 # Import libraries
 try:
     from fpdf import FPDF
@@ -21,6 +24,8 @@ except ImportError:
 class DocumentGeneratorRunner(BaseRunner):
     """Runner for generating documents in multiple formats."""
     
+    execution_mode = "cpu"
+    
     def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
         """
         Generate document from content in various formats.
@@ -50,7 +55,7 @@ class DocumentGeneratorRunner(BaseRunner):
         # Get metadata from state if available
         metadata = state.get("metadata", {})
         
-        print(f"📄 Generating {format_type.upper()} document: {title}")
+        logger.debug("📄 Generating %s document: %s", format_type.upper(), title)
         
         # Route to appropriate generator
         if format_type == "pdf":
@@ -163,7 +168,7 @@ class DocumentGeneratorRunner(BaseRunner):
             
             public_url = f"/static/downloads/{filename}"
             
-            print(f"✅ PDF generated: {filename}")
+            logger.debug("✅ PDF generated: %s", filename)
             
             return {
                 "download_url": public_url,
@@ -174,7 +179,7 @@ class DocumentGeneratorRunner(BaseRunner):
             }
             
         except Exception as e:
-            print(f"❌ PDF Error: {str(e)}")
+            logger.error("❌ PDF Error: %s", e)
             return {
                 "error": str(e),
                 "output": f"❌ Failed to generate PDF: {str(e)}"
@@ -228,7 +233,7 @@ class DocumentGeneratorRunner(BaseRunner):
             
             public_url = f"/static/downloads/{filename}"
             
-            print(f"✅ DOCX generated: {filename}")
+            logger.debug("✅ DOCX generated: %s", filename)
             
             return {
                 "download_url": public_url,
@@ -239,7 +244,7 @@ class DocumentGeneratorRunner(BaseRunner):
             }
             
         except Exception as e:
-            print(f"❌ DOCX Error: {str(e)}")
+            logger.error("❌ DOCX Error: %s", e)
             return {
                 "error": str(e),
                 "output": f"❌ Failed to generate DOCX: {str(e)}"
@@ -273,7 +278,7 @@ class DocumentGeneratorRunner(BaseRunner):
             
             public_url = f"/static/downloads/{filename}"
             
-            print(f"✅ TXT generated: {filename}")
+            logger.debug("✅ TXT generated: %s", filename)
             
             return {
                 "download_url": public_url,
@@ -284,7 +289,7 @@ class DocumentGeneratorRunner(BaseRunner):
             }
             
         except Exception as e:
-            print(f"❌ TXT Error: {str(e)}")
+            logger.error("❌ TXT Error: %s", e)
             return {
                 "error": str(e),
                 "output": f"❌ Failed to generate TXT: {str(e)}"
@@ -317,7 +322,7 @@ class DocumentGeneratorRunner(BaseRunner):
             
             public_url = f"/static/downloads/{filename}"
             
-            print(f"✅ Markdown generated: {filename}")
+            logger.debug("✅ Markdown generated: %s", filename)
             
             return {
                 "download_url": public_url,
@@ -328,7 +333,7 @@ class DocumentGeneratorRunner(BaseRunner):
             }
             
         except Exception as e:
-            print(f"❌ Markdown Error: {str(e)}")
+            logger.error("❌ Markdown Error: %s", e)
             return {
                 "error": str(e),
                 "output": f"❌ Failed to generate Markdown: {str(e)}"
@@ -38,32 +38,32 @@ class ElasticsearchRunner(BaseRunner):
         
         max_results = node_data.get("maxResults") or node_data.get("size", 5)
         
-        print(f"🔍 Elasticsearch Node Configuration:")
-        print(f"   Index from node_data: {node_data.get('index')} (using: {index_name})")
-        print(f"   Max results: {max_results}")
+        logger.debug("🔍 Elasticsearch Node Configuration:")
+        logger.debug("   Index from node_data: %s (using: %s)", node_data.get('index'), index_name)
+        logger.debug("   Max results: %s", max_results)
         
         try:
             # Parse query plan from LLM
             plan = self._parse_query_plan(llm_response)
             
-            print(f"🔍 Elasticsearch Query Plan:")
-            print(f"   {json.dumps(plan, indent=2)}")
+            logger.debug("🔍 Elasticsearch Query Plan:")
+            logger.debug("   %s", plan)
             
             # Convert plan to Elasticsearch DSL
             es_query = self._build_es_query(plan, max_results)
             
-            print(f"📊 Elasticsearch DSL Query:")
-            print(f"   Index: {index_name}")
-            print(f"   {json.dumps(es_query, indent=2)[:500]}...")
+            logger.debug("📊 Elasticsearch DSL Query:")
+            logger.debug("   Index: %s", index_name)
+            logger.debug("   %.500s...", es_query)
             
-            logger.info(f"📊 Executing ES query: {json.dumps(es_query, indent=2)}")
+            logger.debug("📊 Executing ES query: %s", es_query)
             
             # Initialize Elasticsearch service
             es_service = ElasticsearchService()
             
             # Check if ES is healthy
             if not es_service.health_check():
-                print(f"⚠️ Elasticsearch health check failed")
+                logger.warning("⚠️ Elasticsearch health check failed")
                 return {
                     "search_results": "Elasticsearch not available",
                     "output": "Search service unavailable",
@@ -74,13 +74,13 @@ class ElasticsearchRunner(BaseRunner):
             results = es_service.client.search(index=index_name, body=es_query)
             
             total_hits = results.get("hits", {}).get("total", {}).get("value", 0)
-            print(f"✅ Elasticsearch Results: {total_hits} hits")
+            logger.debug("✅ Elasticsearch Results: %s hits", total_hits)
             
             # Format results based on operation type
             formatted_output = self._format_results(plan, results)
             
-            print(f"📄 Formatted Results ({len(formatted_output)} chars):")
-            print(f"   {formatted_output[:300]}{'...' if len(formatted_output) > 300 else ''}")
+            logger.debug("📄 Formatted Results (%s chars):", len(formatted_output))
+            logger.debug("   %.300s", formatted_output)
             
             return {
                 "search_results": formatted_output,
@@ -112,7 +112,7 @@ class ElasticsearchRunner(BaseRunner):
             plan = json.loads(llm_response)
             return plan
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse query plan: {e}")
+            logger.error("Failed to parse query plan: %s", e)
             # Return default plan
             return {"operation": "AGGREGATION", "metric": "COUNT", "filters": {}}
     
@@ -126,14 +126,14 @@ class ElasticsearchRunner(BaseRunner):
         # Build filter clauses
         must_clauses = []
         
-        print(f"\n🔍 Building ES Query from Plan:")
-        print(f"   Operation: {operation}")
-        print(f"   Filters: {filters}")
+        logger.debug("🔍 Building ES Query from Plan:")
+        logger.debug("   Operation: %s", operation)
+        logger.debug("   Filters: %s", filters)
         
         for field_name, filter_config in filters.items():
             filter_type = filter_config.get("type", "term")
             
-            print(f"   Processing filter: {field_name} = {filter_config}")
+            logger.debug("   Processing filter: %s = %s", field_name, filter_config)
             
             if filter_type == "range":
                 must_clauses.append({
@@ -151,7 +151,7 @@ class ElasticsearchRunner(BaseRunner):
                 # for analyzed fields, or term query for keyword fields
                 # To be safe, use match query with operator AND for exact phrase matching
                 if field_name in ["city", "status", "property_type", "country"]:
-                    print(f"   → Adding MATCH filter (exact): {field_name} = '{filter_value}'")
+                    logger.debug("   → Adding MATCH filter (exact): %s = '%s'", field_name, filter_value)
                     must_clauses.append({
                         "match": {
                             field_name: {
@@ -162,7 +162,7 @@ class ElasticsearchRunner(BaseRunner):
                     })
                 else:
                     # For true keyword fields (IDs, postcodes), use term query
-                    print(f"   → Adding TERM filter: {field_name} = '{filter_value}'")
+                    logger.debug("   → Adding TERM filter: %s = '%s'", field_name, filter_value)
                     must_clauses.append({
                         "term": {field_name: filter_value}
                     })
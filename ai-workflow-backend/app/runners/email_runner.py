@@ -15,7 +15,7 @@ async def run(node_id: str, node_data: Dict[str, Any], state: Dict[str, Any]) ->
     1. Preparing a draft 'result' for the Chat UI.
     2. (Optional) Directly sending if requested, though we prefer the interactive flow.
     """
-    logger.info(f"Running Email Node: {node_id}")
+    logger.debug("Running Email Node: %s", node_id)
     
     # Get content from state
     # LLM nodes typically put their result in 'output'
@@ -1,8 +1,11 @@
 """Greeting Node Runner - Rotates through 10 attractive welcome messages."""
+import logging
 import random
 from typing import Dict, Any
 from app.runners.base_runner import BaseRunner
 
+logger = logging.getLogger(__name__)
+
 # Pre-defined attractive branded messages (Exactly 10 as provided)
 WELCOME_MESSAGES = [
     "👋✨ Welcome to {company_name}\nWhere premium quality meets elite athletic performance 💪👕\n\n🎯 Our Product Line\n🎽 Designer Sublimation Jerseys\n👕 High-Performance T-Shirts\n🩳 Professional Athletic Wear\n\n🏆 Why Choose Us\n⭐ Superior Fabric Standards\n🎨 Rich & Vibrant Printing\n🧵 Precision Stitching\n🚚 Fast & Reliable Delivery\n🤝 Trusted by Teams & Clubs\n\n📍 Address:\n🏠 SK Sports Wear, Tirupur – 641604\n\n📲 Catalog: {catalog_link}",
@@ -29,6 +32,8 @@ WELCOME_MESSAGES = [
 class GreetingRunner(BaseRunner):
     """Runner that selects a random attractive greeting template."""
     
+    execution_mode = "inline"
+    
     def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
         """Select a random template and fill variables using Catalog Node data."""
         # Get data directly from state (provided by TShirtCatalogNode)
@@ -44,9 +49,9 @@ class GreetingRunner(BaseRunner):
             catalog_link=catalog_link
         )
         
-        print(f"🎲 [GREETING NODE] Selected 1 of 10 templates.")
-        print(f"🏢 [GREETING NODE] Using Company: {company_name}")
-        print(f"🔗 [GREETING NODE] Using Link: {catalog_link}")
+        logger.debug("🎲 [GREETING NODE] Selected 1 of 10 templates.")
+        logger.debug("🏢 [GREETING NODE] Using Company: %s", company_name)
+        logger.debug("🔗 [GREETING NODE] Using Link: %s", catalog_link)
         
         return {
             "output": final_message,
@@ -1,8 +1,11 @@
+import logging
 import requests
 import json
 from typing import Dict, Any
 from app.runners.base_runner import BaseRunner
 
+logger = logging.getLogger(__name__)
+
 class HttpRunner(BaseRunner):
     """Runner for making HTTP API requests."""
     
@@ -24,7 +27,7 @@ class HttpRunner(BaseRunner):
             url = url.replace("{input}", str(user_input))
             body_str = body_str.replace("{input}", str(user_input))
             
-            print(f"🌐 HTTP {method} -> {url}")
+            logger.debug("🌐 HTTP %s -> %s", method, url)
             
             if method == "GET":
                 response = requests.get(url, headers=headers, timeout=10)
@@ -48,7 +51,7 @@ class HttpRunner(BaseRunner):
             }
             
         except Exception as e:
-            print(f"❌ HTTP Error: {str(e)}")
+            logger.error("❌ HTTP Error: %s", e)
             return {
                 "error": str(e),
                 "output": f"HTTP Request failed: {str(e)}"
@@ -1,7 +1,10 @@
+import logging
 import os
 from typing import Dict, Any, List
 from app.runners.base_runner import BaseRunner
 
+logger = logging.getLogger(__name__)
+
 class IDERunner(BaseRunner):
     """
     Runner for preparing an IDE-like view in the frontend.
@@ -95,7 +98,7 @@ class IDERunner(BaseRunner):
             
         except Exception as e:
             # Log error but don't fail the node, as the UI can still show the code from memory
-            print(f"Error writing files to disk: {str(e)}")
+            logger.error("Error writing files to disk: %s", e)
 
         return {
             "ide_data": ide_data,
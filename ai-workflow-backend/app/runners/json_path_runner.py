@@ -6,6 +6,8 @@ from app.runners.base_runner import BaseRunner
 class JSONPathRunner(BaseRunner):
     """Runner for extracting data from JSON using JSONPath."""
     
+    cache_reads = ("extracted_data", "output")
+    
     def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
         # Input JSON data
         data_source = state.get("extracted_data") or state.get("output")
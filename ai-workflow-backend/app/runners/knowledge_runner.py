@@ -1,13 +1,23 @@
+import logging
 import os
 from typing import Dict, Any
 from app.runners.base_runner import BaseRunner
 from app.services.extraction_engine import ExtractionEngine
 
+logger = logging.getLogger(__name__)
+
 STORAGE_DIR = "storage/knowledge"
 
 class KnowledgeRunner(BaseRunner):
     """Runner for extracting context from Knowledge Base files."""
     
+    execution_mode = "cpu"
+    cache_reads = ()
+    
+    def cache_keys(self, node_data: Dict[str, Any], state: Dict[str, Any]):
+        # Without a file_id the node reads whichever file was uploaded last
+        return self.cache_reads if node_data.get("file_id") else None
+    
     def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
         file_id = node_data.get("file_id", "")
         
@@ -33,7 +43,7 @@ class KnowledgeRunner(BaseRunner):
         if not file_path:
             return {"error": f"File {file_id} not found", "output": "Knowledge file not found."}
             
-        print(f"📖 Extracting data from Knowledge File: {file_path}")
+        logger.debug("📖 Extracting data from Knowledge File: %s", file_path)
         extracted_content = ExtractionEngine.extract_text(file_path)
         
         # If it's a PDF and text is empty, Gemini multimodal will handle it later in LLM node
@@ -5,6 +5,9 @@ from app.runners.base_runner import BaseRunner
 class LanguageRunner(BaseRunner):
     """Runner for setting the target programming language."""
     
+    execution_mode = "inline"
+    cache_reads = ()
+    
     def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
         # Determine if this is a frontend or backend node based on node_type or data
         is_frontend = node_data.get("is_frontend", True)
@@ -1,14 +1,32 @@
 """LLM node runner - supports multiple providers."""
+import logging
 from typing import Dict, Any
 from app.runners.base_runner import BaseRunner
 from app.services.llm_service import LLMService
 from app.services.gemini_service import GeminiService
 from app.services.claude_service import ClaudeService
 
+logger = logging.getLogger(__name__)
+
 
 class LLMRunner(BaseRunner):
     """Runner for LLM node - works with any AI provider."""
     
+    cache_reads = (
+        "provider", "model", "temperature", "maxTokens", "prompt", "search_results", "input",
+        "knowledge_context", "total", "output", "frontend_lang", "backend_lang",
+        "theme_tokens", "selected_theme", "system_prompt", "file_path"
+    )
+    
+    def cache_keys(self, node_data: Dict[str, Any], state: Dict[str, Any]):
+        # Only greedy decoding (temperature 0) is repeatable enough to reuse
+        try:
+            if float(state.get("temperature", 0.7)) != 0:
+                return None
+        except (TypeError, ValueError):
+            return None
+        return self.cache_reads
+    
     def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute LLM with provider configuration from previous node.
@@ -140,12 +158,10 @@ class LLMRunner(BaseRunner):
             response_text = response["text"]
             
             # Print the prompt that was JUST sent to OpenAI
-            print(f"🤖 [LLM] SENT PROMPT TO AI: {len(str(prompt))} chars")
-            print(f"--- SENT START ---\n{prompt[:300]}...\n--- SENT END ---")
+            logger.debug("🤖 [LLM] SENT PROMPT TO AI: %s chars", len(str(prompt)))
+            logger.debug("--- SENT START ---\n%.300s...\n--- SENT END ---", prompt)
             
-            print(f"\n{'='*40}")
-            print(f"{response_text}")
-            print(f"{'='*40}\n")
+            logger.debug("🤖 [LLM] RESPONSE:\n%s", response_text)
             
             return {
                 "llm_response": response_text,
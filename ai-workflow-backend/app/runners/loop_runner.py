@@ -1,6 +1,7 @@
 """Loop runner for iterative workflow control."""
+import json
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List
 from app.runners.base_runner import BaseRunner
 
 logger = logging.getLogger(__name__)
@@ -8,41 +9,70 @@ logger = logging.getLogger(__name__)
 class LoopRunner(BaseRunner):
     """
     Iterative control runner.
-    Manages loop state and triggers paths.
+
+    FlowExecutor runs the loop body (the nodes behind the "each" handle) once
+    per item from ``iteration_items`` and then continues on the "done" handle
+    with the gathered results from ``finish``.
     """
-    
-    def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
-        loop_id = node_data.get("node_id", "default_loop")
-        iterations_raw = node_data.get("iterations", 1)
-        
+
+    execution_mode = "inline"
+
+    def iteration_items(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> List[Any]:
+        """
+        Items to iterate over.
+
+        With ``itemsKey`` set, the rows of that state value (e.g. ``extracted_data``
+        or ``mongodb_data``); otherwise the indices ``0..iterations-1``.
+        """
+        items_key = node_data.get("itemsKey")
+        if items_key:
+            return self._as_rows(state.get(items_key))
+
         try:
-            iterations = int(iterations_raw)
-        except:
+            iterations = int(node_data.get("iterations", 1))
+        except (TypeError, ValueError):
             iterations = 1
-            
-        loop_state_key = f"loop_state_{loop_id}"
-        current_idx = state.get(loop_state_key, 0)
-        
-        if current_idx < iterations:
-            # Increment index for the next run
-            state[loop_state_key] = current_idx + 1
-            
-            # The "each" path should trigger the loop body
-            return {
-                "path": "each",
-                "current_index": current_idx,
-                "output": f"Loop {loop_id}: Iteration {current_idx + 1} of {iterations}",
-                "status": "success",
-                # Special instruction for FlowExecutor to allow re-running nodes
-                # If the UI provides the list of nodes in the loop body, we can reset them.
-                "reset_nodes": node_data.get("loop_body_nodes", []) 
-            }
-        else:
-            # Loop finished
-            # Reset the index so the flow can be run again later
-            state[loop_state_key] = 0
-            return {
-                "path": "done",
-                "output": f"Loop {loop_id}: Completed {iterations} iterations",
-                "status": "success"
-            }
+        return list(range(max(0, iterations)))
+
+    def finish(self, node_data: Dict[str, Any], results: List[Any], failed_iterations: List[int]) -> Dict[str, Any]:
+        """Loop node result once every iteration has run."""
+        loop_id = node_data.get("node_id", "default_loop")
+        result_key = node_data.get("resultKey") or "loop_results"
+        summary = f"Loop {loop_id}: Completed {len(results)} iterations"
+        if failed_iterations:
+            summary += f" ({len(failed_iterations)} failed)"
+
+        return {
+            "path": "done",
+            result_key: results,
+            "failed_iterations": failed_iterations,
+            "output": summary,
+            # Only a loop where nothing succeeded counts as a failed node
+            "status": "error" if results and len(failed_iterations) == len(results) else "success"
+        }
+
+    def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
+        # Without a body every item maps to itself
+        return self.finish(node_data, self.iteration_items(node_data, state), [])
+
+    def _as_rows(self, value: Any) -> List[Any]:
+        if value is None:
+            return []
+        if isinstance(value, str):
+            try:
+                value = json.loads(value)
+            except ValueError:
+                return [value]
+        if isinstance(value, (list, tuple)):
+            return list(value)
+        if isinstance(value, dict):
+            # Column-oriented extractions ({"title": [...], "price": [...]}) become rows
+            columns = {k: v for k, v in value.items() if isinstance(v, list)}
+            if not columns:
+                return [value]
+            length = max(len(v) for v in columns.values())
+            return [
+                {k: (v[i] if i < len(v) else None) if k in columns else v for k, v in value.items()}
+                for i in range(length)
+            ]
+        return [value]
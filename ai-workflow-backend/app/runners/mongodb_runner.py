@@ -26,8 +26,8 @@ class MongoDBRunner(BaseRunner):
             logger.warning("⚠️ MongoDB configuration incomplete")
             return {"error": "Incomplete MongoDB configuration"}
             
-        print(f"🏢 [MONGODB RUNNER] DB: {db_name} | Coll: {collection_name} | Op: {operation}")
-        print(f"📦 [MONGODB RUNNER] node_data: {json.dumps(node_data, indent=2)}")
+        logger.debug("🏢 [MONGODB RUNNER] DB: %s | Coll: %s | Op: %s", db_name, collection_name, operation)
+        logger.debug("📦 [MONGODB RUNNER] node_data: %s", node_data)
         
         try:
             # Enhanced Helper to resolve {variable} or {{variable}} placeholders
@@ -53,19 +53,19 @@ class MongoDBRunner(BaseRunner):
                 return re.sub(pattern, replace_match, text)
 
             def resolve_dict(target_obj):
-                print(f"🧪 [MONGODB RUNNER] Resolving object type: {type(target_obj)}")
+                logger.debug("🧪 [MONGODB RUNNER] Resolving object type: %s", type(target_obj))
                 if isinstance(target_obj, str) and target_obj.strip():
                     # If it's a string, first resolve placeholders, then try to parse as JSON
                     resolved_str = resolve_text(target_obj)
                     try:
                         return json.loads(resolved_str)
                     except Exception as e:
-                        logger.error(f"❌ MongoDB JSON Parse Error: {str(e)} | Content: {resolved_str}")
-                        print(f"❌ [MONGODB RUNNER] JSON Parse Error: {str(e)}")
+                        logger.error("❌ MongoDB JSON Parse Error: %s | Content: %s", e, resolved_str)
+                        logger.error("❌ [MONGODB RUNNER] JSON Parse Error: %s", e)
                         return {} # Fail with empty dict if not valid JSON
                 
                 if not isinstance(target_obj, dict):
-                    print(f"⚠️ [MONGODB RUNNER] Target is not a dict or string: {target_obj}")
+                    logger.warning("⚠️ [MONGODB RUNNER] Target is not a dict or string: %s", target_obj)
                     return {}
 
                 resolved = {}
@@ -85,14 +85,14 @@ class MongoDBRunner(BaseRunner):
                 
                 if not doc_to_insert:
                     logger.error("❌ MongoDB INSERT: Empty document after resolution")
-                    print(f"❌ [MONGODB RUNNER] INSERT failed: doc_raw was {doc_raw}")
+                    logger.error("❌ [MONGODB RUNNER] INSERT failed: doc_raw was %s", doc_raw)
                     return {"error": "No document data to insert"}
                 
                 # Auto-timestamp
                 if "created_at" not in doc_to_insert:
                     doc_to_insert["created_at"] = datetime.datetime.now().isoformat()
                 
-                print(f"📥 [MONGODB RUNNER] Inserting document: {json.dumps(doc_to_insert)}")
+                logger.debug("📥 [MONGODB RUNNER] Inserting document: %s", doc_to_insert)
                 inserted_id = await mongodb_service.insert_data(uri, db_name, collection_name, doc_to_insert)
                 
                 return {
@@ -105,12 +105,12 @@ class MongoDBRunner(BaseRunner):
             if operation == "FIND":
                 query_raw = node_data.get("query") or {}
                 query = resolve_dict(query_raw)
-                print(f"🔍 [MONGODB RUNNER] Searching with Query: {json.dumps(query)}")
+                logger.debug("🔍 [MONGODB RUNNER] Searching with Query: %s", query)
                 
                 data = await mongodb_service.fetch_data(uri, db_name, collection_name, query)
-                print(f"🔍 [MONGODB RUNNER] Database Result: {'Record Found' if data else 'No Record Found'}")
+                logger.debug("🔍 [MONGODB RUNNER] Database Result: %s", 'Record Found' if data else 'No Record Found')
                 if data:
-                    print(f"🔍 [MONGODB RUNNER] Data Snippet: {str(data)[:100]}...")
+                    logger.debug("🔍 [MONGODB RUNNER] Data Snippet: %.100s...", data)
                 
                 if not data:
                     return {"output": f"No matching data found in {db_name}.{collection_name}", "found": False}
@@ -157,7 +157,7 @@ class MongoDBRunner(BaseRunner):
             }
             
         except Exception as e:
-            logger.error(f"❌ MongoDB Runner error: {str(e)}")
+            logger.error("❌ MongoDB Runner error: %s", e)
             return {"error": f"MongoDB Error: {str(e)}"}
 
 # Global instance
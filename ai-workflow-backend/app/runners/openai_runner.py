@@ -6,6 +6,8 @@ from app.runners.base_runner import BaseRunner
 class OpenAIRunner(BaseRunner):
     """Runner for OpenAI configuration node."""
     
+    execution_mode = "inline"
+    
     def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
         """
         Store OpenAI configuration in state.
@@ -1,13 +1,18 @@
 """Chat Output node runner - Master Presenter."""
+import logging
 from typing import Dict, Any
 from app.runners.base_runner import BaseRunner
 
+logger = logging.getLogger(__name__)
+
 class OutputRunner(BaseRunner):
     """
     Final Output runner that surgically combines results.
     Prevents double ZIP links and ensures clean presentation of verified UI projects.
     """
     
+    execution_mode = "inline"
+    
     def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
         # 1. Check for SPECIAL modes (e.g. Email Draft)
         if state.get("type") == "email_draft":
@@ -52,7 +57,7 @@ class OutputRunner(BaseRunner):
 
         final_msg = "".join(final_parts).strip() or "No output generated."
         
-        print(f"📤 Final Presentation: {len(final_msg)} chars.")
+        logger.debug("📤 Final Presentation: %s chars.", len(final_msg))
         return {
             "output": final_msg,
             "final": True
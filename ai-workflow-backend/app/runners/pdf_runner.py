@@ -25,7 +25,7 @@ class PdfRunner(BaseRunner):
             content = state.get("output", "No content available.")
             source_name = "output"
 
-        logger.info(f"📄 [PdfRunner] Processing. Title: {title}, Source: {source_name}, Size: {len(str(content))} chars")
+        logger.debug("📄 [PdfRunner] Processing. Title: %s, Source: %s", title, source_name)
         
         if not FPDF:
             logger.error("❌ [PdfRunner] FPDF library missing.")
@@ -66,7 +66,7 @@ class PdfRunner(BaseRunner):
             steps = state.get("manual_steps", [])
             
             if is_manual and steps:
-                logger.info(f"📸 [PdfRunner] Generating Manual with {len(steps)} steps")
+                logger.debug("📸 [PdfRunner] Generating Manual with %s steps", len(steps))
                 for i, step in enumerate(steps):
                     pdf.set_font("Arial", "B", 14)
                     pdf.set_text_color(139, 92, 246) # Purple 500
@@ -91,12 +91,12 @@ class PdfRunner(BaseRunner):
                                 pdf.image(local_path, w=170)
                                 pdf.ln(5)
                             except Exception as img_err:
-                                logger.warning(f"Failed to embed image: {img_err}")
+                                logger.warning("Failed to embed image: %s", img_err)
                                 pdf.set_font("Arial", "I", 8)
                                 pdf.set_text_color(239, 68, 68)
                                 pdf.cell(0, 5, f"[PDF Error] Image embedding failed: {str(img_err)}", ln=True)
                         else:
-                            logger.warning(f"Screenshot path not found: {local_path}")
+                            logger.warning("Screenshot path not found: %s", local_path)
                             pdf.set_font("Arial", "I", 8)
                             pdf.set_text_color(239, 68, 68)
                             pdf.cell(0, 5, f"[Manual Debug] Screenshot missing at: {local_path}", ln=True)
@@ -123,15 +123,15 @@ class PdfRunner(BaseRunner):
             local_url = f"/static/downloads/{filename}"
             
             if background_tasks:
-                logger.info(f"🚀 [PdfRunner] Enqueuing background upload for {filepath}")
+                logger.info("🚀 [PdfRunner] Enqueuing background upload for %s", filepath)
                 
                 def background_upload(file_p):
                     from app.utils.cloudinary_utils import upload_file
                     try:
                         upload_file(file_p, folder="reports")
-                        logger.info(f"✅ [Background] Uploaded {file_p} to Cloudinary")
+                        logger.info("✅ [Background] Uploaded %s to Cloudinary", file_p)
                     except Exception as e:
-                        logger.error(f"❌ [Background] Failed to upload {file_p}: {e}")
+                        logger.error("❌ [Background] Failed to upload %s: %s", file_p, e)
                 
                 background_tasks.add_task(background_upload, filepath)
                 public_url = local_url
@@ -140,7 +140,7 @@ class PdfRunner(BaseRunner):
                 cloud_url = upload_file(filepath, folder="reports")
                 public_url = cloud_url if cloud_url else local_url
 
-            logger.info(f"✅ [PdfRunner] PDF generated: {public_url}")
+            logger.info("✅ [PdfRunner] PDF generated: %s", public_url)
 
             # Prepare UI Content
             terminal_ui = (
@@ -158,7 +158,7 @@ class PdfRunner(BaseRunner):
             }
             
         except Exception as e:
-            logger.error(f"❌ [PdfRunner] Crash: {str(e)}", exc_info=True)
+            logger.error("❌ [PdfRunner] Crash: %s", e, exc_info=True)
             return {
                 "error": str(e),
                 "output": f"Failed to generate PDF: {str(e)[:100]}...",
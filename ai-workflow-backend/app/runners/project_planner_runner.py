@@ -1,3 +1,4 @@
+import logging
 import os
 import json
 from typing import Dict, Any, List
@@ -5,6 +6,8 @@ from app.runners.base_runner import BaseRunner
 from app.services.llm_service import LLMService
 from app.services.gemini_service import GeminiService
 
+logger = logging.getLogger(__name__)
+
 class ProjectPlannerRunner(BaseRunner):
     """
     Runner that generates an end-to-end Technical Blueprint for a project.
@@ -102,7 +105,7 @@ Project Requirement: {project_description}
                     "status": "success"
                 }
             except Exception as e:
-                print(f"❌ ProjectPlannerRunner JSON Parse Error: {str(e)}\nResponse: {response_text[:500]}...")
+                logger.error("❌ ProjectPlannerRunner JSON Parse Error: %s\nResponse: %s...", str(e), response_text[:500])
                 return {
                     "output": f"AI response was not in valid JSON format: {response_text}",
                     "status": "partial_success",
@@ -1,14 +1,25 @@
 """Prompt template node runner."""
+import logging
 import re
 from typing import Dict, Any
 from app.runners.base_runner import BaseRunner
 from app.services.schema_loader import get_schema_loader
 from app.services.prompts import QUERY_PLANNER_PROMPT, MONGODB_RAG_PROMPT, GENERIC_RAG_PROMPT
 
+logger = logging.getLogger(__name__)
+
 
 class PromptRunner(BaseRunner):
     """Runner for prompt template node."""
     
+    cache_reads = ("input", "context")
+    
+    def cache_keys(self, node_data: Dict[str, Any], state: Dict[str, Any]):
+        """Input and context plus every variable the template references."""
+        template = node_data.get("template") or ""
+        variables = [(a or b).strip() for a, b in re.findall(r"\{\{([^}]+)\}\}|\{([^}]+)\}", template)]
+        return self.cache_reads + tuple(variables)
+    
     def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create prompt from template or fallback to query planner.
@@ -20,11 +31,11 @@ class PromptRunner(BaseRunner):
         if template:
             prompt = template
         elif context:
-            print(f"📄 RAG Context detected. Using GENERIC_RAG_PROMPT.")
+            logger.debug("📄 RAG Context detected. Using GENERIC_RAG_PROMPT.")
             prompt = GENERIC_RAG_PROMPT
         else:
             # Fallback to query planner
-            print(f" Falling back to QUERY_PLANNER_PROMPT for: {user_input}")
+            logger.debug(" Falling back to QUERY_PLANNER_PROMPT for: %s", user_input)
             schema_loader = get_schema_loader()
             schema_context = schema_loader.get_schema_context()
             prompt = QUERY_PLANNER_PROMPT.format(
@@ -55,8 +66,8 @@ class PromptRunner(BaseRunner):
         if prompt == GENERIC_RAG_PROMPT:
             prompt = prompt.format(context=context, user_message=user_input)
         
-        print(f"📝 Generated Prompt ({len(prompt)} chars):")
-        print(f"--- PROMPT START ---\n{prompt}\n--- PROMPT END ---")
+        logger.debug("📝 Generated Prompt (%s chars):", len(prompt))
+        logger.debug("--- PROMPT START ---\n%s\n--- PROMPT END ---", prompt)
         
         return {
             "prompt": prompt,
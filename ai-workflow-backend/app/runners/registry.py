@@ -0,0 +1,154 @@
+"""Lazy registry mapping node types to runner implementations."""
+import importlib
+import logging
+import threading
+from typing import Dict, Any, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Node type -> "module:attribute". Classes are instantiated on first use,
+# module-level instances and plain functions are used as-is.
+RUNNER_PATHS: Dict[str, str] = {
+    "chatInput": "app.runners.chat_input_runner:ChatInputRunner",
+    "promptTemplate": "app.runners.prompt_runner:PromptRunner",
+    "openai": "app.runners.openai_runner:OpenAIRunner",
+    "gemini": "app.runners.gemini_runner:GeminiRunner",
+    "claude": "app.runners.claude_runner:ClaudeRunner",
+    "llm": "app.runners.llm_runner:LLMRunner",
+    "elasticsearch": "app.runners.elasticsearch_runner:ElasticsearchRunner",
+    "chatOutput": "app.runners.output_runner:OutputRunner",
+    "search": "app.runners.search_runner:SearchRunner",
+    "http": "app.runners.http_runner:HttpRunner",
+    "condition": "app.runners.condition_runner:ConditionRunner",
+    "pdf": "app.runners.pdf_runner:PdfRunner",
+    "knowledge": "app.runners.knowledge_runner:KnowledgeRunner",
+    "summarization": "app.runners.summarization_runner:SummarizationRunner",
+    "documentGenerator": "app.runners.document_generator_runner:DocumentGeneratorRunner",
+    "email": "app.runners.email_runner:run",
+    "whatsAppInput": "app.runners.whatsapp_input_runner:WhatsAppInputRunner",
+    "whatsAppOutput": "app.runners.whatsapp_runner:whats_app_runner",
+    "mongoDB": "app.runners.mongodb_runner:mongo_db_runner",
+    "tshirtCatalog": "app.runners.tshirt_catalog_runner:tshirt_catalog_runner",
+    "greeting": "app.runners.greeting_runner:greeting_runner",
+    "pythonRunner": "app.runners.code_runner:CodeRunner",
+    "reactRunner": "app.runners.ui_components_runner:UIComponentsRunner",
+    "uiComponents": "app.runners.ui_components_runner:UIComponentsRunner",
+    "promptGenerator": "app.runners.prompt_generator_runner:PromptGeneratorRunner",
+    "masterPrompt": "app.runners.master_prompt_runner:MasterPromptRunner",
+    "language": "app.runners.language_runner:LanguageRunner",
+    "frontendLanguage": "app.runners.language_runner:LanguageRunner",
+    "backendLanguage": "app.runners.language_runner:LanguageRunner",
+    "theme": "app.runners.theme_runner:ThemeRunner",
+    "zip": "app.runners.zip_runner:ZipRunner",
+    "browser": "app.runners.browser_runner:BrowserRunner",
+    "loop": "app.runners.loop_runner:LoopRunner",
+    "screenshot": "app.runners.screenshot_runner:ScreenshotRunner",
+    "ide": "app.runners.ide_runner:IDERunner",
+    "xpathHelper": "app.runners.xpath_helper_runner:XPathHelperRunner",
+    "htmlExtractor": "app.runners.xpath_helper_runner:XPathHelperRunner",  # Alias for backward compatibility
+    "cssSelector": "app.runners.css_selector_runner:CSSSelectorRunner",
+    "jsonPath": "app.runners.json_path_runner:JSONPathRunner",
+    "projectPlanner": "app.runners.project_planner_runner:ProjectPlannerRunner",
+}
+
+
+class RunnerRegistry:
+    """
+    Resolves node types to runners, importing each runner module on first use.
+
+    Behaves like the old ``{node_type: runner}`` dict for ``get``, ``[]``,
+    ``in`` and item assignment, so callers can register overrides directly.
+    """
+
+    def __init__(self, paths: Dict[str, str] = None):
+        self._paths = dict(paths if paths is not None else RUNNER_PATHS)
+        self._overrides: Dict[str, Any] = {}
+        # One runner per "module:attribute" so aliases share an instance
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+        # Bumped whenever overrides change so callers can drop cached bindings
+        self.version = 0
+
+    def get(self, node_type: str, default=None):
+        """Return the runner for a node type, loading it if needed."""
+        runner = self._overrides.get(node_type)
+        if runner is not None:
+            return runner
+        path = self._paths.get(node_type)
+        if path is None:
+            return default
+        return self._load(path)
+
+    def register(self, node_type: str, runner: Any):
+        """Register a runner instance (or function) for a node type, replacing any default."""
+        with self._lock:
+            self._overrides[node_type] = runner
+            self.version += 1
+
+    def unregister(self, node_type: str):
+        """Remove an override, restoring the default runner for the node type."""
+        with self._lock:
+            if self._overrides.pop(node_type, None) is not None:
+                self.version += 1
+
+    def prewarm(self, node_types: Iterable[str]) -> List[str]:
+        """Import and instantiate the given runners now; returns the types that failed."""
+        failed = []
+        for node_type in node_types:
+            try:
+                if self.get(node_type) is None:
+                    failed.append(node_type)
+            except Exception as e:
+                logger.error("❌ Failed to pre-warm runner '%s': %s", node_type, e)
+                failed.append(node_type)
+        return failed
+
+    def prewarm_in_background(self, node_types: Iterable[str]) -> Optional[threading.Thread]:
+        """Pre-warm runners on a daemon thread so startup is not delayed."""
+        node_types = [t for t in node_types if t]
+        if not node_types:
+            return None
+        thread = threading.Thread(target=self.prewarm, args=(node_types,), name="runner-prewarm", daemon=True)
+        thread.start()
+        return thread
+
+    def loaded(self) -> List[str]:
+        """Node types whose runner is already in memory."""
+        with self._lock:
+            return sorted(set(self._overrides) | {t for t, p in self._paths.items() if p in self._instances})
+
+    def _load(self, path: str):
+        runner = self._instances.get(path)
+        if runner is not None:
+            return runner
+        with self._lock:
+            runner = self._instances.get(path)
+            if runner is None:
+                module_name, attr = path.split(":", 1)
+                target = getattr(importlib.import_module(module_name), attr)
+                runner = target() if isinstance(target, type) else target
+                self._instances[path] = runner
+                logger.info("📦 Loaded runner %s", path)
+            return runner
+
+    def __getitem__(self, node_type: str):
+        runner = self.get(node_type)
+        if runner is None:
+            raise KeyError(node_type)
+        return runner
+
+    def __setitem__(self, node_type: str, runner: Any):
+        self.register(node_type, runner)
+
+    def __contains__(self, node_type: str) -> bool:
+        return node_type in self._overrides or node_type in self._paths
+
+    def __iter__(self):
+        return iter(sorted(set(self._paths) | set(self._overrides)))
+
+    def __len__(self) -> int:
+        return len(set(self._paths) | set(self._overrides))
+
+
+# Global runner registry
+runner_registry = RunnerRegistry()
@@ -19,7 +19,7 @@ class ScreenshotRunner(BaseRunner):
     async def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
         """Runs the screenshot capture, using an isolated loop on Windows if necessary."""
         if sys.platform == 'win32':
-            print("🪟 [ScreenshotRunner] Detected Windows. Using isolated Proactor loop.")
+            logger.debug("🪟 [ScreenshotRunner] Detected Windows. Using isolated Proactor loop.")
             return run_in_new_loop(self._run_internal(node_data, state))
         else:
             return await self._run_internal(node_data, state)
@@ -41,7 +41,7 @@ class ScreenshotRunner(BaseRunner):
         
         try:
             async with async_playwright() as p:
-                print(f"📸 [ScreenshotRunner] Capturing: {url}")
+                logger.debug("📸 [ScreenshotRunner] Capturing: %s", url)
                 # Screenshots are always headless for consistency and speed
                 browser = await p.chromium.launch(
                     headless=True,
@@ -53,8 +53,8 @@ class ScreenshotRunner(BaseRunner):
                 await page.set_viewport_size({"width": 1280, "height": 720})
                 
                 # Console Logging for Debugging
-                page.on("console", lambda msg: print(f"🔍 [SCREENSHOT CONSOLE] {msg.type.upper()}: {msg.text}") if msg.type in ["error", "warning"] else None)
-                page.on("pageerror", lambda err: print(f"❌ [SCREENSHOT RUNTIME ERROR] {err.message}"))
+                page.on("console", lambda msg: logger.debug("🔍 [SCREENSHOT CONSOLE] %s: %s", msg.type.upper(), msg.text) if msg.type in ["error", "warning"] else None)
+                page.on("pageerror", lambda err: logger.error("❌ [SCREENSHOT RUNTIME ERROR] %s", err.message))
 
                 await page.goto(url, wait_until="networkidle", timeout=30000)
                 
@@ -70,15 +70,15 @@ class ScreenshotRunner(BaseRunner):
                 background_tasks = state.get("background_tasks")
                 
                 if background_tasks:
-                    logger.info(f"🚀 [ScreenshotRunner] Enqueuing background upload for {abs_path}")
+                    logger.info("🚀 [ScreenshotRunner] Enqueuing background upload for %s", abs_path)
                     
                     def background_upload(file_path):
                         from app.utils.cloudinary_utils import upload_file
                         try:
                             upload_file(file_path, folder="screenshots")
-                            logger.info(f"✅ [Background] Uploaded {file_path} to Cloudinary")
+                            logger.info("✅ [Background] Uploaded %s to Cloudinary", file_path)
                         except Exception as e:
-                            logger.error(f"❌ [Background] Failed to upload {file_path}: {e}")
+                            logger.error("❌ [Background] Failed to upload %s: %s", file_path, e)
                     
                     background_tasks.add_task(background_upload, abs_path)
                     final_url = screenshot_url # Use local URL immediately
@@ -113,5 +113,5 @@ class ScreenshotRunner(BaseRunner):
                 }
                 
         except Exception as e:
-            logger.error(f"Screenshot Runner Error: {str(e)}")
+            logger.error("Screenshot Runner Error: %s", e)
             return {"output": f"Screenshot Error: {str(e)}", "status": "error"}
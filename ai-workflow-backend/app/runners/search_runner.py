@@ -1,7 +1,10 @@
+import logging
 from typing import Dict, Any
 from app.runners.base_runner import BaseRunner
 from app.services.gemini_service import GeminiService
 
+logger = logging.getLogger(__name__)
+
 class SearchRunner(BaseRunner):
     """Runner for Google Search node using Gemini grounding."""
     
@@ -15,7 +18,7 @@ class SearchRunner(BaseRunner):
         
         query = query_template.replace("{input}", user_input)
         
-        print(f"🔍 Executing Google Search grounding for: {query}")
+        logger.debug("🔍 Executing Google Search grounding for: %s", query)
         
         try:
             # Use Gemini with search enabled
@@ -28,7 +31,7 @@ class SearchRunner(BaseRunner):
             
             search_results = response["text"]
             
-            print(f"✅ Search completed. Result length: {len(search_results)} chars")
+            logger.debug("✅ Search completed. Result length: %s chars", len(search_results))
             
             return {
                 "search_results": search_results,
@@ -36,7 +39,7 @@ class SearchRunner(BaseRunner):
                 "query": query
             }
         except Exception as e:
-            print(f"❌ Search Error: {str(e)}")
+            logger.error("❌ Search Error: %s", e)
             return {
                 "error": str(e),
                 "output": f"Failed to perform search: {str(e)}"
@@ -1,8 +1,11 @@
 """Summarization Node Runner."""
+import logging
 from typing import Dict, Any
 from app.runners.base_runner import BaseRunner
 from app.services.ai_summarization_service import AISummarizationService
 
+logger = logging.getLogger(__name__)
+
 
 class SummarizationRunner(BaseRunner):
     """Runner for AI text summarization with multi-provider fallback."""
@@ -62,7 +65,7 @@ class SummarizationRunner(BaseRunner):
             # Rough approximation: words to tokens (1 word ≈ 1.3 tokens)
             max_tokens = int(max_length * 1.3)
         
-        print(f"🤖 Summarizing text ({len(text)} chars) with style: {style}")
+        logger.debug("🤖 Summarizing text (%s chars) with style: %s", len(text), style)
         
         # Call AI Summarization Service
         result = AISummarizationService.summarize_text(
@@ -73,7 +76,7 @@ class SummarizationRunner(BaseRunner):
         
         # Prepare output
         if result.get("error"):
-            print(f"❌ Summarization failed: {result.get('summary')}")
+            logger.error("❌ Summarization failed: %s", result.get('summary'))
             return {
                 "error": result.get("summary"),
                 "output": f"❌ Summarization Error: {result.get('summary')}",
@@ -84,7 +87,7 @@ class SummarizationRunner(BaseRunner):
         model_used = result["model_used"]
         provider = result["provider"]
         
-        print(f"✅ Summary generated using {provider} ({model_used})")
+        logger.debug("✅ Summary generated using %s (%s)", provider, model_used)
         
         return {
             "summary": summary_text,
@@ -73,6 +73,15 @@ THEME_LIBRARY = {
 class ThemeRunner(BaseRunner):
     """Runner for selecting and injecting design tokens."""
     
+    execution_mode = "inline"
+    cache_reads = ()
+    
+    def cache_keys(self, node_data: Dict[str, Any], state: Dict[str, Any]):
+        # A random theme must be re-rolled on every run
+        if node_data.get("theme") == "All Themes (Random)":
+            return None
+        return self.cache_reads
+    
     def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
         selected_theme = node_data.get("theme", "Glassmorphism")
         
@@ -1,8 +1,11 @@
 """T-Shirt catalog runner - handles one-time link delivery using MongoDB."""
+import logging
 from typing import Dict, Any
 from app.services.prompts import TSHIRT_CATALOG_PROMPT
 from app.runners.mongodb_runner import mongo_db_runner
 
+logger = logging.getLogger(__name__)
+
 class TShirtCatalogRunner:
     """Runner for T-shirt catalog bot with one-time reply logic using MongoDB."""
     
@@ -16,9 +19,9 @@ class TShirtCatalogRunner:
         catalog_link = node_data.get("catalog_link", self.catalog_link)
         phone_number = state.get("phone_number")
         
-        print(f"\n🔍 [T-SHIRT CATALOG] Running for: {phone_number}")
-        print(f"🏢 [T-SHIRT CATALOG] Company: {company_name}")
-        print(f"🔗 [T-SHIRT CATALOG] Link: {catalog_link}")
+        logger.debug("🔍 [T-SHIRT CATALOG] Running for: %s", phone_number)
+        logger.debug("🏢 [T-SHIRT CATALOG] Company: %s", company_name)
+        logger.debug("🔗 [T-SHIRT CATALOG] Link: %s", catalog_link)
         
         if not phone_number:
             return {"output": "", "error": "No phone number", "silent": True}
@@ -36,10 +39,10 @@ class TShirtCatalogRunner:
             search_result = await mongo_db_runner.run(mongodb_data, state)
             already_sent = "Found Record:" in search_result.get("output", "")
             
-            print(f"📊 [T-SHIRT CATALOG] DB Result: {'EXISTING' if already_sent else 'NEW'}")
+            logger.debug("📊 [T-SHIRT CATALOG] DB Result: %s", 'EXISTING' if already_sent else 'NEW')
 
             if already_sent:
-                print(f"🔕 [T-SHIRT CATALOG] SILENCING - Customer already tracked.")
+                logger.debug("🔕 [T-SHIRT CATALOG] SILENCING - Customer already tracked.")
                 return {
                     "output": "",
                     "silent": True,
@@ -53,7 +56,7 @@ class TShirtCatalogRunner:
                 catalog_link=catalog_link
             )
             
-            print(f"🎉 [T-SHIRT CATALOG] First time customer! Preparing catalog.")
+            logger.debug("🎉 [T-SHIRT CATALOG] First time customer! Preparing catalog.")
             
             return {
                 "output": catalog_message,
@@ -63,7 +66,7 @@ class TShirtCatalogRunner:
             }
             
         except Exception as e:
-            print(f"❌ [T-SHIRT CATALOG] MongoDB Error: {e}")
+            logger.error("❌ [T-SHIRT CATALOG] MongoDB Error: %s", e)
             return {"output": "", "error": str(e), "silent": True}
 
 tshirt_catalog_runner = TShirtCatalogRunner()
@@ -59,10 +59,10 @@ class UIComponentsRunner(BaseRunner):
 
     def _clean_json(self, raw_str: str) -> str:
         if not raw_str: return ""
-        print(f"📦 [UI Runner] Cleaning JSON (Input Len: {len(raw_str)})")
+        logger.debug("📦 [UI Runner] Cleaning JSON (Input Len: %s)", len(raw_str))
         # Log first/last bits to see if truncated
-        print(f"   [UI Runner] Prefix: {raw_str[:70]}...")
-        print(f"   [UI Runner] Suffix: ...{raw_str[-70:]}")
+        logger.debug("   [UI Runner] Prefix: %s...", raw_str[:70])
+        logger.debug("   [UI Runner] Suffix: ...%s", raw_str[-70:])
 
         # Aggressive JSON extraction (find first '{' or '[' and last '}' or ']')
         first_bracket = min([i for i in [raw_str.find("{"), raw_str.find("[")] if i != -1] or [-1])
@@ -130,7 +130,7 @@ class UIComponentsRunner(BaseRunner):
                             else:
                                 deps[lib] = version
                             modified = True
-                            print(f"🔧 [UI Runner] Injected missing dependency: {lib}")
+                            logger.debug("🔧 [UI Runner] Injected missing dependency: %s", lib)
                     
                     # 4. Update/Add Mandatory Core & Dev Deps
                     for lib in mandatory_core + mandatory_dev:
@@ -145,7 +145,7 @@ class UIComponentsRunner(BaseRunner):
                         data["devDependencies"] = dev_deps
                         f["content"] = json.dumps(data, indent=2)
                 except Exception as e:
-                    print(f"⚠️ [UI Runner] Failed to harmonize package.json: {str(e)}")
+                    logger.warning("⚠️ [UI Runner] Failed to harmonize package.json: %s", e)
         return files
 
     def _apply_auto_stubbing(self, files: List[Dict[str, str]]) -> List[Dict[str, str]]:
@@ -156,7 +156,7 @@ class UIComponentsRunner(BaseRunner):
             if path not in paths:
                 files.append({"path": path, "content": content})
                 system_logs.append(f"Auto-Stubbed: Missing {path} injected.")
-                print(f"🔧 [UI Runner] Fixed missing config: {path}")
+                logger.debug("🔧 [UI Runner] Fixed missing config: %s", path)
             else:
                 # Content Validation for existing crucial files
                 for f in files:
@@ -166,12 +166,12 @@ class UIComponentsRunner(BaseRunner):
                         
                         # Use regex for case-insensitive and whitespace resilient checks
                         if not re.search(r'id=["\']root["\']', c):
-                            print("🔧 [UI Runner] Adding missing #root div...")
+                            logger.debug("🔧 [UI Runner] Adding missing #root div...")
                             c = re.sub(r'(<body.*?>)', r'\1\n    <div id="root"></div>', c, flags=re.IGNORECASE)
                             modified = True
                         
                         if not re.search(r'src=["\'].*?main\.jsx["\']', c):
-                            print("🔧 [UI Runner] Adding missing main.jsx script tag...")
+                            logger.debug("🔧 [UI Runner] Adding missing main.jsx script tag...")
                             if "</body>" in c.lower():
                                 c = re.sub(r'(</body>)', r'    <script type="module" src="/src/main.jsx"></script>\n\1', c, flags=re.IGNORECASE)
                             else:
@@ -180,12 +180,12 @@ class UIComponentsRunner(BaseRunner):
                             
                         if modified:
                             f["content"] = c
-                            print("🔧 [UI Runner] ✅ index.html DEEP REPAIR COMPLETE")
+                            logger.debug("🔧 [UI Runner] ✅ index.html DEEP REPAIR COMPLETE")
                             
                     elif f["path"] == "src/index.css" and path == "src/index.css":
                         if "@tailwind" not in f["content"]:
                             f["content"] = self.DEFAULTS["src/index.css"] + "\n\n" + f["content"]
-                            print("🔧 [UI Runner] Injected missing Tailwind directives into index.css")
+                            logger.debug("🔧 [UI Runner] Injected missing Tailwind directives into index.css")
         return files, system_logs
 
     def _verify_imports(self, files: List[Dict[str, str]]) -> str:
@@ -249,7 +249,7 @@ class UIComponentsRunner(BaseRunner):
             
             # Check for token issues
             if response.get("finish_reason") == "length":
-                print("⚠️ [UI Runner] CRITICAL: AI Token Limit Exceeded (Truncated Response)")
+                logger.warning("⚠️ [UI Runner] CRITICAL: AI Token Limit Exceeded (Truncated Response)")
                 system_logs.append("⚠️ ERROR: AI response was truncated due to token limits. Some files may be missing or broken.")
 
             raw_content = self._clean_json(response.get("text", "").strip())
@@ -257,7 +257,7 @@ class UIComponentsRunner(BaseRunner):
             max_attempts, current_attempt = 3, 1
             
             while current_attempt <= max_attempts:
-                print(f"🔍 [UI Runner] Verification Pass {current_attempt}...")
+                logger.debug("🔍 [UI Runner] Verification Pass %s...", current_attempt)
                 error_log, files = "", []
                 try:
                     data = json.loads(raw_content)
@@ -265,9 +265,9 @@ class UIComponentsRunner(BaseRunner):
                     
                     if not files:
                         error_log = "FATAL: Could not find project file array in AI response."
-                        print(f"❌ [UI Runner] {error_log}")
+                        logger.error("❌ [UI Runner] %s", error_log)
                     else:
-                        print(f"✅ [UI Runner] Successfully extracted {len(files)} files.")
+                        logger.debug("✅ [UI Runner] Successfully extracted %s files.", len(files))
 
                     # Path Normalization & Root Enforcement
                     for f in files:
@@ -310,7 +310,7 @@ class UIComponentsRunner(BaseRunner):
 
                 if not error_log: break
                 
-                print(f"⚠️ [UI Runner] Healing Phase (Attempt {current_attempt}/{max_attempts})...")
+                logger.warning("⚠️ [UI Runner] Healing Phase (Attempt %s/%s)...", current_attempt, max_attempts)
                 healing_prompt = (
                     f"STRICT FIX REQUIRED:\n{error_log}\n\n"
                     "Your previous response had errors. Ensure ALL mandatory files exist and JSON is complete. "
@@ -325,7 +325,7 @@ class UIComponentsRunner(BaseRunner):
                 
                 # Check for token issues during healing
                 if heal_res.get("finish_reason") == "length":
-                    print("⚠️ [UI Runner] CRITICAL: AI Token Limit Exceeded during healing")
+                    logger.warning("⚠️ [UI Runner] CRITICAL: AI Token Limit Exceeded during healing")
                     system_logs.append("⚠️ ERROR: AI response truncated during healing phase.")
 
                 raw_content = self._clean_json(heal_res.get("text", "").strip())
@@ -1,11 +1,16 @@
 """WhatsApp Input node runner."""
+import logging
 from typing import Dict, Any
 from app.runners.base_runner import BaseRunner
 
+logger = logging.getLogger(__name__)
+
 
 class WhatsAppInputRunner(BaseRunner):
     """Runner for WhatsApp Input node."""
     
+    execution_mode = "inline"
+    
     def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process WhatsApp input node.
@@ -17,11 +22,10 @@ class WhatsAppInputRunner(BaseRunner):
         # Extract digits only or strip JID suffix
         phone_number = "".join(filter(str.isdigit, sender.split("@")[0])) if sender else ""
         
-        print(f"\n📱 [WHATSAPP INPUT] Debug Info:")
-        print(f"   - State keys: {list(state.keys())}")
-        print(f"   - from field: {state.get('from')}")
-        print(f"   - whatsapp_jid field: {state.get('whatsapp_jid')}")
-        print(f"   - Extracted phone_number: {phone_number}")
+        logger.debug(
+            "📱 [WHATSAPP INPUT] from=%s whatsapp_jid=%s phone_number=%s",
+            state.get("from"), state.get("whatsapp_jid"), phone_number
+        )
         
         return {
             "whats_app_input": user_input,
@@ -7,7 +7,7 @@ logger = logging.getLogger(__name__)
 class WhatsAppRunner:
     """Runner for sending messages via WhatsApp."""
     
-    def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
+    async def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute the WhatsApp output node.
         """
@@ -29,12 +29,12 @@ class WhatsAppRunner:
             
         if not to or not message:
             # print(f"⚠️ [DEBUG] WhatsApp send failed: Missing recipient ({to}) or message (len: {len(message) if message else 0})")
-            logger.warning(f"⚠️ WhatsApp send failed: Missing recipient ({to}) or message ({message})")
+            logger.warning("⚠️ WhatsApp send failed: Missing recipient (%s) or message (%s chars)", to, len(message or ""))
             return {"error": "Missing recipient or message"}
 
         # print(f"📤 [DEBUG] Sending WhatsApp message to {to} via service...")
-        logger.info(f"📤 Sending WhatsApp message to {to}")
-        success = whatsapp_service.send_message(to, message)
+        logger.debug("📤 Sending WhatsApp message to %s", to)
+        success = await whatsapp_service.send(to, message)
         
         # print(f"📡 [DEBUG] WhatsApp Service send result: {success}")
         if success:
@@ -11,6 +11,8 @@ class XPathHelperRunner(BaseRunner):
     Runner that extracts data from HTML content using XPath expressions.
     """
     
+    cache_reads = ("page_content", "output", "html_content")
+    
     async def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
         """
         Extract data from HTML.
@@ -65,7 +67,7 @@ class XPathHelperRunner(BaseRunner):
                         results[name] = extracted_values
                         
                 except Exception as e:
-                    logger.error(f"Error extracting field '{name}' with XPath '{xpath}': {e}")
+                    logger.error("Error extracting field '%s' with XPath '%s': %s", name, xpath, e)
                     results[name] = f"Error: {str(e)}"
 
             # Prepare output
@@ -86,7 +88,7 @@ class XPathHelperRunner(BaseRunner):
             }
                 
         except Exception as e:
-            logger.error(f"XPathHelperRunner Error: {str(e)}")
+            logger.error("XPathHelperRunner Error: %s", e)
             return {"output": f"Extraction Error: {str(e)}", "status": "error"}
 
 # Global instance for registration if needed or just class
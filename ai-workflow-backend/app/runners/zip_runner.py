@@ -1,3 +1,4 @@
+import logging
 import os
 import zipfile
 import tempfile
@@ -6,9 +7,13 @@ from datetime import datetime
 from typing import Dict, Any, List
 from app.runners.base_runner import BaseRunner
 
+logger = logging.getLogger(__name__)
+
 class ZipRunner(BaseRunner):
     """Runner for Zipping and Unzipping files and folders."""
     
+    execution_mode = "cpu"
+    
     def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
         mode = node_data.get("mode", "compress")
         output_name = node_data.get("filename", f"project_{int(datetime.now().timestamp())}.zip")
@@ -42,7 +47,7 @@ class ZipRunner(BaseRunner):
                             parsed = json.loads(candidate)
                             if isinstance(parsed, list) and len(parsed) > 0 and "path" in parsed[0]:
                                 project_data = parsed
-                                print(f"🩹 [Zip Utility] Recovered project structure from state key: {key}")
+                                logger.debug("🩹 [Zip Utility] Recovered project structure from state key: %s", key)
                                 break
                         except: pass
 
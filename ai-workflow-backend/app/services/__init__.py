@@ -1,13 +1,27 @@
-"""Services package."""
-from app.services.llm_service import llm_service, LLMService
-from app.services.elasticsearch_service import elasticsearch_service, ElasticsearchService
-from app.services.flow_executor import flow_executor, FlowExecutor
-
-__all__ = [
-    "llm_service",
-    "LLMService",
-    "elasticsearch_service",
-    "ElasticsearchService",
-    "flow_executor",
-    "FlowExecutor"
-]
+"""Services package.
+
+Service modules create clients (OpenAI, Elasticsearch) at import time, so they
+are imported lazily on first attribute access instead of with the package.
+"""
+import importlib
+
+_LAZY_EXPORTS = {
+    "llm_service": ("app.services.llm_service", "llm_service"),
+    "LLMService": ("app.services.llm_service", "LLMService"),
+    "elasticsearch_service": ("app.services.elasticsearch_service", "elasticsearch_service"),
+    "ElasticsearchService": ("app.services.elasticsearch_service", "ElasticsearchService"),
+    "flow_executor": ("app.services.flow_executor", "flow_executor"),
+    "FlowExecutor": ("app.services.flow_executor", "FlowExecutor"),
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    """Import services on first access (PEP 562)."""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = _LAZY_EXPORTS[name]
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
@@ -0,0 +1,56 @@
+"""Short-lived store for large run outputs that the event stream sends by reference."""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+from app.config import settings
+
+
+class ArtifactStore:
+    """In-memory LRU of artifacts keyed by run and content hash, bounded by total bytes and TTL."""
+
+    def __init__(self, max_bytes: int, ttl: float):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._items: "OrderedDict[str, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def put(self, run_id: str, content: bytes, media_type: str) -> str:
+        """Store content for a run and return its artifact id (identical content is stored once)."""
+        artifact_id = hashlib.sha256(content).hexdigest()[:32]
+        key = f"{run_id}/{artifact_id}"
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                return artifact_id
+            self._items[key] = (content, media_type, time.time() + self.ttl)
+            self._bytes += len(content)
+            while self._bytes > self.max_bytes and len(self._items) > 1:
+                _, (evicted, _, _) = self._items.popitem(last=False)
+                self._bytes -= len(evicted)
+        return artifact_id
+
+    def get(self, run_id: str, artifact_id: str) -> Optional[Tuple[bytes, str]]:
+        """Content and media type of an artifact, or None if unknown or expired."""
+        key = f"{run_id}/{artifact_id}"
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            content, media_type, expires_at = item
+            if expires_at < time.time():
+                del self._items[key]
+                self._bytes -= len(content)
+                return None
+            return content, media_type
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"artifacts": len(self._items), "bytes": self._bytes, "max_bytes": self.max_bytes}
+
+
+# Global artifact store
+artifact_store = ArtifactStore(settings.artifact_store_max_mb * 1024 * 1024, settings.artifact_ttl)
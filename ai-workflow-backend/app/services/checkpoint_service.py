@@ -0,0 +1,209 @@
+"""Persists per-node run checkpoints so failed runs can resume."""
+import asyncio
+import json
+import logging
+from typing import Dict, Any, List, Optional
+
+from sqlalchemy import update
+
+from app.config import settings
+from app.models import RunCheckpoint, SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# State entries rebuilt for every run and never worth persisting
+TRANSIENT_STATE_KEYS = {"background_tasks", "flow_run_id", "run_id"}
+
+
+def _mark(value: Any) -> tuple:
+    # Values grown in place (logs, cumulative_html) keep their identity but change length
+    return id(value), len(value) if isinstance(value, (list, dict, str)) else None
+
+
+class _TrackedRun:
+    """A run being checkpointed: its graph and input, and its state as last recorded."""
+
+    __slots__ = ("flow_data", "input_message", "state", "marks")
+
+    def __init__(self, flow_data: Dict[str, Any], input_message: str):
+        self.flow_data = flow_data
+        self.input_message = input_message or ""
+        self.state: Dict[str, Any] = {}  # JSON-serializable entries, copied when they changed
+        self.marks: Dict[str, tuple] = {}
+
+
+class CheckpointService:
+    """
+    Reads and writes the latest RunCheckpoint of a flow run.
+
+    ``record`` never waits: it re-checks only the state entries that changed
+    since the run's previous checkpoint and queues the result, replacing any
+    checkpoint of the run still waiting. A background task writes what is
+    queued every ``batch_delay`` seconds in one transaction on a worker
+    thread; a run's graph and input go out only with its first checkpoint.
+    """
+
+    def __init__(self, batch_delay: float):
+        self.batch_delay = batch_delay
+        self._runs: Dict[int, _TrackedRun] = {}
+        self._pending: Dict[int, Dict[str, Any]] = {}
+        self._writing: set = set()
+        self._waiters: Dict[int, List[asyncio.Future]] = {}
+        self._task = None
+        self._wake = None
+        self._flush_now = None
+        self.batches = 0
+        self.rows = 0
+        self.errors = 0
+
+    def track(self, flow_run_id: int, flow_data: Dict[str, Any], input_message: str):
+        """Start checkpointing a run (a resumed run already has its checkpoint row)."""
+        self._runs[flow_run_id] = _TrackedRun(flow_data, input_message)
+
+    def forget(self, flow_run_id: int):
+        """Stop tracking a run; a checkpoint it still has queued is written."""
+        self._runs.pop(flow_run_id, None)
+
+    def record(self, flow_run_id: int, state: Dict[str, Any], completed_nodes: List[str],
+               inactive_nodes: List[str], failed_nodes: List[str]):
+        """Queue the run's checkpoint (call on the event loop the run executes on)."""
+        run = self._runs.get(flow_run_id)
+        if run is None:
+            return
+        for key in [key for key in run.marks if key not in state]:
+            del run.marks[key]
+            run.state.pop(key, None)
+        for key, value in state.items():
+            if key in TRANSIENT_STATE_KEYS:
+                continue
+            mark = _mark(value)
+            if run.marks.get(key) == mark:
+                continue
+            run.marks[key] = mark
+            # Copied so nodes still running cannot change it while it is written
+            if isinstance(value, list):
+                value = list(value)
+            elif isinstance(value, dict):
+                value = dict(value)
+            try:
+                json.dumps(value)
+            except (TypeError, ValueError):
+                run.state.pop(key, None)
+                continue
+            run.state[key] = value
+        self._pending[flow_run_id] = {
+            "flow_data": run.flow_data,
+            "input_message": run.input_message,
+            "state": dict(run.state),
+            "completed_nodes": completed_nodes,
+            "inactive_nodes": inactive_nodes,
+            "failed_nodes": failed_nodes
+        }
+        self._kick()
+
+    async def flush(self, flow_run_id: int):
+        """Wait until the run's queued checkpoint is written."""
+        if flow_run_id not in self._pending and flow_run_id not in self._writing:
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(flow_run_id, []).append(future)
+        self._kick()
+        self._flush_now.set()
+        await future
+
+    async def close(self):
+        """Write every queued checkpoint (at shutdown)."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            await asyncio.to_thread(self._write, batch)
+
+    def _kick(self):
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._wake = asyncio.Event()
+            self._flush_now = asyncio.Event()
+            self._task = loop.create_task(self._run())
+        self._wake.set()
+
+    async def _run(self):
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            if not self._waiters:
+                # Later checkpoints of the same runs replace earlier ones meanwhile
+                try:
+                    await asyncio.wait_for(self._flush_now.wait(), self.batch_delay)
+                except asyncio.TimeoutError:
+                    pass
+            self._flush_now.clear()
+            batch, self._pending = self._pending, {}
+            if not batch:
+                continue
+            self._writing = set(batch)
+            try:
+                await asyncio.to_thread(self._write, batch)
+            except Exception as e:
+                # Best effort, as before: the run's next checkpoint is written in full
+                self.errors += 1
+                logger.error("❌ Failed to checkpoint %d runs: %s", len(batch), e, exc_info=True)
+            finally:
+                self._writing = set()
+            for run_id in batch:
+                if run_id in self._pending:
+                    continue
+                for waiter in self._waiters.pop(run_id, []):
+                    if not waiter.done():
+                        waiter.set_result(None)
+            if self._pending:
+                self._wake.set()
+
+    def _write(self, batch: Dict[int, Dict[str, Any]]):
+        """Upsert a batch of checkpoints in one transaction (runs on a worker thread)."""
+        with SessionLocal() as db:
+            ids = dict(db.query(RunCheckpoint.flow_run_id, RunCheckpoint.id).filter(RunCheckpoint.flow_run_id.in_(list(batch))))
+            progress = ("state", "completed_nodes", "inactive_nodes", "failed_nodes")
+            updates = [
+                {"id": ids[run_id], **{k: checkpoint[k] for k in progress}}
+                for run_id, checkpoint in batch.items() if run_id in ids
+            ]
+            if updates:
+                db.execute(update(RunCheckpoint), updates)
+            db.add_all([
+                RunCheckpoint(flow_run_id=run_id, **checkpoint)
+                for run_id, checkpoint in batch.items() if run_id not in ids
+            ])
+            db.commit()
+        self.batches += 1
+        self.rows += len(batch)
+
+    def load(self, flow_run_id: int) -> Optional[Dict[str, Any]]:
+        """Latest checkpoint of a run as a plain dict, or None."""
+        with SessionLocal() as db:
+            checkpoint = db.query(RunCheckpoint).filter(RunCheckpoint.flow_run_id == flow_run_id).first()
+            if checkpoint is None:
+                return None
+            return {
+                "flow_data": checkpoint.flow_data,
+                "input": checkpoint.input_message,
+                "state": checkpoint.state or {},
+                "completed_nodes": checkpoint.completed_nodes or [],
+                "inactive_nodes": checkpoint.inactive_nodes or [],
+                "failed_nodes": checkpoint.failed_nodes or []
+            }
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "tracked_runs": len(self._runs),
+            "pending": len(self._pending),
+            "batches": self.batches,
+            "rows": self.rows,
+            "errors": self.errors
+        }
+
+
+# Global checkpoint service
+checkpoint_service = CheckpointService(settings.checkpoint_write_ms / 1000)
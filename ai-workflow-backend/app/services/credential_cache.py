@@ -0,0 +1,129 @@
+"""In-process cache of decrypted credentials."""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, Optional
+
+from app.config import settings
+from app.models import Credential, SessionLocal
+from app.services.encryption_service import encryption_service
+
+logger = logging.getLogger(__name__)
+
+
+def _credential_key(credential_id: Any) -> Optional[int]:
+    """Credential IDs arrive as ints or numeric strings from node data."""
+    try:
+        return int(credential_id)
+    except (TypeError, ValueError):
+        return None
+
+
+class CredentialCache:
+    """
+    Decrypted credential values by credential ID, bounded by size and TTL.
+
+    The cache's own copy of each secret is a bytearray overwritten with zeros
+    when its entry expires, is evicted or invalidated. Only that copy is
+    wiped: every hit returns a fresh immutable ``str``, and neither those nor
+    the ``str`` decrypted by encryption_service can be zeroed, so they stay
+    in memory until garbage-collected.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._items: "OrderedDict[int, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        # Bumped by invalidate() so a prefetch racing an update cannot store the old value
+        self._generation = 0
+
+    def get(self, credential_id: Any) -> Optional[str]:
+        """Cached plaintext of a credential, or None if absent or expired."""
+        secret = self._lookup(_credential_key(credential_id))
+        with self._lock:
+            if secret is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return secret
+
+    def _lookup(self, key: Optional[int]) -> Optional[str]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            secret, expires_at = item
+            if expires_at < time.monotonic():
+                self._drop(key)
+                return None
+            self._items.move_to_end(key)
+            return secret.decode("utf-8")
+
+    def put(self, credential_id: Any, plaintext: str, generation: int = None):
+        key = _credential_key(credential_id)
+        if key is None or self.max_entries <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._drop(key)
+            self._items[key] = (bytearray(plaintext.encode("utf-8")), time.monotonic() + self.ttl)
+            while len(self._items) > self.max_entries:
+                self._drop(next(iter(self._items)))
+
+    def invalidate(self, credential_id: Any):
+        """Forget a credential, e.g. after it was updated or deleted."""
+        with self._lock:
+            self._generation += 1
+            self._drop(_credential_key(credential_id))
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._items):
+                self._drop(key)
+
+    def _drop(self, key: Optional[int]):
+        item = self._items.pop(key, None)
+        if item is not None:
+            secret = item[0]
+            secret[:] = bytes(len(secret))
+
+    def prefetch(self, credential_ids: Iterable[Any]):
+        """Load every uncached credential of a flow in one query (blocking; call from a worker thread)."""
+        with self._lock:
+            generation = self._generation
+            now = time.monotonic()
+            missing = {
+                key for key in (_credential_key(c) for c in credential_ids)
+                if key is not None and (key not in self._items or self._items[key][1] < now)
+            }
+        if not missing:
+            return
+        with SessionLocal() as db:
+            rows = db.query(Credential.id, Credential.encrypted_value).filter(Credential.id.in_(missing)).all()
+        for credential_id, encrypted_value in rows:
+            try:
+                self.put(credential_id, encryption_service.decrypt(encrypted_value), generation)
+            except ValueError as e:
+                logger.error("❌ Error decrypting credential %s: %s", credential_id, e)
+
+    def load(self, credential_id: Any) -> Optional[str]:
+        """Plaintext of one credential, from the cache or the database (blocking; not counted, callers come from a counted get())."""
+        key = _credential_key(credential_id)
+        secret = self._lookup(key)
+        if secret is not None:
+            return secret
+        self.prefetch([credential_id])
+        return self._lookup(key)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._items), "hits": self.hits, "misses": self.misses}
+
+
+# Global credential cache
+credential_cache = CredentialCache(settings.credential_cache_max_entries, settings.credential_cache_ttl)
@@ -1,78 +1,220 @@
 """Customer service for WhatsApp bot tracking."""
+import asyncio
+import logging
+import threading
+import time
 from datetime import datetime
+from typing import Dict, Any, Optional
+
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models import SessionLocal
 from app.models.customer import WhatsAppCustomer
 
+logger = logging.getLogger(__name__)
+
 
 class CustomerService:
-    """Service for managing WhatsApp customer tracking."""
-    
-    @staticmethod
-    def check_customer_exists(db: Session, phone_number: str) -> bool:
+    """
+    Service for managing WhatsApp customer tracking.
+
+    Every customer's link status is held in memory, loaded with one scan on
+    first use and again once it is ``ttl`` seconds old, to pick up changes
+    from other processes. Between reloads a number missing from memory is
+    known not to be a customer, so first-contact checks never query the
+    database. ``mark_link_sent`` updates memory at once and queues the write;
+    called on an event loop, queued writes go out together every
+    ``flush_interval`` seconds (or once ``batch_size`` are queued) from a task
+    that runs only while writes wait, otherwise straight away. Stats come
+    from counters kept alongside.
+    """
+
+    def __init__(self, ttl: float, flush_interval: float, batch_size: int):
+        self.ttl = ttl
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._link_sent: Dict[str, bool] = {}  # Phone number -> link sent, for every customer
+        self._pending: Dict[str, Dict[str, Any]] = {}  # Phone number -> queued upsert
+        self._loaded_at: Optional[float] = None
+        self._total = 0
+        self._sent = 0
+        self._lock = threading.Lock()  # State above; callers may be request threads
+        self._write_lock = threading.Lock()  # One flush or reload at a time
+        self._wake = None
+        self._task = None
+        self.reloads = 0
+        self.flushes = 0
+        self.rows = 0
+        self.errors = 0
+
+    async def close(self):
+        """Stop the writer task and write what is still queued (at shutdown)."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await asyncio.to_thread(self.flush)
+
+    def _kick(self, full: bool):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop (scripts, request threads): nothing would write it later
+            self.flush()
+            return
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._wake = asyncio.Event()
+            self._task = loop.create_task(self._run())
+        if full:
+            self._wake.set()
+
+    async def _run(self):
+        while self._pending:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await asyncio.to_thread(self.flush)
+
+    def check_customer_exists(self, db: Session, phone_number: str) -> bool:
         """Check if customer already received link."""
-        customer = db.query(WhatsAppCustomer).filter(
-            WhatsAppCustomer.phone_number == phone_number
-        ).first()
-        
-        if customer and customer.link_sent:
-            return True
-        return False
-    
-    @staticmethod
-    def mark_link_sent(db: Session, phone_number: str, first_message: str = None, source: str = 'direct'):
-        """Mark that link was sent to this customer."""
-        customer = db.query(WhatsAppCustomer).filter(
-            WhatsAppCustomer.phone_number == phone_number
-        ).first()
-        
-        if customer:
-            # Update existing customer
-            customer.link_sent = True
-            customer.sent_at = datetime.now()
-            if first_message and not customer.first_message:
-                customer.first_message = first_message
-        else:
-            # Create new customer record
-            customer = WhatsAppCustomer(
-                phone_number=phone_number,
-                first_message=first_message,
-                link_sent=True,
-                sent_at=datetime.now(),
-                source=source
-            )
-            db.add(customer)
-        
-        db.commit()
-        return customer
-    
-    @staticmethod
-    def get_customer_stats(db: Session):
+        self._ensure_loaded(db)
+        return self._link_sent.get(phone_number, False)
+
+    def mark_link_sent(self, db: Session, phone_number: str, first_message: str = None, source: str = 'direct') -> bool:
+        """Mark that link was sent to this customer; returns False if it already had been (the row is written later)."""
+        self._ensure_loaded(db)
+        with self._lock:
+            known = phone_number in self._link_sent
+            already_sent = self._link_sent.get(phone_number, False)
+            self._link_sent[phone_number] = True
+            self._total += not known
+            self._sent += not already_sent
+            queued = self._pending.get(phone_number)
+            self._pending[phone_number] = {
+                "first_message": queued["first_message"] if queued and queued["first_message"] else first_message,
+                "source": queued["source"] if queued else source,
+                "sent_at": datetime.now()
+            }
+            pending = len(self._pending)
+        self._kick(pending >= self.batch_size)
+        return not already_sent
+
+    def get_customer_stats(self, db: Session):
         """Get statistics about customers."""
-        total_customers = db.query(WhatsAppCustomer).count()
-        links_sent = db.query(WhatsAppCustomer).filter(
-            WhatsAppCustomer.link_sent == True
-        ).count()
-        
+        self._ensure_loaded(db)
         return {
-            "total_customers": total_customers,
-            "links_sent": links_sent,
-            "pending": total_customers - links_sent
+            "total_customers": self._total,
+            "links_sent": self._sent,
+            "pending": self._total - self._sent
         }
-    
-    @staticmethod
-    def reset_customer(db: Session, phone_number: str):
+
+    def reset_customer(self, db: Session, phone_number: str):
         """Reset customer status (for testing or re-engagement)."""
+        # Written through: the row may only exist in the queue so far
+        self.flush()
         customer = db.query(WhatsAppCustomer).filter(
             WhatsAppCustomer.phone_number == phone_number
         ).first()
-        
+
         if customer:
             customer.link_sent = False
             customer.sent_at = None
             db.commit()
+            with self._lock:
+                if self._loaded_at is not None:
+                    self._sent -= self._link_sent.get(phone_number, False)
+                    self._total += phone_number not in self._link_sent
+                    self._link_sent[phone_number] = False
             return True
         return False
 
+    def flush(self):
+        """Write queued link updates: one lookup, then bulk updates and inserts in one transaction."""
+        with self._write_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return
+            try:
+                try:
+                    self._write(batch)
+                except IntegrityError:
+                    # Another process inserted one of these numbers first; it is an update now
+                    logger.info("🔁 Retrying customer batch after a concurrent insert")
+                    self._write(batch)
+            except Exception as e:
+                self.errors += 1
+                logger.error("❌ Failed to write %d customer updates: %s", len(batch), e, exc_info=True)
+                with self._lock:
+                    # Retried with the next flush; updates queued meanwhile are newer
+                    self._pending = {**batch, **self._pending}
+                return
+            self.flushes += 1
+            self.rows += len(batch)
+
+    def _write(self, batch: Dict[str, Dict[str, Any]]):
+        with SessionLocal() as db:
+            existing = {
+                row.phone_number: row for row in db.query(
+                    WhatsAppCustomer.id, WhatsAppCustomer.phone_number, WhatsAppCustomer.first_message
+                ).filter(WhatsAppCustomer.phone_number.in_(list(batch)))
+            }
+            updates = []
+            for phone_number, fields in batch.items():
+                row = existing.get(phone_number)
+                if row is None:
+                    continue
+                params = {"id": row.id, "link_sent": True, "sent_at": fields["sent_at"]}
+                if fields["first_message"] and not row.first_message:
+                    params["first_message"] = fields["first_message"]
+                updates.append(params)
+            if updates:
+                db.execute(update(WhatsAppCustomer), updates)
+            db.add_all([
+                WhatsAppCustomer(phone_number=phone_number, link_sent=True, **fields)
+                for phone_number, fields in batch.items() if phone_number not in existing
+            ])
+            db.commit()
+
+    def _ensure_loaded(self, db: Session):
+        if self._loaded_at is None or time.monotonic() - self._loaded_at > self.ttl:
+            self.load(db)
+
+    def load(self, db: Session):
+        """Reload every customer's link status with one scan (queued updates are written first)."""
+        self.flush()
+        # No flush during the scan, so nothing can leave the queue unseen by it
+        with self._write_lock:
+            link_sent = dict(db.query(WhatsAppCustomer.phone_number, WhatsAppCustomer.link_sent))
+            with self._lock:
+                # Marked while the scan ran, so newer than what it read
+                link_sent.update((phone_number, True) for phone_number in self._pending)
+                self._link_sent = link_sent
+                self._total = len(link_sent)
+                self._sent = sum(link_sent.values())
+                self._loaded_at = time.monotonic()
+            self.reloads += 1
+        logger.info("📇 Loaded %d WhatsApp customers", len(link_sent))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "customers": self._total,
+            "pending_writes": len(self._pending),
+            "reloads": self.reloads,
+            "flushes": self.flushes,
+            "rows": self.rows,
+            "errors": self.errors
+        }
+
 
 # Global instance
-customer_service = CustomerService()
+customer_service = CustomerService(
+    settings.customer_cache_ttl,
+    settings.customer_flush_ms / 1000,
+    settings.customer_flush_batch_size
+)
@@ -0,0 +1,158 @@
+"""Encoders for the flow execution event stream (SSE)."""
+import json
+from typing import Dict, Any
+
+from app.config import settings
+from app.services.artifact_store import artifact_store
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up; the stdlib encoder produces the same JSON
+    orjson = None
+
+VERBOSITY_LEVELS = ("minimal", "normal", "full")
+PROTOCOL_VERSIONS = (1, 2)
+
+# State entries the executor grows in place, so identity checks cannot tell if they changed
+ACCUMULATOR_KEYS = {"cumulative_html", "manual_steps"}
+
+# State entries clients read as structures (e.g. the IDE view's file contents), never replaced by artifact refs
+INLINE_KEYS = {"ide_data"}
+
+# Marker for state keys never sent to the client
+_UNSENT = object()
+
+
+def dumps(obj: Any) -> str:
+    """Serialize an event to compact JSON; unknown objects are rendered with str()."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, default=str, separators=(",", ":"), ensure_ascii=False)
+
+
+def restore_identity(event: Dict[str, Any], delivered: Dict[str, Any]):
+    """
+    Point final-state values equal to node results already delivered at those
+    same objects, for events rebuilt from a copy (another process, a cache),
+    so v2 encoders can still leave unchanged values out of "final".
+    """
+    if event.get("type") == "node_finish":
+        delivered.update(event.get("result") or {})
+    elif event.get("type") == "final" and delivered:
+        state = event.get("state") or {}
+        for key, value in delivered.items():
+            if key in state and state[key] is not value and state[key] == value:
+                state[key] = value
+
+
+class EventEncoder:
+    """
+    Protocol v1: events are sent as produced, with full node results and the
+    full final state.
+
+    ``last_event`` keeps the unreduced event so API code can inspect it
+    without parsing the encoded string again.
+    """
+
+    version = 1
+
+    def __init__(self, verbosity: str = "normal"):
+        self.verbosity = verbosity
+        self.run_id = None
+        self.last_event = None
+
+    def encode(self, event: Dict[str, Any]) -> str:
+        self.last_event = event
+        return dumps(self.reduce(event))
+
+    def reduce(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        if self.verbosity == "minimal" and event.get("type") == "node_finish" and "result" in event:
+            return {k: v for k, v in event.items() if k != "result"}
+        return event
+
+
+class CompactEventEncoder(EventEncoder):
+    """
+    Protocol v2: strings longer than ``inline_limit`` (outside INLINE_KEYS) are stored in the
+    artifact store and sent once as ``{"$ref": url, "bytes": n, "media_type": t}``,
+    and ``final`` only carries state entries the node results did not already deliver.
+    Logs are left to the client (rebuilt from node events) unless verbosity is ``full``.
+    """
+
+    version = 2
+
+    def __init__(self, verbosity: str = "normal", inline_limit: int = None):
+        super().__init__(verbosity)
+        self.inline_limit = inline_limit if inline_limit is not None else settings.sse_inline_limit
+        # State key -> value object the client last received for it
+        self._sent: Dict[str, Any] = {}
+        # id(value) -> (value, ref); the value is kept so its id cannot be reused
+        self._refs: Dict[int, tuple] = {}
+
+    def reduce(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        event_type = event.get("type")
+        full = self.verbosity == "full"
+
+        if event_type == "start":
+            return {**event, "v": self.version, "run_id": self.run_id}
+
+        if event_type == "node_finish" and "result" in event:
+            if self.verbosity == "minimal":
+                return {k: v for k, v in event.items() if k != "result"}
+            result = event["result"] or {}
+            self._sent.update(result)
+            return {**event, "result": result if full else {k: self._compact_entry(k, v) for k, v in result.items()}}
+
+        if event_type == "final":
+            state = event.get("state") or {}
+            diff = {
+                k: v if full else self._compact_entry(k, v) for k, v in state.items()
+                if k != "logs" and (k in ACCUMULATOR_KEYS or self._sent.get(k, _UNSENT) is not v)
+            }
+            reduced = {
+                "type": "final",
+                "v": self.version,
+                "output": event.get("output") if full else self._compact(event.get("output")),
+                "failed_nodes": event.get("failed_nodes", []),
+                "state": diff
+            }
+            if full:
+                reduced["logs"] = event.get("logs", [])
+            return reduced
+
+        if event_type == "error" and not full:
+            return {k: v for k, v in event.items() if k != "logs"}
+        return event
+
+    def _compact_entry(self, key: str, value: Any) -> Any:
+        return value if key in INLINE_KEYS else self._compact(value)
+
+    def _compact(self, value: Any, depth: int = 0) -> Any:
+        if isinstance(value, str):
+            return self._ref(value) if len(value) > self.inline_limit else value
+        # Large strings nested a few levels deep (e.g. cumulative_html[i]["content"])
+        if depth < 3 and isinstance(value, dict):
+            return {k: self._compact(v, depth + 1) for k, v in value.items()}
+        if depth < 3 and isinstance(value, list):
+            return [self._compact(v, depth + 1) for v in value]
+        return value
+
+    def _ref(self, value: str) -> Dict[str, Any]:
+        cached = self._refs.get(id(value))
+        if cached is not None and cached[0] is value:
+            return cached[1]
+        content = value.encode("utf-8")
+        media_type = "text/html" if value.lstrip()[:1] == "<" else "text/plain"
+        artifact_id = artifact_store.put(self.run_id, content, media_type)
+        ref = {"$ref": f"/api/runs/{self.run_id}/artifacts/{artifact_id}", "bytes": len(content), "media_type": media_type}
+        self._refs[id(value)] = (value, ref)
+        return ref
+
+
+def make_encoder(protocol: int = 1, verbosity: str = "normal") -> EventEncoder:
+    """Encoder for a protocol version and verbosity; raises ValueError for unknown values."""
+    if protocol not in PROTOCOL_VERSIONS:
+        raise ValueError(f"Unsupported event protocol {protocol}; use one of {PROTOCOL_VERSIONS}")
+    if verbosity not in VERBOSITY_LEVELS:
+        raise ValueError(f"Unsupported verbosity '{verbosity}'; use one of {VERBOSITY_LEVELS}")
+    return CompactEventEncoder(verbosity) if protocol == 2 else EventEncoder(verbosity)
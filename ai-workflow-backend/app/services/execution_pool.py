@@ -0,0 +1,311 @@
+"""Runs flows in worker processes so CPU-heavy nodes do not compete with the API process."""
+import asyncio
+import atexit
+import itertools
+import json
+import logging
+import multiprocessing
+import pickle
+import signal
+import sys
+import threading
+from typing import Dict, Any, List, Optional
+
+from app.config import settings
+from app.services.credential_cache import credential_cache
+from app.services.event_protocol import EventEncoder, dumps, restore_identity
+from app.services.flow_executor import flow_executor
+from app.services.tracing import RunTrace, NULL_TRACE
+
+logger = logging.getLogger(__name__)
+
+# Each worker is connected by a duplex pipe carrying pickled tuples:
+#   API -> worker: ("run", job_id, kwargs), ("cancel", job_id), ("invalidate_credential", id),
+#                  ("invalidate_plan", flow_id), ("stop",)
+#   worker -> API: (job_id, "event", run_id, event), (job_id, "done", profile), (job_id, "error", message)
+
+
+class _CaptureEncoder(EventEncoder):
+    """Hands events back unencoded; the API process encodes them for its client."""
+
+    def encode(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        self.last_event = event
+        return event
+
+
+class _WorkerLoop:
+    """Event loop of one worker process: runs the jobs it is sent concurrently."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.jobs: Dict[int, asyncio.Task] = {}
+
+    async def serve(self):
+        loop = asyncio.get_running_loop()
+        inbox: asyncio.Queue = asyncio.Queue()
+        threading.Thread(target=self._read, args=(loop, inbox), name="flow-worker-inbox", daemon=True).start()
+        while True:
+            message = await inbox.get()
+            kind = message[0]
+            if kind == "run":
+                _, job_id, kwargs = message
+                task = asyncio.create_task(self._run(job_id, kwargs))
+                self.jobs[job_id] = task
+                task.add_done_callback(lambda _, job_id=job_id: self.jobs.pop(job_id, None))
+            elif kind == "cancel":
+                task = self.jobs.get(message[1])
+                if task is not None:
+                    task.cancel()
+            elif kind == "invalidate_credential":
+                credential_cache.invalidate(message[1])
+            elif kind == "invalidate_plan":
+                flow_executor.plans.invalidate(message[1])
+            elif kind == "stop":
+                break
+        for task in list(self.jobs.values()):
+            task.cancel()
+        await asyncio.gather(*self.jobs.values(), return_exceptions=True)
+
+    def _read(self, loop: asyncio.AbstractEventLoop, inbox: asyncio.Queue):
+        while True:
+            try:
+                message = pickle.loads(self.conn.recv_bytes())
+            except (EOFError, OSError):
+                # The API process went away
+                message = ("stop",)
+            loop.call_soon_threadsafe(inbox.put_nowait, message)
+            if message[0] == "stop":
+                return
+
+    async def _run(self, job_id: int, kwargs: Dict[str, Any]):
+        encoder = _CaptureEncoder()
+        profile, trace_log = kwargs.pop("profile"), kwargs.pop("trace_log")
+        trace = RunTrace(log=trace_log) if profile else None
+        try:
+            async for event in flow_executor.execute(encoder=encoder, trace=trace, **kwargs):
+                self._send((job_id, "event", encoder.run_id, event))
+            self._send((job_id, "done", trace.summary() if trace is not None else None))
+        except asyncio.CancelledError:
+            # Cancelled by the API process; nobody is listening any more
+            raise
+        except Exception as e:
+            logger.error("❌ Worker job %s failed: %s", job_id, e, exc_info=True)
+            self._send((job_id, "error", str(e)))
+
+    def _send(self, message: tuple):
+        try:
+            payload = pickle.dumps(message, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # State holding objects that cannot be pickled is sent the way the client would see it
+            payload = pickle.dumps((*message[:3], json.loads(dumps(message[3]))), pickle.HIGHEST_PROTOCOL)
+        self.conn.send_bytes(payload)
+
+
+def _worker_main(index: int, conn):
+    """Entry point of a worker process."""
+    # Ctrl+C reaches the whole process group; the API process stops its workers itself
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    logging.basicConfig(
+        level=settings.log_level.upper(),
+        format=f'%(asctime)s - worker-{index} - %(name)s - %(levelname)s - %(message)s'
+    )
+    from app.services.tracing import install_queue_logging
+    install_queue_logging()
+    if sys.platform == 'win32':
+        # Playwright needs the Proactor loop, as in the API process
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    asyncio.run(_WorkerLoop(conn).serve())
+
+
+class _Worker:
+    """API-side handle of one worker process."""
+
+    def __init__(self, index: int, context):
+        self.index = index
+        self.conn, child_conn = context.Pipe()
+        # Not a daemon: workers may start their own runner process pools
+        self.process = context.Process(target=_worker_main, args=(index, child_conn), name=f"flow-worker-{index}")
+        self.process.start()
+        child_conn.close()
+        self.jobs = set()
+        self.completed = 0
+
+    def send(self, message: tuple) -> bool:
+        try:
+            self.conn.send_bytes(pickle.dumps(message, pickle.HIGHEST_PROTOCOL))
+            return True
+        except (OSError, ValueError):
+            return False
+
+
+class ExecutionPool:
+    """
+    Executes flows in ``size`` worker processes, each running several runs
+    concurrently on its own event loop, so CPU-bound nodes (PDF extraction,
+    table rendering, document generation) scale with cores instead of sharing
+    the API process's GIL.
+
+    ``execute`` has the signature of ``FlowExecutor.execute``: runs go to the
+    least busy worker and its events are relayed back and encoded here, so
+    protocol encoders and the artifact store stay in the API process. With
+    ``size`` 0 (the default) or before ``start``, runs execute in-process.
+
+    Per-process caches (plans, credentials, node results) live in each
+    worker; invalidations are forwarded with ``invalidate_plan`` and
+    ``invalidate_credential``. FastAPI background tasks cannot cross the
+    process boundary, so runners in a worker perform such work inline.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._workers: List[_Worker] = []
+        self._jobs: Dict[int, asyncio.Queue] = {}
+        self._job_ids = itertools.count(1)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._context = None
+        self._stopping = False
+
+    @property
+    def started(self) -> bool:
+        return bool(self._workers)
+
+    def start(self):
+        """Spawn the worker processes (call from the API event loop, e.g. at startup)."""
+        if self.size <= 0 or self._workers:
+            return
+        self._loop = asyncio.get_running_loop()
+        # Spawn, not fork: the API process already runs threads (logging, runner pools, the bridge)
+        self._context = multiprocessing.get_context("spawn")
+        self._stopping = False
+        self._workers = [self._spawn(index) for index in range(self.size)]
+        # Workers are not daemons, so stop them before multiprocessing waits for them at exit
+        atexit.register(self.shutdown)
+        logger.info("⚙️ Started %d flow worker processes", self.size)
+
+    def _spawn(self, index: int) -> _Worker:
+        worker = _Worker(index, self._context)
+        threading.Thread(target=self._read, args=(worker,), name=f"flow-worker-{index}-reader", daemon=True).start()
+        return worker
+
+    def _read(self, worker: _Worker):
+        while True:
+            try:
+                message = pickle.loads(worker.conn.recv_bytes())
+            except (EOFError, OSError):
+                self._loop.call_soon_threadsafe(self._worker_exited, worker)
+                return
+            self._loop.call_soon_threadsafe(self._deliver, message)
+
+    def _deliver(self, message: tuple):
+        events = self._jobs.get(message[0])
+        if events is not None:
+            events.put_nowait(message)
+
+    def _worker_exited(self, worker: _Worker):
+        if self._stopping or self._workers[worker.index] is not worker:
+            return
+        logger.error("❌ Flow worker %d (pid %s) exited; restarting it", worker.index, worker.process.pid)
+        for job_id in list(worker.jobs):
+            self._deliver((job_id, "error", "Flow worker process exited unexpectedly"))
+        self._workers[worker.index] = self._spawn(worker.index)
+
+    async def execute(self, flow_data: Dict[str, Any], user_input: str, initial_state: Dict[str, Any] = None, background_tasks=None, flow_run_id=None, max_concurrency: int = None, flow_id: int = None, resume: Dict[str, Any] = None, timeout: float = None, encoder: EventEncoder = None, trace=None):
+        """Execute a flow in a worker process (or in-process when the pool is off), yielding encoded events."""
+        if not self.started:
+            async for event_json in flow_executor.execute(
+                flow_data, user_input, initial_state=initial_state, background_tasks=background_tasks,
+                flow_run_id=flow_run_id, max_concurrency=max_concurrency, flow_id=flow_id, resume=resume,
+                timeout=timeout, encoder=encoder, trace=trace
+            ):
+                yield event_json
+            return
+
+        encoder = encoder or EventEncoder()
+        trace = trace or NULL_TRACE
+        job_id = next(self._job_ids)
+        events: asyncio.Queue = asyncio.Queue()
+        worker = min(self._workers, key=lambda w: len(w.jobs))
+        self._jobs[job_id] = events
+        worker.jobs.add(job_id)
+        finished = False
+        # Node results already sent, so v2 encoders can still leave unchanged values out of "final"
+        delivered: Dict[str, Any] = {}
+        try:
+            if not worker.send(("run", job_id, {
+                "flow_data": flow_data,
+                "user_input": user_input,
+                "initial_state": initial_state,
+                "flow_run_id": flow_run_id,
+                "max_concurrency": max_concurrency,
+                "flow_id": flow_id,
+                "resume": resume,
+                "timeout": timeout,
+                "profile": trace.sampled,
+                "trace_log": getattr(trace, "log", False)
+            })):
+                raise RuntimeError(f"Flow worker {worker.index} is not accepting runs")
+            while True:
+                message = await events.get()
+                kind = message[1]
+                if kind == "event":
+                    _, _, run_id, event = message
+                    encoder.run_id = run_id
+                    if encoder.version > 1:
+                        restore_identity(event, delivered)
+                    yield encoder.encode(event)
+                elif kind == "done":
+                    finished = True
+                    if message[2] is not None and trace.sampled:
+                        trace.adopt(message[2])
+                    return
+                else:
+                    finished = True
+                    yield encoder.encode({"type": "error", "message": message[2], "logs": []})
+                    return
+        finally:
+            self._jobs.pop(job_id, None)
+            worker.jobs.discard(job_id)
+            worker.completed += 1
+            if not finished:
+                # Client went away: stop the run's in-flight nodes in the worker
+                worker.send(("cancel", job_id))
+
+    def invalidate_plan(self, flow_id: int):
+        """Drop a saved flow's compiled plan in every worker."""
+        for worker in self._workers:
+            worker.send(("invalidate_plan", flow_id))
+
+    def invalidate_credential(self, credential_id: int):
+        """Forget a decrypted credential in every worker."""
+        for worker in self._workers:
+            worker.send(("invalidate_credential", credential_id))
+
+    def shutdown(self, timeout: float = 5.0):
+        """Stop the workers, cancelling the runs they still have."""
+        self._stopping = True
+        for worker in self._workers:
+            worker.send(("stop",))
+        for worker in self._workers:
+            worker.process.join(timeout)
+            if worker.process.is_alive():
+                worker.process.terminate()
+            worker.conn.close()
+        self._workers = []
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": self.size,
+            "workers": [
+                {
+                    "pid": worker.process.pid,
+                    "alive": worker.process.is_alive(),
+                    "active": len(worker.jobs),
+                    "completed": worker.completed
+                }
+                for worker in self._workers
+            ]
+        }
+
+
+# Global execution pool
+execution_pool = ExecutionPool(settings.execution_workers)
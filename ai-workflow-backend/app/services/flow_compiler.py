@@ -0,0 +1,253 @@
+"""Compiled execution plans for flows, cached by flow content."""
+import copy
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Callable
+
+logger = logging.getLogger(__name__)
+
+# Scope id of nodes that are not inside any loop body
+TOP_SCOPE = -1
+
+# Node types whose "each" handle starts a loop body
+LOOP_NODE_TYPES = {"loop"}
+
+
+class CompiledFlow:
+    """
+    Index-based execution plan for one version of a flow.
+
+    Nodes are addressed by integer index; ``successors[i]`` and ``handles[i]``
+    are parallel arrays describing the outgoing edges of node ``i``. Plans are
+    shared between runs and must be treated as read-only.
+    
+    Loop bodies (everything reachable from a loop node's "each" handle) form
+    their own scope: ``scope[i]`` is the index of the innermost loop containing
+    node ``i`` (or TOP_SCOPE), and edges only connect nodes of the same scope,
+    so a loop looks like a single node to the scope around it.
+    """
+
+    def __init__(self, content_hash: str, node_ids: List[str], node_types: List[str],
+                 node_data: List[Dict[str, Any]], runners: List[Any],
+                 successors: List[List[int]], handles: List[List[Optional[str]]],
+                 indegree: List[int], roots: List[int], scope: List[int] = None,
+                 loop_bodies: Dict[int, List[int]] = None, loop_roots: Dict[int, List[int]] = None):
+        self.content_hash = content_hash
+        self.node_ids = node_ids
+        self.node_types = node_types
+        self.node_data = node_data
+        self.runners = runners
+        self.successors = successors
+        self.handles = handles
+        self.indegree = indegree
+        self.roots = roots
+        self.scope = scope if scope is not None else [TOP_SCOPE] * len(node_ids)
+        self.loop_bodies = loop_bodies or {}
+        self.loop_roots = loop_roots or {}
+        self.index = {nid: i for i, nid in enumerate(node_ids)}
+        # Credentials any node references, prefetched together at the start of a run
+        self.credential_ids = sorted({str(d["credentialId"]) for d in node_data if d.get("credentialId")})
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+
+def flow_content_hash(flow_data: Dict[str, Any]) -> str:
+    """Stable hash of a flow's nodes and edges."""
+    payload = json.dumps(flow_data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def compile_flow(flow_data: Dict[str, Any], runner_lookup: Callable[[str], Any], content_hash: str = None) -> CompiledFlow:
+    """Build a CompiledFlow from raw ``{nodes, edges}`` flow data."""
+    nodes = flow_data.get("nodes", [])
+    edges = flow_data.get("edges", [])
+
+    unique_nodes = {}
+    for n in nodes:
+        nid = str(n.get("id", ""))
+        if nid in unique_nodes:
+            logger.warning(f"⚠️ Duplicate node ID detected: {nid}. Using last occurrence.")
+        unique_nodes[nid] = n
+
+    node_ids = list(unique_nodes.keys())
+    index = {nid: i for i, nid in enumerate(node_ids)}
+    node_types = [unique_nodes[nid].get("type", "unknown") for nid in node_ids]
+    # Deep copy so runs never see later mutations of the caller's flow_data
+    node_data = [copy.deepcopy(unique_nodes[nid].get("data") or {}) for nid in node_ids]
+    runners = [runner_lookup(node_type) for node_type in node_types]
+
+    raw_edges = []
+
+    # Only include edges between existing nodes
+    for edge in edges:
+        source, target = str(edge.get("source", "")), str(edge.get("target", ""))
+        if source not in index or target not in index:
+            logger.warning(f"⚠️ Skipping dangling edge: {source} -> {target}")
+            continue
+        # Robustness: Skip self-loops to avoid deadlocks
+        if source == target:
+            logger.warning(f"⚠️ Skipping self-loop edge: {source} -> {target}")
+            continue
+
+        handle = edge.get("sourceHandle") or edge.get("targetHandle")
+        raw_edges.append((index[source], index[target], str(handle).lower() if handle else None))
+
+    scope = _assign_scopes(node_types, raw_edges)
+
+    successors = [[] for _ in node_ids]
+    handles = [[] for _ in node_ids]
+    indegree = [0] * len(node_ids)
+    for src, dst, handle in raw_edges:
+        # Lift both ends to their closest common scope; a body node then stands
+        # for its enclosing loop, so edges leaving a body wait for the whole loop
+        common = _common_scope(scope, src, dst)
+        src_lifted, dst_lifted = _lift(scope, src, common), _lift(scope, dst, common)
+        if src_lifted == dst_lifted:
+            # "each" edges into the body and back-edges from the body to its loop
+            continue
+        successors[src_lifted].append(dst_lifted)
+        handles[src_lifted].append(handle if src_lifted == src else None)
+        indegree[dst_lifted] += 1
+
+    def scope_roots(s):
+        return sorted((i for i in range(len(node_ids)) if scope[i] == s and indegree[i] == 0), key=lambda i: node_ids[i])
+
+    roots = scope_roots(TOP_SCOPE)
+    loop_bodies = {}
+    loop_roots = {}
+    for i, node_type in enumerate(node_types):
+        if node_type in LOOP_NODE_TYPES:
+            loop_bodies[i] = [j for j in range(len(node_ids)) if scope[j] == i]
+            loop_roots[i] = scope_roots(i)
+
+    logger.info(f"📊 Compiled flow {content_hash[:12] if content_hash else ''}: {len(node_ids)} nodes, {sum(indegree)} edges, {len(loop_bodies)} loops, roots={[node_ids[i] for i in roots]}")
+
+    return CompiledFlow(
+        content_hash=content_hash,
+        node_ids=node_ids,
+        node_types=node_types,
+        node_data=node_data,
+        runners=runners,
+        successors=successors,
+        handles=handles,
+        indegree=indegree,
+        roots=roots,
+        scope=scope,
+        loop_bodies=loop_bodies,
+        loop_roots=loop_roots
+    )
+
+
+def _assign_scopes(node_types: List[str], raw_edges: List[tuple]) -> List[int]:
+    """Innermost loop whose body contains each node, or TOP_SCOPE."""
+    adjacency = [[] for _ in node_types]
+    for src, dst, _ in raw_edges:
+        adjacency[src].append(dst)
+
+    def reachable(starts, blocked):
+        seen = set()
+        stack = [s for s in starts if s != blocked]
+        while stack:
+            idx = stack.pop()
+            if idx in seen: continue
+            seen.add(idx)
+            stack.extend(t for t in adjacency[idx] if t != blocked)
+        return seen
+
+    bodies = {}
+    for loop_idx, node_type in enumerate(node_types):
+        if node_type not in LOOP_NODE_TYPES:
+            continue
+        each = [dst for src, dst, handle in raw_edges if src == loop_idx and handle == "each"]
+        done = [dst for src, dst, handle in raw_edges if src == loop_idx and handle == "done"]
+        # Nodes the "done" path also reaches run after the loop, not inside it
+        bodies[loop_idx] = reachable(each, loop_idx) - reachable(done, loop_idx)
+
+    scope = [TOP_SCOPE] * len(node_types)
+    for idx in range(len(node_types)):
+        own_size = len(bodies.get(idx, ()))
+        candidates = [
+            (len(body), loop_idx) for loop_idx, body in bodies.items()
+            # A loop can only sit inside a strictly larger body, which keeps nesting acyclic
+            if idx in body and (idx not in bodies or len(body) > own_size)
+        ]
+        if candidates:
+            scope[idx] = min(candidates)[1]
+    return scope
+
+
+def _common_scope(scope: List[int], a: int, b: int) -> int:
+    """Closest scope enclosing both nodes."""
+    enclosing = set()
+    s = scope[a]
+    while s != TOP_SCOPE:
+        enclosing.add(s)
+        s = scope[s]
+    s = scope[b]
+    while s != TOP_SCOPE and s not in enclosing:
+        s = scope[s]
+    return s
+
+
+def _lift(scope: List[int], idx: int, target_scope: int) -> int:
+    """The node itself or its enclosing loop that lives directly in ``target_scope``."""
+    while scope[idx] != target_scope:
+        idx = scope[idx]
+    return idx
+
+
+class FlowPlanCache:
+    """Thread-safe LRU of CompiledFlow plans keyed by flow content hash."""
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._plans: "OrderedDict[str, CompiledFlow]" = OrderedDict()
+        self._by_flow: Dict[int, set] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compile(self, flow_data: Dict[str, Any], runner_lookup: Callable[[str], Any], flow_id: int = None) -> CompiledFlow:
+        """Return the cached plan for this flow content, compiling it on a miss."""
+        content_hash = flow_content_hash(flow_data)
+        with self._lock:
+            plan = self._plans.get(content_hash)
+            if plan is not None:
+                self._plans.move_to_end(content_hash)
+                self.hits += 1
+                return plan
+
+        plan = compile_flow(flow_data, runner_lookup, content_hash=content_hash)
+
+        with self._lock:
+            self.misses += 1
+            self._plans[content_hash] = plan
+            self._plans.move_to_end(content_hash)
+            if flow_id is not None:
+                self._by_flow.setdefault(flow_id, set()).add(content_hash)
+            while len(self._plans) > self.max_size:
+                evicted, _ = self._plans.popitem(last=False)
+                for hashes in self._by_flow.values():
+                    hashes.discard(evicted)
+        return plan
+
+    def invalidate(self, flow_id: int):
+        """Drop every cached plan compiled for a saved flow."""
+        with self._lock:
+            for content_hash in self._by_flow.pop(flow_id, set()):
+                self._plans.pop(content_hash, None)
+
+    def clear(self):
+        """Drop all cached plans (e.g. after runner registrations change)."""
+        with self._lock:
+            self._plans.clear()
+            self._by_flow.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Current cache size and hit/miss counters."""
+        with self._lock:
+            return {"size": len(self._plans), "max_size": self.max_size, "hits": self.hits, "misses": self.misses}
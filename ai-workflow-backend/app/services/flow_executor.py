@@ -2,103 +2,56 @@
 import logging
 import sys
 import asyncio
-import json
+import time
 import uuid
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Set, Callable
 from sqlalchemy.orm import Session
-from app.runners.base_runner import BaseRunner
-from app.runners.chat_input_runner import ChatInputRunner
-from app.runners.prompt_runner import PromptRunner
-from app.runners.openai_runner import OpenAIRunner
-from app.runners.gemini_runner import GeminiRunner
-from app.runners.claude_runner import ClaudeRunner
-from app.runners.llm_runner import LLMRunner
-from app.runners.elasticsearch_runner import ElasticsearchRunner
-from app.runners.output_runner import OutputRunner
-from app.runners.search_runner import SearchRunner
-from app.runners.http_runner import HttpRunner
-from app.runners.condition_runner import ConditionRunner
-from app.runners.pdf_runner import PdfRunner
-from app.runners.knowledge_runner import KnowledgeRunner
-from app.runners.summarization_runner import SummarizationRunner
-from app.runners.document_generator_runner import DocumentGeneratorRunner
-from app.runners.email_runner import run as email_run
-from app.runners.code_runner import CodeRunner
-from app.runners.ui_components_runner import UIComponentsRunner
-from app.runners.prompt_generator_runner import PromptGeneratorRunner
-from app.runners.master_prompt_runner import MasterPromptRunner
-from app.runners.language_runner import LanguageRunner
-from app.runners.theme_runner import ThemeRunner
-from app.runners.zip_runner import ZipRunner
-from app.runners.browser_runner import BrowserRunner
-from app.runners.loop_runner import LoopRunner
-from app.runners.screenshot_runner import ScreenshotRunner
-from app.runners.ide_runner import IDERunner
-from app.runners.xpath_helper_runner import XPathHelperRunner
-from app.runners.css_selector_runner import CSSSelectorRunner
-from app.runners.json_path_runner import JSONPathRunner
-from app.runners.whatsapp_input_runner import WhatsAppInputRunner
-from app.runners.whatsapp_runner import whats_app_runner
-from app.runners.mongodb_runner import mongo_db_runner
-from app.runners.tshirt_catalog_runner import tshirt_catalog_runner
-from app.runners.greeting_runner import greeting_runner
-from app.runners.project_planner_runner import ProjectPlannerRunner
-from app.models import Credential, get_db
-from app.services.encryption_service import encryption_service
+from app.runners.registry import RunnerRegistry, runner_registry
+from app.config import settings
+from app.services.credential_cache import credential_cache
+from app.services.flow_compiler import CompiledFlow, FlowPlanCache, TOP_SCOPE
+from app.services.runner_pools import runner_pools
+from app.services.node_cache import node_cache
+from app.services.checkpoint_service import checkpoint_service
+from app.services.event_protocol import EventEncoder
+from app.services.tracing import tracer, payload_size, NULL_TRACE
 
 logger = logging.getLogger(__name__)
 
 
 class FlowExecutor:
-    """Executes a flow by running nodes in sequence."""
+    """Executes a flow by scheduling nodes as their dependencies complete."""
     
-    def __init__(self):
-        """Initialize node runners."""
-        self.runners = {
-            "chatInput": ChatInputRunner(),
-            "promptTemplate": PromptRunner(),
-            "openai": OpenAIRunner(),
-            "gemini": GeminiRunner(),
-            "claude": ClaudeRunner(),
-            "llm": LLMRunner(),
-            "elasticsearch": ElasticsearchRunner(),
-            "chatOutput": OutputRunner(),
-            "search": SearchRunner(),
-            "http": HttpRunner(),
-            "condition": ConditionRunner(),
-            "pdf": PdfRunner(),
-            "knowledge": KnowledgeRunner(),
-            "summarization": SummarizationRunner(),
-            "documentGenerator": DocumentGeneratorRunner(),
-            "email": email_run,
-            "whatsAppInput": WhatsAppInputRunner(),
-            "whatsAppOutput": whats_app_runner,
-            "mongoDB": mongo_db_runner,
-            "tshirtCatalog": tshirt_catalog_runner,
-            "greeting": greeting_runner,
-            "pythonRunner": CodeRunner(),
-            "reactRunner": UIComponentsRunner(),
-            "uiComponents": UIComponentsRunner(),
-            "promptGenerator": PromptGeneratorRunner(),
-            "masterPrompt": MasterPromptRunner(),
-            "language": LanguageRunner(),
-            "frontendLanguage": LanguageRunner(),
-            "backendLanguage": LanguageRunner(),
-            "theme": ThemeRunner(),
-            "zip": ZipRunner(),
-            "browser": BrowserRunner(),
-            "loop": LoopRunner(),
-            "screenshot": ScreenshotRunner(),
-            "ide": IDERunner(),
-            "xpathHelper": XPathHelperRunner(),
-            "htmlExtractor": XPathHelperRunner(), # Alias for backward compatibility
-            "cssSelector": CSSSelectorRunner(),
-            "jsonPath": JSONPathRunner(),
-            "projectPlanner": ProjectPlannerRunner()
-        }
+    def __init__(self, runners: RunnerRegistry = None):
+        """Attach the runner registry; runners are imported lazily on first use."""
+        self.runners = runners if runners is not None else runner_registry
+        self._runners_version = self.runners.version
+        self.plans = FlowPlanCache(max_size=settings.flow_plan_cache_size)
     
-    async def execute(self, flow_data: Dict[str, Any], user_input: str, initial_state: Dict[str, Any] = None, background_tasks=None, flow_run_id=None):
-        """Execute a complete flow yielding progress events as JSON strings."""
+    async def execute(self, flow_data: Dict[str, Any], user_input: str, initial_state: Dict[str, Any] = None, background_tasks=None, flow_run_id=None, max_concurrency: int = None, flow_id: int = None, resume: Dict[str, Any] = None, timeout: float = None, encoder: EventEncoder = None, trace=None):
+        """
+        Execute a complete flow yielding progress events as JSON strings.
+        
+        Events are serialized by ``encoder`` (protocol v1 with full payloads by
+        default; see app.services.event_protocol for the compact v2 protocol).
+        
+        Nodes are scheduled by ``_run_graph`` as their dependencies complete (up
+        to ``max_concurrency`` at a time), so independent branches and loop
+        iterations overlap and events are yielded in completion order. The graph
+        itself comes from a cached CompiledFlow plan.
+        
+        Runs with a ``flow_run_id`` are checkpointed after every node (written in
+        the background, never awaited by the scheduler); pass a loaded
+        checkpoint as ``resume`` to skip the nodes it already completed.
+        
+        Nodes are limited by ``data.timeout`` (or ``settings.node_timeout``) and
+        the whole run by ``timeout`` (or ``settings.run_timeout``). Closing the
+        generator, e.g. when the client disconnects, cancels in-flight nodes.
+        
+        A sampled fraction of runs (``settings.trace_sample_rate``), or any run
+        given a ``trace``, records a span per node (with credential, cache and
+        runner phases) and per emitted event; see app.services.tracing.
+        """
         
         # 0. Windows Specific Asyncio Policy Enforcement & Debug
         if sys.platform == 'win32':
@@ -107,8 +60,8 @@ class FlowExecutor:
                 policy = asyncio.get_event_loop_policy()
                 loop = asyncio.get_event_loop()
                 
-                logger.info(f"🔍 [DEBUG] Current Policy: {type(policy).__name__}")
-                logger.info(f"🔍 [DEBUG] Current Loop: {type(loop).__name__}")
+                logger.debug("🔍 [DEBUG] Current Policy: %s", type(policy).__name__)
+                logger.debug("🔍 [DEBUG] Current Loop: %s", type(loop).__name__)
 
                 if not isinstance(policy, WindowsProactorEventLoopPolicy):
                     asyncio.set_event_loop_policy(WindowsProactorEventLoopPolicy())
@@ -119,30 +72,33 @@ class FlowExecutor:
                 if type(loop).__name__ == "SelectorEventLoop":
                     logger.error("[CRITICAL] Running on SelectorEventLoop! Playwright WILL FAIL.")
             except Exception as e:
-                logger.warning(f"[ENGINE] Loop check failed: {e}")
+                logger.warning("[ENGINE] Loop check failed: %s", e)
 
+        graph = None
+        run_id = None
+        trace = trace or NULL_TRACE
+        run_status = "error"
+        encoder = encoder or EventEncoder()
         try:
-            nodes = flow_data.get("nodes", [])
-            edges = flow_data.get("edges", [])
-            
-            # Normalization
-            for n in nodes: n["id"] = str(n.get("id", ""))
-            for e in edges:
-                e["source"] = str(e.get("source", ""))
-                e["target"] = str(e.get("target", ""))
-                e["sourceHandle"] = str(e.get("sourceHandle", "")) if e.get("sourceHandle") else None
-
-            logger.info(f"📊 Flow Execution Start: {len(nodes)} nodes found in flow data.")
-            for i, n in enumerate(nodes):
-                logger.info(f"  Node {i}: ID={n.get('id')}, Type={n.get('type')}")
-            
-            logger.info(f"📈 Edges found: {len(edges)}")
-            for i, e in enumerate(edges):
-                logger.info(f"  Edge {i}: {e.get('source')} -> {e.get('target')} (Handle: {e.get('sourceHandle')})")
-
-            yield json.dumps({"type": "start", "message": f"Starting flow with {len(nodes)} nodes..."})
+            if self.runners.version != self._runners_version:
+                # Runner overrides changed; cached plans hold stale bindings
+                self.plans.clear()
+                self._runners_version = self.runners.version
+            plan = self.plans.get_or_compile(flow_data, self.runners.get, flow_id=flow_id)
+            node_ids = plan.node_ids
 
             run_id = str(uuid.uuid4())
+            encoder.run_id = run_id
+            if trace.sampled:
+                trace.run_id = run_id
+            else:
+                trace = tracer.start_run(run_id)
+            if resume:
+                yield encoder.encode({"type": "start", "message": f"Resuming flow: {len(resume['completed_nodes'])} of {len(plan)} nodes already complete..."})
+            else:
+                yield encoder.encode({"type": "start", "message": f"Starting flow with {len(plan)} nodes..."})
+            await self._prefetch_credentials(plan)
+
             state = {
                 "run_id": run_id, 
                 "input": user_input, 
@@ -153,86 +109,178 @@ class FlowExecutor:
             }
             if initial_state: state.update(initial_state)
 
-            # Build maps - Only include edges between existing nodes
-            unique_nodes = {}
-            for n in nodes:
-                nid = str(n.get("id", ""))
-                if nid in unique_nodes:
-                    logger.warning(f"⚠️ Duplicate node ID detected: {nid}. Using last occurrence.")
-                unique_nodes[nid] = n
-            
-            node_ids = set(unique_nodes.keys())
-            incoming_counts = {nid: 0 for nid in node_ids}
-            outputs_map = {nid: [] for nid in node_ids}
-            
-            valid_edges = []
-            for edge in edges:
-                source, target = str(edge.get("source", "")), str(edge.get("target", ""))
-                if source in node_ids and target in node_ids:
-                    # Robustness: Skip self-loops to avoid deadlocks
-                    if source == target:
-                        logger.warning(f"⚠️ Skipping self-loop edge: {source} -> {target}")
+            # Per-run mutable copies of the shared plan arrays
+            progress = {
+                "incoming_counts": list(plan.indegree),
+                "queue": list(plan.roots),
+                "executed_nodes": [False] * len(plan),
+                "active_nodes": [True] * len(plan)
+            }
+            if resume:
+                state.update(resume["state"])
+                progress["queue"] = self._restore_checkpoint(
+                    plan, resume, progress["incoming_counts"], progress["executed_nodes"], progress["active_nodes"]
+                )
+            limit = max(1, int(max_concurrency or flow_data.get("maxConcurrency") or settings.flow_max_concurrency))
+
+            on_node_done = None
+            checkpointed = flow_run_id is not None and settings.flow_checkpoints
+            if checkpointed:
+                checkpoint_service.track(flow_run_id, flow_data, user_input)
+
+                def on_node_done(executed_nodes, active_nodes, failed_nodes):
+                    self._checkpoint(plan, state, executed_nodes, active_nodes, failed_nodes)
+
+            # Nodes (including loop bodies running in parallel) report through this queue
+            events: asyncio.Queue = asyncio.Queue()
+            graph = asyncio.create_task(self._run_graph(
+                plan, TOP_SCOPE, state, events.put_nowait, limit, progress=progress, on_node_done=on_node_done, trace=trace
+            ))
+            graph.add_done_callback(lambda _: events.put_nowait(None))
+            run_timeout = timeout if timeout is not None else settings.run_timeout
+            deadline = asyncio.get_running_loop().time() + run_timeout if run_timeout else None
+            while True:
+                try:
+                    remaining = deadline - asyncio.get_running_loop().time() if deadline else None
+                    event = await asyncio.wait_for(events.get(), remaining)
+                except asyncio.TimeoutError:
+                    graph.cancel()
+                    run_status = "timeout"
+                    logger.warning("⏱️ Run %s exceeded its %gs deadline", run_id, run_timeout)
+                    yield encoder.encode({
+                        "type": "error",
+                        "reason": "timeout",
+                        "message": f"Run timed out after {run_timeout:g}s",
+                        "logs": state["logs"]
+                    })
+                    return
+                if event is None:
+                    break
+                # Covers encoding and the time the consumer takes to take the event
+                span = trace.start("emit", event=event["type"], node_id=event.get("node_id"))
+                yield encoder.encode(event)
+                trace.finish(span)
+            failed_nodes = graph.result()
+            run_status = "failed" if failed_nodes else "success"
+            if checkpointed:
+                # A failed run can be resumed as soon as the client sees "final"
+                await checkpoint_service.flush(flow_run_id)
+
+            logger.debug("🏁 Flow Execution Loop Finished.")
+            # Final result yield
+            yield encoder.encode({
+                "type": "final",
+                "output": state.get("output", "Flow completed"),
+                "logs": state["logs"],
+                "failed_nodes": [node_ids[i] for i in sorted(failed_nodes)],
+                # background_tasks (and any other live objects) cannot be sent to the client
+                "state": {k: v for k, v in state.items() if k != "background_tasks"}
+            })
+
+        except (asyncio.CancelledError, GeneratorExit):
+            run_status = "cancelled"
+            logger.warning("🛑 Run %s cancelled; stopping in-flight nodes", run_id)
+            raise
+        except Exception as e:
+            logger.error("❌ Execution Failure: %s", e, exc_info=True)
+            yield encoder.encode({"type": "error", "message": str(e), "logs": state["logs"] if run_id else []})
+        finally:
+            # Never leave node tasks running once the stream is gone
+            if graph is not None and not graph.done():
+                graph.cancel()
+            self._close_browser_session(run_id)
+            if flow_run_id is not None:
+                checkpoint_service.forget(flow_run_id)
+            tracer.finish_run(trace, run_status)
+
+    async def _run_graph(self, plan: CompiledFlow, scope: int, state: Dict[str, Any], emit: Callable[[Dict[str, Any]], None],
+                         limit: int, progress: Dict[str, Any] = None, on_node_done=None, tags: Dict[str, Any] = None,
+                         trace=NULL_TRACE) -> Set[int]:
+        """
+        Schedule the nodes of one scope (the top level or one loop iteration).
+        
+        Every node whose incoming edges are satisfied is launched at once, up to
+        ``limit`` at a time, and events are emitted in completion order.
+        Returns the indices of nodes that failed.
+        """
+        node_ids = plan.node_ids
+        tags = tags or {}
+        if progress is None:
+            progress = {
+                "incoming_counts": list(plan.indegree),
+                "queue": list(plan.roots if scope == TOP_SCOPE else plan.loop_roots[scope]),
+                "executed_nodes": [False] * len(plan),
+                "active_nodes": [True] * len(plan)
+            }
+        incoming_counts, queue = progress["incoming_counts"], progress["queue"]
+        executed_nodes, active_nodes = progress["executed_nodes"], progress["active_nodes"]
+        failed_nodes = set()
+        running: Dict[asyncio.Task, int] = {}
+        iteration = tags.get("iteration")
+        if trace.sampled:
+            for idx in queue:
+                trace.ready((idx, iteration))
+
+        try:
+            while queue or running:
+                # Launch every ready node, up to the concurrency limit
+                while queue and len(running) < limit:
+                    idx = queue.pop(0)
+                    if executed_nodes[idx] or not active_nodes[idx] or idx in running.values():
                         continue
-                        
-                    incoming_counts[target] += 1
-                    outputs_map[source].append(edge)
-                    valid_edges.append(edge)
-                else:
-                    logger.warning(f"⚠️ Skipping dangling edge: {source} -> {target}")
-            
-            # Use valid_edges if needed for logging or further logic
-            edges = valid_edges
-
-            queue = [nid for nid in node_ids if incoming_counts[nid] == 0]
-            queue.sort()
-            logger.info(f"🚀 Initial Queue: {queue}")
-            executed_nodes = set()
-            active_nodes = set(node_ids)
-
-            while queue:
-                node_id = queue.pop(0)
-                if node_id in executed_nodes: continue
-                
-                node = self._find_node(nodes, node_id)
-                if not node: continue
-                
-                node_type = node.get("type", "unknown")
-                is_active = node_id in active_nodes
-                
-                if not is_active:
-                    continue
-                
-                # Signal node start
-                yield json.dumps({
-                    "type": "node_start", 
-                    "node_id": node_id, 
-                    "node_type": node_type,
-                    "message": f"Executing {node_type}..."
-                })
-                
-                node_data = await self._resolve_credentials(node.get("data", {}))
-                node_data["node_id"] = node_id
-                
-                # Documentation Mode Tracking
-                if node_data.get("manualMode"):
-                    state["manual_mode"] = True
-                if "manual_steps" not in state:
-                    state["manual_steps"] = []
-                
-                runner = self.runners.get(node_type)
-                result = {}
-                
-                if runner:
-                    try:
-                        import inspect
-                        logger.info(f"🔄 [ENGINE] Running runner for {node_id} ({node_type})...")
-                        if hasattr(runner, 'run'):
-                            is_async = inspect.iscoroutinefunction(runner.run)
-                            result = await runner.run(node_data, state) if is_async else runner.run(node_data, state)
-                        else:
-                            result = await runner(node_data, state) if inspect.iscoroutinefunction(runner) else runner(node_data, state)
-                        
-                        logger.info(f"✅ [ENGINE] Node {node_id} finished. Result status: {result.get('status') if result else 'None'}")
+                    
+                    node_id, node_type = node_ids[idx], plan.node_types[idx]
+                    # Signal node start
+                    emit({
+                        "type": "node_start", 
+                        "node_id": node_id, 
+                        "node_type": node_type,
+                        "message": f"Executing {node_type}...",
+                        **tags
+                    })
+                    running[asyncio.create_task(self._run_node(plan, idx, state, emit, limit, tags, trace))] = idx
+
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+                # Several nodes may finish within one wakeup - report them in completion order
+                for task in sorted(done, key=lambda t: t.result()["finished_at"]):
+                    idx = running.pop(task)
+                    outcome = task.result()
+                    node_id, node_type = node_ids[idx], plan.node_types[idx]
+                    node_data, result = outcome["node_data"], outcome["result"]
+
+                    failed = outcome["error"] is not None or (result or {}).get("status") == "error"
+                    if failed:
+                        failed_nodes.add(idx)
+                    else:
+                        failed_nodes.discard(idx)
+
+                    if not outcome["has_runner"]:
+                        emit({
+                            "type": "node_finish",
+                            "node_id": node_id,
+                            "node_type": node_type,
+                            "status": "skipped",
+                            "message": "No runner found",
+                            **tags
+                        })
+                    elif outcome["error"] is not None:
+                        e = outcome["error"]
+                        logger.error("Error in %s: %s", node_id, e, exc_info=e)
+                        error_msg = str(e)
+                        state["logs"].append({"node_id": node_id, "status": "error", "error": error_msg, **tags})
+                        emit({
+                            "type": "node_finish",
+                            "node_id": node_id,
+                            "node_type": node_type,
+                            "status": "error",
+                            "error": error_msg,
+                            **tags
+                        })
+                    else:
+                        logger.debug("✅ [ENGINE] Node %s finished. Result status: %s", node_id, result.get("status") if result else None)
                         
                         # Accumulate Manual Documentation Steps
                         if node_data.get("manualMode") and node_type == "browser" and result.get("status") != "error":
@@ -255,93 +303,238 @@ class FlowExecutor:
                                 "content": node_visual
                             })
                         # Signal node finish
-                        logger.info(f"📤 [ENGINE] Yielding node_finish for {node_id}")
-                        yield json.dumps({
+                        emit({
                             "type": "node_finish",
                             "node_id": node_id,
+                            "node_type": node_type,
                             "status": result.get("status", "success"),
-                            "result": result
-                        })
-                        
-                        # Debug queue for next items
-                        next_nodes = []
-                        for edge in outputs_map[node_id]:
-                             target_id = edge["target"]
-                             if target_id in incoming_counts:
-                                 next_nodes.append(f"{target_id}(counts:{incoming_counts[target_id]})")
-                        logger.info(f"📡 [ENGINE] Node {node_id} triggered next potential nodes: {next_nodes}")
-                        
-                        logger.info(f"📥 [ENGINE] Node {node_id} event yielded successfully")
-                    except Exception as e:
-                        logger.error(f"Error in {node_id}: {e}", exc_info=True)
-                        error_msg = str(e)
-                        state["logs"].append({"node_id": node_id, "status": "error", "error": error_msg})
-                        yield json.dumps({
-                            "type": "node_finish",
-                            "node_id": node_id,
-                            "status": "error",
-                            "error": error_msg
+                            "cached": outcome["cached"],
+                            "result": result,
+                            **tags
                         })
-                else:
-                    yield json.dumps({
-                        "type": "node_finish",
-                        "node_id": node_id,
-                        "status": "skipped",
-                        "message": "No runner found"
-                    })
 
-                executed_nodes.add(node_id)
-                state["logs"].append({"node_id": node_id, "node_type": node_type, "status": "success"})
-
-                # Handle branching
-                chosen_path = str(result.get("path", "")) if result.get("path") else None
-                if chosen_path:
-                    for edge in outputs_map[node_id]:
-                        handle = edge.get("sourceHandle") or edge.get("targetHandle")
-                        if handle and str(handle).lower() != str(chosen_path).lower():
-                            self._deactivate_recursive(edge["target"], outputs_map, active_nodes)
-
-                # Queue next
-                logger.info(f"🔍 [ENGINE] Node {node_id} finished. Processing {len(outputs_map[node_id])} output edges...")
-                for edge in outputs_map[node_id]:
-                    target_id = edge["target"]
-                    logger.info(f"   -> Edge: {node_id} -> {target_id}")
-                    if target_id in incoming_counts:
-                        incoming_counts[target_id] -= 1
-                        logger.info(f"      Remaining counts for {target_id}: {incoming_counts[target_id]}")
-                        if incoming_counts[target_id] == 0:
-                            queue.append(target_id)
-                            logger.info(f"      ✅ Node {target_id} added to Queue.")
-                    else:
-                        logger.error(f"      ❌ Target node {target_id} NOT found in node list!")
+                    executed_nodes[idx] = True
+                    state["logs"].append({"node_id": node_id, "node_type": node_type, "status": "success", **tags})
 
-            logger.info("🏁 Flow Execution Loop Finished.")
-            # Final result yield
-            yield json.dumps({
-                "type": "final",
-                "output": state.get("output", "Flow completed"),
-                "logs": state["logs"],
-                "state": state
-            })
-            
-            # Cleanup persistent browser sessions
+                    # Handle branching
+                    chosen_path = str(result.get("path", "")).lower() if result.get("path") else None
+                    if chosen_path:
+                        for target, handle in zip(plan.successors[idx], plan.handles[idx]):
+                            if handle and handle != chosen_path:
+                                self._deactivate_recursive(target, plan.successors, active_nodes)
+
+                    # Queue next
+                    for target in plan.successors[idx]:
+                        incoming_counts[target] -= 1
+                        if incoming_counts[target] == 0:
+                            queue.append(target)
+                            trace.ready((target, iteration))
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("🔍 [ENGINE] Node %s finished. Ready queue: %s", node_id, [node_ids[i] for i in queue])
+
+                    if on_node_done is not None:
+                        on_node_done(executed_nodes, active_nodes, failed_nodes)
+            return failed_nodes
+        finally:
+            # Never leave branch tasks running once this scope is abandoned
+            for task in running:
+                task.cancel()
+
+    async def _run_loop(self, plan: CompiledFlow, idx: int, runner, node_data: Dict[str, Any], state: Dict[str, Any],
+                        emit: Callable[[Dict[str, Any]], None], limit: int, tags: Dict[str, Any], trace=NULL_TRACE) -> Dict[str, Any]:
+        """
+        Run a loop body once per item, ``parallelism`` iterations at a time.
+        
+        Each iteration works on its own copy of the state with ``loop_item`` and
+        ``loop_index`` set; the value of ``collectKey`` (default ``output``) at
+        the end of every iteration is gathered in item order.
+        """
+        node_id = plan.node_ids[idx]
+        items = runner.iteration_items(node_data, state)
+        width = max(1, int(node_data.get("parallelism") or settings.flow_loop_parallelism))
+        collect_key = node_data.get("collectKey") or "output"
+        semaphore = asyncio.Semaphore(width)
+        logger.debug("🔁 [ENGINE] Loop %s: %d iterations, %d at a time", node_id, len(items), width)
+
+        async def iteration(i: int, item: Any):
+            async with semaphore:
+                iteration_state = dict(state)
+                iteration_state.update({"loop_item": item, "loop_index": i})
+                failed = await self._run_graph(
+                    plan, idx, iteration_state, emit, limit, tags={**tags, "loop_id": node_id, "iteration": i}, trace=trace
+                )
+                return iteration_state.get(collect_key), bool(failed)
+
+        outcomes = await asyncio.gather(*(iteration(i, item) for i, item in enumerate(items)))
+        return runner.finish(node_data, [value for value, _ in outcomes], [i for i, (_, failed) in enumerate(outcomes) if failed])
+
+    async def _run_node(self, plan: CompiledFlow, idx: int, state: Dict[str, Any],
+                        emit: Callable[[Dict[str, Any]], None], limit: int, tags: Dict[str, Any],
+                        trace=NULL_TRACE) -> Dict[str, Any]:
+        """Resolve a node's credentials and run it, capturing the outcome instead of raising."""
+        node_id = plan.node_ids[idx]
+        span = trace.start("node", (idx, tags.get("iteration")), node_id=node_id, node_type=plan.node_types[idx], **tags)
+        # Copy so the shared plan is never mutated by runners or credential resolution
+        phase = trace.start("credentials", parent=span)
+        node_data = await self._resolve_credentials(dict(plan.node_data[idx]))
+        trace.finish(phase)
+        node_data["node_id"] = node_id
+        
+        # Documentation Mode Tracking
+        if node_data.get("manualMode"):
+            state["manual_mode"] = True
+        if "manual_steps" not in state:
+            state["manual_steps"] = []
+        
+        runner = plan.runners[idx]
+        outcome = {
+            "node_data": node_data,
+            "has_runner": runner is not None,
+            "result": {},
+            "error": None,
+            "cached": False
+        }
+        if runner and idx in plan.loop_bodies:
             try:
-                from app.runners.browser_runner import session_manager
-                session_manager.close_session(run_id)
+                loop_run = self._run_loop(plan, idx, runner, node_data, state, emit, limit, tags, trace)
+                # Only an explicit data.timeout bounds a whole loop; body nodes have their own
+                outcome["result"] = await self._with_timeout(loop_run, node_data.get("timeout"))
             except Exception as e:
-                logger.error(f"Error during post-flow cleanup: {e}")
+                outcome["error"] = e
+        elif runner:
+            try:
+                cache_key, cache_ttl = self._cache_key(plan, idx, runner, state)
+                phase = trace.start("cache", parent=span) if cache_key else None
+                cached = await node_cache.get(cache_key) if cache_key else None
+                trace.finish(phase, hit=cached is not None)
+                if cached is not None:
+                    logger.debug("♻️ [ENGINE] Cache hit for %s (%s)", node_id, plan.node_types[idx])
+                    outcome["result"], outcome["cached"] = cached, True
+                else:
+                    logger.debug("🔄 [ENGINE] Running runner for %s (%s)...", node_id, plan.node_types[idx])
+                    timeout = node_data.get("timeout") or settings.node_timeout
+                    phase = trace.start("runner", parent=span)
+                    try:
+                        result = await self._with_timeout(self._invoke_runner(runner, node_data, state), timeout) or {}
+                    finally:
+                        trace.finish(phase)
+                    if phase is not None:
+                        span.attrs["runner_ms"] = round(phase.duration_ms, 3)
+                    outcome["result"] = result
+                    if cache_key and result.get("status") != "error" and not result.get("error"):
+                        await node_cache.set(cache_key, result, cache_ttl)
+            except Exception as e:
+                outcome["error"] = e
+        outcome["finished_at"] = time.perf_counter()
+        if span is not None:
+            trace.finish(
+                span,
+                status="error" if outcome["error"] is not None else (outcome["result"] or {}).get("status", "success"),
+                cached=outcome["cached"],
+                bytes=payload_size(outcome["result"])
+            )
+        return outcome
+
+    async def _with_timeout(self, coro, timeout):
+        """Await ``coro``, cancelling it after ``timeout`` seconds (falsy = no limit)."""
+        try:
+            timeout = float(timeout or 0)
+        except (TypeError, ValueError):
+            timeout = 0
+        if timeout <= 0:
+            return await coro
+        try:
+            return await asyncio.wait_for(coro, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Node timed out after {timeout:g}s") from None
 
+    def _close_browser_session(self, run_id: str):
+        """Close the run's persistent browser session, if a browser node opened one."""
+        # Only consult the module if a browser node ran, so Playwright is never imported here
+        browser_module = sys.modules.get("app.runners.browser_runner")
+        if browser_module is None or run_id is None:
+            return
+        try:
+            browser_module.session_manager.close_session(run_id)
+        except Exception as e:
+            logger.error("Error during post-flow cleanup: %s", e)
+
+    def _cache_key(self, plan: CompiledFlow, idx: int, runner, state: Dict[str, Any]):
+        """Result-cache key and TTL for a node, or (None, None) when it must run."""
+        # Raw node data: credential references are hashed, never the decrypted secrets
+        node_data = plan.node_data[idx]
+        ttl = node_cache.ttl_for(node_data)
+        if ttl is None or not hasattr(runner, "cache_keys"):
+            return None, None
+        state_keys = runner.cache_keys(node_data, state)
+        if state_keys is None:
+            return None, None
+        return node_cache.make_key(plan.node_types[idx], node_data, state_keys, state), ttl
+
+    async def _invoke_runner(self, runner, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a runner object or plain runner function without blocking the event loop."""
+        return await runner_pools.run(runner, node_data, state)
+
+    def _restore_checkpoint(self, plan: CompiledFlow, resume: Dict[str, Any], incoming_counts: List[int],
+                            executed_nodes: List[bool], active_nodes: List[bool]) -> List[int]:
+        """Apply a checkpoint to the per-run arrays and return the nodes ready to run."""
+        for node_id in resume.get("inactive_nodes", []):
+            if node_id in plan.index:
+                active_nodes[plan.index[node_id]] = False
+        for node_id in resume.get("completed_nodes", []):
+            idx = plan.index.get(node_id)
+            if idx is None:
+                continue
+            executed_nodes[idx] = True
+            for target in plan.successors[idx]:
+                incoming_counts[target] -= 1
+        return [
+            i for i in range(len(plan))
+            if plan.scope[i] == TOP_SCOPE and incoming_counts[i] == 0 and not executed_nodes[i] and active_nodes[i]
+        ]
+
+    def _checkpoint(self, plan: CompiledFlow, state: Dict[str, Any], executed_nodes: List[bool],
+                    active_nodes: List[bool], failed_nodes: set):
+        """Queue the resumable part of a run for the background checkpoint writer; failures are logged, never raised."""
+        node_ids = plan.node_ids
+        # Nodes downstream of a failure ran on bad input, so a resume re-runs them too
+        stale = [False] * len(plan)
+        stack = list(failed_nodes)
+        while stack:
+            idx = stack.pop()
+            if stale[idx]: continue
+            stale[idx] = True
+            stack.extend(plan.successors[idx])
+        try:
+            checkpoint_service.record(
+                state["flow_run_id"],
+                state,
+                [node_ids[i] for i, done in enumerate(executed_nodes) if done and not stale[i]],
+                [node_ids[i] for i, active in enumerate(active_nodes) if not active],
+                [node_ids[i] for i in sorted(failed_nodes)]
+            )
         except Exception as e:
-            logger.error(f"❌ Execution Failure: {str(e)}", exc_info=True)
-            yield json.dumps({"type": "error", "message": str(e)})
-
-    def _deactivate_recursive(self, node_id, outputs_map, active_nodes):
-        """Recursively remove a node and its children from the active set."""
-        if node_id not in active_nodes: return
-        active_nodes.remove(node_id)
-        for edge in outputs_map.get(node_id, []):
-            self._deactivate_recursive(edge["target"], outputs_map, active_nodes)
+            logger.error("❌ Failed to checkpoint run %s: %s", state.get("flow_run_id"), e)
+
+    def _deactivate_recursive(self, node_idx: int, successors: List[List[int]], active_nodes: List[bool]):
+        """Remove a node and all of its descendants from the active set."""
+        stack = [node_idx]
+        while stack:
+            idx = stack.pop()
+            if not active_nodes[idx]: continue
+            active_nodes[idx] = False
+            stack.extend(successors[idx])
     
+    async def _prefetch_credentials(self, plan: CompiledFlow):
+        """Decrypt every credential the flow references with one query, ahead of its nodes."""
+        if not plan.credential_ids:
+            return
+        try:
+            await asyncio.to_thread(credential_cache.prefetch, plan.credential_ids)
+        except Exception as e:
+            # Nodes fall back to loading their own credential
+            logger.error("❌ Error prefetching credentials: %s", e)
+
     async def _resolve_credentials(self, node_data: Dict[str, Any]) -> Dict[str, Any]:
         """Resolve credential references in node data."""
         credential_id = node_data.get("credentialId")
@@ -349,28 +542,19 @@ class FlowExecutor:
             return node_data
         
         try:
-            db = next(get_db())
-            credential = db.query(Credential).filter(Credential.id == credential_id).first()
-            if not credential:
+            decrypted_value = credential_cache.get(credential_id)
+            if decrypted_value is None:
+                decrypted_value = await asyncio.to_thread(credential_cache.load, credential_id)
+            if decrypted_value is None:
                 return node_data
             
-            decrypted_value = encryption_service.decrypt(credential.encrypted_value)
             updated_data = node_data.copy()
             del updated_data["credentialId"]
             updated_data["apiKey"] = decrypted_value
             return updated_data
         except Exception as e:
-            logger.error(f"❌ Error resolving credential: {str(e)}")
+            logger.error("❌ Error resolving credential: %s", e)
             return node_data
-        finally:
-            db.close()
-    
-    def _find_node(self, nodes: List[Dict], node_id: str) -> Dict:
-        """Find a node by ID."""
-        for node in nodes:
-            if node.get("id") == node_id:
-                return node
-        return None
 
 
 # Global executor instance
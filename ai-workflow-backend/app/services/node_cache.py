@@ -0,0 +1,196 @@
+"""Opt-in result cache for deterministic flow nodes."""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# node_data entries that configure the cache itself or identify the node, not its behaviour
+_IGNORED_NODE_KEYS = {"node_id", "cache", "cacheTtl"}
+
+
+class MemoryCacheBackend:
+    """In-process LRU with per-entry expiry."""
+
+    blocking = False
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: float):
+        with self._lock:
+            self._entries[key] = (value, time.time() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def delete_prefix(self, prefix: str) -> int:
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend:
+    """On-disk cache shared by every process on the host; LRU by last access."""
+
+    blocking = True
+
+    def __init__(self, path: str, max_entries: int, table: str = "node_cache"):
+        self.path = path
+        # Trusted identifier chosen by the caller, not user input
+        self.table = table
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_accessed ON {table}(accessed_at)")
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if row[1] < now:
+                self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                return None
+            self._conn.execute(f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?", (now, key))
+            return row[0]
+
+    def set(self, key: str, value: str, ttl: float):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, now + ttl, now)
+            )
+            count = self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+            if count > self.max_entries:
+                self._conn.execute(f"DELETE FROM {self.table} WHERE expires_at < ?", (now,))
+                self._conn.execute(
+                    f"DELETE FROM {self.table} WHERE key IN (SELECT key FROM {self.table} ORDER BY accessed_at LIMIT ?)",
+                    (max(0, count - self.max_entries),)
+                )
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table}")
+
+    def delete_prefix(self, prefix: str) -> int:
+        # Range scan on the primary key; keys are hex digests and ids, so no LIKE escaping is needed
+        with self._lock:
+            return self._conn.execute(
+                f"DELETE FROM {self.table} WHERE key >= ? AND key < ?", (prefix, prefix + "\uffff")
+            ).rowcount
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+
+class NodeResultCache:
+    """
+    Memoizes node results keyed by node type, normalized node data and a
+    fingerprint of only the state keys the runner declares it reads.
+    """
+
+    def __init__(self, backend, default_ttl: float):
+        self.backend = backend
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+
+    def ttl_for(self, node_data: Dict[str, Any]) -> Optional[float]:
+        """TTL for an opted-in node (``data.cache`` / ``data.cacheTtl``), else None."""
+        if not node_data.get("cache") and not node_data.get("cacheTtl"):
+            return None
+        try:
+            return float(node_data.get("cacheTtl") or self.default_ttl)
+        except (TypeError, ValueError):
+            return self.default_ttl
+
+    def make_key(self, node_type: str, node_data: Dict[str, Any], state_keys: Iterable[str], state: Dict[str, Any]) -> str:
+        """Hash of everything that determines a deterministic node's result."""
+        normalized = {k: v for k, v in node_data.items() if k not in _IGNORED_NODE_KEYS}
+        reads = {k: state.get(k) for k in sorted(set(state_keys))}
+        payload = json.dumps([node_type, normalized, reads], sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = await self._call(self.backend.get, key)
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        # Decoded per hit, so runs never share (and mutate) the same result objects
+        return json.loads(raw)
+
+    async def set(self, key: str, result: Dict[str, Any], ttl: float):
+        try:
+            raw = json.dumps(result)
+        except (TypeError, ValueError):
+            logger.debug("Node result is not JSON serializable; not caching")
+            return
+        await self._call(self.backend.set, key, raw, ttl)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": type(self.backend).__name__,
+            "entries": len(self.backend),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+    async def _call(self, fn, *args):
+        if self.backend.blocking:
+            return await asyncio.to_thread(fn, *args)
+        return fn(*args)
+
+
+def _create_backend():
+    if settings.node_cache_backend == "sqlite":
+        return SQLiteCacheBackend(settings.node_cache_path, settings.node_cache_max_entries)
+    return MemoryCacheBackend(settings.node_cache_max_entries)
+
+
+# Global node result cache
+node_cache = NodeResultCache(_create_backend(), default_ttl=settings.node_cache_ttl)
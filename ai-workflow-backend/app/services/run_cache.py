@@ -0,0 +1,141 @@
+"""Whole-run response cache for shared flows that opt in."""
+import asyncio
+import hashlib
+import json
+import logging
+import uuid
+from typing import Dict, Any, Iterator, List, Optional
+
+from app.config import settings
+from app.services.event_protocol import EventEncoder, dumps, restore_identity
+from app.services.flow_compiler import flow_content_hash
+from app.services.node_cache import MemoryCacheBackend, SQLiteCacheBackend
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_input(user_input: Any) -> str:
+    """Inputs differing only in case or whitespace share a cache entry."""
+    return " ".join(str(user_input or "").split()).casefold()
+
+
+class RunRecording:
+    """Collects a run's events as they stream; saved only if the run succeeds and fits the size bound."""
+
+    def __init__(self, cache: "RunResponseCache", key: str, ttl: float):
+        self.cache = cache
+        self.key = key
+        self.ttl = ttl
+        self.parts: List[str] = []
+        self.size = 0
+        self.succeeded = False
+        self.discarded = False
+
+    def add(self, event: Dict[str, Any]):
+        if self.discarded:
+            return
+        event_type = event.get("type")
+        if event_type == "error":
+            self.discard()
+            return
+        if event_type == "final":
+            self.succeeded = not event.get("failed_nodes")
+        # Serialized now: later nodes may still grow state values an earlier event refers to
+        part = dumps(event)
+        self.size += len(part)
+        if self.size > self.cache.max_entry_bytes:
+            self.cache.oversized += 1
+            self.discard()
+            return
+        self.parts.append(part)
+
+    def discard(self):
+        self.discarded = True
+        self.parts = []
+
+    async def save(self):
+        if self.succeeded and not self.discarded:
+            await self.cache._call(self.cache.backend.set, self.key, "[" + ",".join(self.parts) + "]", self.ttl)
+            self.cache.stores += 1
+
+
+class RunResponseCache:
+    """
+    Event streams of successful runs of flows with a run-cache policy
+    (``Flow.run_cache_ttl``), keyed by flow id, the flow's content hash and the
+    normalized input. Editing a flow changes its hash, so stale entries are
+    never replayed; they age out by TTL and LRU or are purged explicitly.
+    """
+
+    def __init__(self, backend, max_entry_bytes: int):
+        self.backend = backend
+        self.max_entry_bytes = max_entry_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.oversized = 0
+
+    def make_key(self, flow_id: int, flow_data: Dict[str, Any], user_input: Any) -> str:
+        digest = hashlib.sha256(f"{flow_content_hash(flow_data)}\n{normalize_input(user_input)}".encode("utf-8")).hexdigest()
+        # Flow id first so a flow's entries can be purged by prefix
+        return f"{flow_id}:{digest}"
+
+    async def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        raw = await self._call(self.backend.get, key)
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(raw)
+
+    def record(self, key: str, ttl: float) -> RunRecording:
+        return RunRecording(self, key, ttl)
+
+    def replay(self, events: List[Dict[str, Any]], encoder: EventEncoder) -> Iterator[str]:
+        """Encode a cached stream for a new request, as a fresh run marked ``"cached": true``."""
+        encoder.run_id = str(uuid.uuid4())
+        delivered: Dict[str, Any] = {}
+        for event in events:
+            if event.get("type") == "start":
+                event["cached"] = True
+            elif event.get("type") == "final" and isinstance(event.get("state"), dict):
+                event["state"]["run_id"] = encoder.run_id
+            if encoder.version > 1:
+                restore_identity(event, delivered)
+            yield encoder.encode(event)
+
+    async def purge(self, flow_id: int = None) -> int:
+        """Drop one flow's cached runs (or all of them); returns how many were removed."""
+        if flow_id is None:
+            removed = len(self.backend)
+            await self._call(self.backend.clear)
+        else:
+            removed = await self._call(self.backend.delete_prefix, f"{flow_id}:")
+        if removed:
+            logger.info("🧹 Purged %d cached runs%s", removed, f" of flow {flow_id}" if flow_id is not None else "")
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": type(self.backend).__name__,
+            "entries": len(self.backend),
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "oversized": self.oversized
+        }
+
+    async def _call(self, fn, *args):
+        if self.backend.blocking:
+            return await asyncio.to_thread(fn, *args)
+        return fn(*args)
+
+
+def _create_backend():
+    if settings.run_cache_backend == "sqlite":
+        return SQLiteCacheBackend(settings.run_cache_path, settings.run_cache_max_entries, table="run_cache")
+    return MemoryCacheBackend(settings.run_cache_max_entries)
+
+
+# Global run response cache
+run_cache = RunResponseCache(_create_backend(), max_entry_bytes=settings.run_cache_max_entry_kb * 1024)
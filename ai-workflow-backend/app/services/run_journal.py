@@ -0,0 +1,148 @@
+"""Event journals of detached runs, so any number of viewers can replay and tail them."""
+import asyncio
+import logging
+import time
+from typing import Dict, Any, AsyncIterator, List, Optional
+
+from app.config import settings
+from app.services.event_protocol import dumps
+
+logger = logging.getLogger(__name__)
+
+
+class RunJournal:
+    """
+    Append-only SSE frames of one run, as encoded for the client that started
+    it. Frame ``n`` (from 1) is sent with ``id: n`` so a reconnecting
+    EventSource resumes after its ``Last-Event-ID``. Only the newest
+    ``max_events`` frames are kept; older ids resume from the oldest kept.
+    """
+
+    # Seconds between keep-alive comments while a run is quiet
+    heartbeat = 15.0
+
+    def __init__(self, run_id: int, max_events: int):
+        self.run_id = run_id
+        self.max_events = max_events
+        self.frames: List[str] = []
+        self.offset = 0  # Frames dropped from the front
+        self.finished_at: Optional[float] = None
+        self._changed = asyncio.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.finished_at is not None
+
+    @property
+    def last_id(self) -> int:
+        return self.offset + len(self.frames)
+
+    def append(self, frame: str):
+        self.frames.append(frame)
+        if len(self.frames) > self.max_events:
+            drop = len(self.frames) - self.max_events
+            del self.frames[:drop]
+            self.offset += drop
+        self._wake()
+
+    def close(self):
+        self.finished_at = time.monotonic()
+        self._wake()
+
+    def _wake(self):
+        # Readers hold the old event; a new one is armed for the next change
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def follow(self, after: int = 0) -> AsyncIterator[str]:
+        """SSE text of every frame after id ``after``, then of new frames until the run finishes."""
+        seq = after
+        while True:
+            seq = max(seq, self.offset)
+            if seq < self.last_id:
+                frame = self.frames[seq - self.offset]
+                seq += 1
+                yield f"id: {seq}\n{frame}"
+                continue
+            if self.finished:
+                return
+            changed = self._changed
+            try:
+                await asyncio.wait_for(changed.wait(), self.heartbeat)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+
+
+class RunJournals:
+    """
+    Runs executing in the background of the API process, detached from the
+    request that started them, and their journals. Finished journals are kept
+    for ``retention`` seconds. Journals live in this process only.
+    """
+
+    def __init__(self, retention: float, max_events: int):
+        self.retention = retention
+        self.max_events = max_events
+        self._journals: Dict[int, RunJournal] = {}
+        self._tasks: Dict[int, asyncio.Task] = {}
+        self.started = 0
+
+    def start(self, run_id: int, frames: AsyncIterator[str]) -> RunJournal:
+        """Drive a run's SSE frames into a new journal from a background task."""
+        self._prune()
+        journal = RunJournal(run_id, self.max_events)
+        self._journals[run_id] = journal
+        self._tasks[run_id] = asyncio.create_task(self._drive(journal, frames), name=f"detached-run-{run_id}")
+        self.started += 1
+        return journal
+
+    async def _drive(self, journal: RunJournal, frames: AsyncIterator[str]):
+        try:
+            async for frame in frames:
+                journal.append(frame)
+        except asyncio.CancelledError:
+            logger.warning("🛑 Detached run %s cancelled", journal.run_id)
+            journal.append(f"data: {dumps({'type': 'error', 'reason': 'cancelled', 'message': 'Run cancelled'})}\n\n")
+        except Exception as e:
+            logger.error("❌ Detached run %s failed: %s", journal.run_id, e, exc_info=True)
+        finally:
+            journal.close()
+            self._tasks.pop(journal.run_id, None)
+
+    def get(self, run_id: int) -> Optional[RunJournal]:
+        self._prune()
+        return self._journals.get(run_id)
+
+    def is_running(self, run_id: int) -> bool:
+        return run_id in self._tasks
+
+    def cancel(self, run_id: int) -> bool:
+        """Cancel a detached run still executing; its journal ends with the outcome."""
+        task = self._tasks.get(run_id)
+        if task is None:
+            return False
+        task.cancel()
+        return True
+
+    async def shutdown(self):
+        """Cancel detached runs still executing and wait for them to record their outcome."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _prune(self):
+        cutoff = time.monotonic() - self.retention
+        for run_id in [run_id for run_id, j in self._journals.items() if j.finished and j.finished_at < cutoff]:
+            del self._journals[run_id]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": len(self._tasks),
+            "journals": len(self._journals),
+            "started": self.started
+        }
+
+
+# Global detached run journals
+run_journals = RunJournals(settings.run_journal_ttl, settings.run_journal_max_events)
@@ -0,0 +1,161 @@
+"""Per-flow run statistics kept up to date as runs finish, so dashboards never scan flow_runs."""
+import math
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session
+
+from app.models import FlowRun, FlowRunRollup, RunStatus
+
+# Bucket i of the duration histogram holds runs of up to BUCKET_BASE_MS * BUCKET_GROWTH**i ms,
+# so percentiles are exact to within 25% and a day's histogram stays a few dozen numbers
+BUCKET_BASE_MS = 10.0
+BUCKET_GROWTH = 1.25
+MAX_BUCKET = 80  # ~6 days; longer runs share the last bucket
+
+# Columns of a run that decide what it contributes to the rollups
+ROLLUP_COLUMNS = (FlowRun.id, FlowRun.flow_id, FlowRun.status, FlowRun.created_at, FlowRun.completed_at)
+
+_STATUS_FIELDS = {
+    RunStatus.SUCCESS: "successes",
+    RunStatus.FAILED: "failures",
+    RunStatus.CANCELLED: "cancellations"
+}
+
+
+def duration_bucket(duration_ms: float) -> int:
+    if duration_ms <= BUCKET_BASE_MS:
+        return 0
+    return min(MAX_BUCKET, math.ceil(math.log(duration_ms / BUCKET_BASE_MS, BUCKET_GROWTH)))
+
+
+def bucket_upper_ms(index: int) -> float:
+    return BUCKET_BASE_MS * BUCKET_GROWTH ** index
+
+
+def as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive UTC timestamps, PostgreSQL aware ones
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def contribution(flow_id: Optional[int], status: Any, created_at: Optional[datetime],
+                 completed_at: Optional[datetime]) -> Optional[tuple]:
+    """What a run adds to the rollups, ``(flow_id, day, status, duration bucket)``, or None until it has finished."""
+    if flow_id is None or created_at is None or completed_at is None or status not in _STATUS_FIELDS:
+        return None
+    started = as_utc(created_at)
+    duration_ms = max(0.0, (as_utc(completed_at) - started).total_seconds() * 1000)
+    return flow_id, started.date(), RunStatus(status), duration_bucket(duration_ms)
+
+
+def contributions(rows: Iterable[Any]) -> Dict[int, Optional[tuple]]:
+    """Contribution of each run in rows selected with ROLLUP_COLUMNS, by run id."""
+    return {row.id: contribution(row.flow_id, row.status, row.created_at, row.completed_at) for row in rows}
+
+
+def apply(db: Session, before: Dict[int, Optional[tuple]], after: Dict[int, Optional[tuple]]):
+    """
+    Move the rollups from runs' ``before`` to their ``after`` contributions
+    (call in the transaction that changed the runs). A run finishing again
+    after a resume replaces its earlier outcome instead of counting twice.
+    """
+    deltas: Dict[Tuple[int, date], List[tuple]] = {}
+    for run_id in set(before) | set(after):
+        old, new = before.get(run_id), after.get(run_id)
+        if old == new:
+            continue
+        for sign, item in ((-1, old), (1, new)):
+            if item is not None:
+                flow_id, day, status, bucket = item
+                deltas.setdefault((flow_id, day), []).append((sign, status, bucket))
+    if not deltas:
+        return
+
+    rows = {
+        (row.flow_id, row.day): row for row in db.query(FlowRunRollup)
+        .filter(tuple_(FlowRunRollup.flow_id, FlowRunRollup.day).in_(list(deltas)))
+        .with_for_update()
+    }
+    for (flow_id, day), changes in deltas.items():
+        row = rows.get((flow_id, day))
+        if row is None:
+            row = FlowRunRollup(flow_id=flow_id, day=day, runs=0, successes=0, failures=0, cancellations=0, durations={})
+            db.add(row)
+        durations = dict(row.durations or {})
+        for sign, status, bucket in changes:
+            row.runs += sign
+            field = _STATUS_FIELDS[status]
+            setattr(row, field, getattr(row, field) + sign)
+            durations[str(bucket)] = durations.get(str(bucket), 0) + sign
+        # A new dict, so the JSON column is seen as changed
+        row.durations = {k: v for k, v in durations.items() if v}
+
+
+def rebuild(db: Session, batch_size: int = 5000) -> int:
+    """Recompute every rollup from flow_runs (one full scan, for migrations); returns the runs counted."""
+    db.query(FlowRunRollup).delete()
+    counted = 0
+    pending: Dict[int, Optional[tuple]] = {}
+    query = db.query(*ROLLUP_COLUMNS).filter(FlowRun.flow_id.isnot(None), FlowRun.completed_at.isnot(None))
+    for row in query.yield_per(batch_size):
+        pending[row.id] = contribution(row.flow_id, row.status, row.created_at, row.completed_at)
+        if len(pending) >= batch_size:
+            apply(db, {}, pending)
+            db.flush()
+            counted += sum(1 for item in pending.values() if item)
+            pending = {}
+    apply(db, {}, pending)
+    counted += sum(1 for item in pending.values() if item)
+    db.commit()
+    return counted
+
+
+def percentile_ms(durations: Dict[str, int], q: float) -> Optional[float]:
+    """Upper bound of the histogram bucket holding the ``q`` quantile."""
+    total = sum(durations.values())
+    if total <= 0:
+        return None
+    rank = q * total
+    seen = 0
+    for index in sorted(durations, key=int):
+        seen += durations[index]
+        if seen >= rank:
+            return round(bucket_upper_ms(int(index)), 1)
+    return None
+
+
+def _summary(runs: int, successes: int, failures: int, cancellations: int, durations: Dict[str, int]) -> Dict[str, Any]:
+    return {
+        "runs": runs,
+        "successes": successes,
+        "failures": failures,
+        "cancellations": cancellations,
+        "success_rate": round(successes / runs, 4) if runs else None,
+        "p50_ms": percentile_ms(durations, 0.5),
+        "p95_ms": percentile_ms(durations, 0.95)
+    }
+
+
+def flow_stats(db: Session, flow_id: int, days: int) -> Dict[str, Any]:
+    """Daily and overall run statistics of a flow for the last ``days`` UTC days (finished runs only)."""
+    since = datetime.now(timezone.utc).date() - timedelta(days=days - 1)
+    rows = db.query(FlowRunRollup).filter(
+        FlowRunRollup.flow_id == flow_id, FlowRunRollup.day >= since
+    ).order_by(FlowRunRollup.day).all()
+
+    totals = {"runs": 0, "successes": 0, "failures": 0, "cancellations": 0}
+    durations: Dict[str, int] = {}
+    daily = []
+    for row in rows:
+        daily.append({"day": row.day.isoformat(), **_summary(row.runs, row.successes, row.failures, row.cancellations, row.durations or {})})
+        for key in totals:
+            totals[key] += getattr(row, key)
+        for bucket, count in (row.durations or {}).items():
+            durations[bucket] = durations.get(bucket, 0) + count
+    return {
+        "flow_id": flow_id,
+        "since": since.isoformat(),
+        "totals": _summary(**totals, durations=durations),
+        "days": daily
+    }
@@ -0,0 +1,204 @@
+"""Admission control for flow runs: concurrency caps and a bounded waiting queue."""
+import asyncio
+import itertools
+import logging
+import time
+from collections import Counter
+from typing import Dict, Any, List, Optional, AsyncIterator
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFull(Exception):
+    """Raised by ``admit`` when every slot is taken and the waiting queue is full."""
+
+
+class RunTicket:
+    """A caller's claim on a run slot, granted immediately or after queueing."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, source: str, flow_id: Optional[int], share_token: Optional[str]):
+        self.id = next(self._ids)
+        self.source = source
+        self.flow_id = flow_id
+        self.share_token = share_token
+        self.enqueued_at = time.monotonic()
+        self.granted_at: Optional[float] = None
+        self.released = False
+        # Set whenever the ticket is granted or its queue position may have changed
+        self._changed = asyncio.Event()
+
+    @property
+    def granted(self) -> bool:
+        return self.granted_at is not None
+
+    @property
+    def waited(self) -> float:
+        return (self.granted_at or time.monotonic()) - self.enqueued_at
+
+
+class RunScheduler:
+    """
+    Caps concurrent runs globally, per saved flow and per share token.
+
+    Callers ``admit`` a ticket (raising QueueFull when the queue is full, or
+    waiting for room with ``admit_when_room``),
+    wait for it with ``wait``/``positions`` and ``release`` it when the run
+    ends or the client goes away. Waiting tickets are granted in FIFO order,
+    skipping those whose flow or share token is at its cap. All methods run
+    on the event loop, so no locking is needed. A limit of 0 means unlimited.
+    """
+
+    def __init__(self, max_concurrent: int, per_flow: int, per_share_token: int, max_queue: int):
+        self.max_concurrent = max_concurrent
+        self.per_flow = per_flow
+        self.per_share_token = per_share_token
+        self.max_queue = max_queue
+        self._running: Dict[int, RunTicket] = {}
+        self._queue: List[RunTicket] = []
+        self._by_flow: Counter = Counter()
+        self._by_token: Counter = Counter()
+        # Set whenever a slot frees or the queue shrinks, for admit_when_room
+        self._room = asyncio.Event()
+        self.shed = 0
+
+    def admit(self, source: str, flow_id: Optional[int] = None, share_token: Optional[str] = None) -> RunTicket:
+        """Create a ticket, granting it at once if a slot is free; raises QueueFull otherwise when the queue is full."""
+        ticket = RunTicket(source, flow_id, share_token)
+        if self._full(ticket):
+            self.shed += 1
+            logger.warning("🚦 Run queue full (%d waiting); shedding %s run", len(self._queue), source)
+            raise QueueFull(f"Run queue is full ({len(self._queue)} waiting)")
+        self._enqueue(ticket)
+        return ticket
+
+    async def admit_when_room(self, source: str, flow_id: Optional[int] = None, share_token: Optional[str] = None) -> RunTicket:
+        """Like ``admit``, but a full queue is waited out instead of raising (for callers that bound their own backlog)."""
+        ticket = RunTicket(source, flow_id, share_token)
+        while self._full(ticket):
+            self._room.clear()
+            await self._room.wait()
+        self._enqueue(ticket)
+        return ticket
+
+    def _full(self, ticket: RunTicket) -> bool:
+        """True when the ticket would have to queue and the queue has no room."""
+        if not self._queue and self._fits(ticket):
+            return False
+        return bool(self.max_queue) and len(self._queue) >= self.max_queue
+
+    def _enqueue(self, ticket: RunTicket):
+        if not self._queue and self._fits(ticket):
+            self._grant(ticket)
+            return
+        self._queue.append(ticket)
+        # An earlier waiter may be blocked only by its own flow cap
+        self._dispatch()
+
+    def position(self, ticket: RunTicket) -> int:
+        """1-based position of a waiting ticket (0 once granted)."""
+        if ticket.granted:
+            return 0
+        try:
+            return self._queue.index(ticket) + 1
+        except ValueError:
+            return 0
+
+    async def wait(self, ticket: RunTicket):
+        """Wait until the ticket is granted."""
+        async for _ in self.positions(ticket):
+            pass
+
+    async def positions(self, ticket: RunTicket) -> AsyncIterator[int]:
+        """Yield the ticket's queue position each time it changes, until it is granted."""
+        last = None
+        while not ticket.granted:
+            position = self.position(ticket)
+            if position != last:
+                last = position
+                yield position
+            ticket._changed.clear()
+            await ticket._changed.wait()
+
+    def release(self, ticket: RunTicket):
+        """Free a granted ticket's slot, or drop it from the queue if it never ran."""
+        if ticket.released:
+            return
+        ticket.released = True
+        if ticket.id in self._running:
+            del self._running[ticket.id]
+            if ticket.flow_id is not None:
+                self._by_flow[ticket.flow_id] -= 1
+            if ticket.share_token:
+                self._by_token[ticket.share_token] -= 1
+        elif ticket in self._queue:
+            self._queue.remove(ticket)
+        self._dispatch()
+
+    def _fits(self, ticket: RunTicket) -> bool:
+        if self.max_concurrent and len(self._running) >= self.max_concurrent:
+            return False
+        if self.per_flow and ticket.flow_id is not None and self._by_flow[ticket.flow_id] >= self.per_flow:
+            return False
+        if self.per_share_token and ticket.share_token and self._by_token[ticket.share_token] >= self.per_share_token:
+            return False
+        return True
+
+    def _grant(self, ticket: RunTicket):
+        ticket.granted_at = time.monotonic()
+        self._running[ticket.id] = ticket
+        if ticket.flow_id is not None:
+            self._by_flow[ticket.flow_id] += 1
+        if ticket.share_token:
+            self._by_token[ticket.share_token] += 1
+        ticket._changed.set()
+
+    def _dispatch(self):
+        """Grant every waiting ticket that fits, in queue order, and wake the rest to re-read their position."""
+        for ticket in list(self._queue):
+            if self.max_concurrent and len(self._running) >= self.max_concurrent:
+                break
+            if self._fits(ticket):
+                self._queue.remove(ticket)
+                self._grant(ticket)
+        for ticket in self._queue:
+            ticket._changed.set()
+        if not self.max_queue or len(self._queue) < self.max_queue:
+            self._room.set()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Running and waiting runs for the queue endpoint."""
+        def describe(ticket: RunTicket) -> Dict[str, Any]:
+            return {
+                "source": ticket.source,
+                "flow_id": ticket.flow_id,
+                # Enough to tell tokens apart without exposing them
+                "share_token": f"{ticket.share_token[:6]}…" if ticket.share_token else None,
+                "waited_s": round(ticket.waited, 3)
+            }
+
+        return {
+            "limits": {
+                "max_concurrent": self.max_concurrent,
+                "per_flow": self.per_flow,
+                "per_share_token": self.per_share_token,
+                "max_queue": self.max_queue
+            },
+            "running": len(self._running),
+            "queued": len(self._queue),
+            "shed": self.shed,
+            "running_runs": [describe(t) for t in self._running.values()],
+            "queue": [{"position": i + 1, **describe(t)} for i, t in enumerate(self._queue)]
+        }
+
+
+# Global run scheduler
+run_scheduler = RunScheduler(
+    settings.max_concurrent_runs,
+    settings.max_runs_per_flow,
+    settings.max_runs_per_share_token,
+    settings.run_queue_size
+)
@@ -0,0 +1,162 @@
+"""Batched, non-blocking persistence of FlowRun records."""
+import asyncio
+import logging
+from typing import Dict, Any, List
+
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+
+from app.config import settings
+from app.models import FlowRun, SessionLocal
+from app.services import run_rollups
+
+logger = logging.getLogger(__name__)
+
+# Seconds before updates of a failed batch are written again
+RETRY_DELAY = 1.0
+
+
+class RunWriter:
+    """
+    Writes FlowRun rows from one background task so request handlers and
+    event streams never wait on a database round-trip.
+
+    ``update`` merges field changes per run and returns at once; ``create``
+    waits only for its row's id. Everything queued within ``batch_delay``
+    seconds (or as soon as ``max_batch`` writes are pending) goes out in one
+    transaction on a worker thread, together with the per-flow rollups of
+    runs that finished (app.services.run_rollups). Reads may trail queued
+    updates by that delay. Updates of a batch that fails are queued again
+    under any newer ones and retried; ``flush`` waits for them too.
+    """
+
+    def __init__(self, batch_delay: float, max_batch: int):
+        self.batch_delay = batch_delay
+        self.max_batch = max_batch
+        self._creates: List[tuple] = []
+        self._updates: Dict[int, Dict[str, Any]] = {}
+        self._waiters: List[asyncio.Future] = []
+        self._task = None
+        self._wake = None
+        self._busy = False
+        self.batches = 0
+        self.rows = 0
+        self.errors = 0
+
+    async def create(self, **fields) -> int:
+        """Insert a FlowRun with the next batch and return its id."""
+        future = asyncio.get_running_loop().create_future()
+        self._creates.append((fields, future))
+        self._kick()
+        return await future
+
+    def update(self, run_id: int, **fields):
+        """Queue column changes for a run; later calls override earlier ones field by field."""
+        self._updates.setdefault(run_id, {}).update(fields)
+        self._kick()
+
+    async def flush(self):
+        """Wait until everything queued so far is written."""
+        if not self._creates and not self._updates and not self._busy:
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        self._kick()
+        await future
+
+    def _kick(self):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop (e.g. a stream finalized by the garbage collector): written with the next batch
+            return
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._wake = asyncio.Event()
+            self._task = loop.create_task(self._run())
+        self._wake.set()
+
+    async def _run(self):
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            if len(self._creates) + len(self._updates) < self.max_batch:
+                # Let writes from other runs join this batch
+                await asyncio.sleep(self.batch_delay)
+            creates, self._creates = self._creates, []
+            updates, self._updates = self._updates, {}
+            failed = False
+            if creates or updates:
+                self._busy = True
+                try:
+                    ids = await asyncio.to_thread(self._write, [fields for fields, _ in creates], updates)
+                except Exception as e:
+                    self.errors += 1
+                    logger.error("❌ Failed to write %d new and %d updated flow runs: %s", len(creates), len(updates), e, exc_info=True)
+                    for _, future in creates:
+                        if not future.done():
+                            future.set_exception(e)
+                    # Changes queued meanwhile are newer
+                    for run_id, fields in updates.items():
+                        self._updates[run_id] = {**fields, **self._updates.get(run_id, {})}
+                    failed = bool(updates)
+                else:
+                    for (_, future), run_id in zip(creates, ids):
+                        if not future.done():
+                            future.set_result(run_id)
+                finally:
+                    self._busy = False
+            if failed:
+                await asyncio.sleep(RETRY_DELAY)
+            if self._creates or self._updates:
+                self._wake.set()
+            else:
+                waiters, self._waiters = self._waiters, []
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(None)
+
+    def _write(self, creates: List[Dict[str, Any]], updates: Dict[int, Dict[str, Any]]) -> List[int]:
+        """One transaction for the whole batch (runs on a worker thread)."""
+        try:
+            return self._write_once(creates, updates)
+        except IntegrityError:
+            # Another process created the same (flow, day) rollup row first; it exists now
+            logger.info("🔁 Retrying flow run batch after a concurrent rollup insert")
+            return self._write_once(creates, updates)
+
+    def _write_once(self, creates: List[Dict[str, Any]], updates: Dict[int, Dict[str, Any]]) -> List[int]:
+        with SessionLocal() as db:
+            rows = [FlowRun(**fields) for fields in creates]
+            db.add_all(rows)
+            db.flush()
+            ids = [row.id for row in rows]
+            # Runs deleted meanwhile (e.g. with their flow) are skipped
+            before = run_rollups.contributions(
+                db.query(*run_rollups.ROLLUP_COLUMNS).filter(FlowRun.id.in_(list(updates)))
+            ) if updates else {}
+            params = [{"id": run_id, **fields} for run_id, fields in updates.items() if run_id in before]
+            if params:
+                db.execute(update(FlowRun), params)
+                finishing = [p["id"] for p in params if "status" in p or "completed_at" in p]
+                if finishing:
+                    after = run_rollups.contributions(
+                        db.query(*run_rollups.ROLLUP_COLUMNS).filter(FlowRun.id.in_(finishing))
+                    )
+                    run_rollups.apply(db, {run_id: before[run_id] for run_id in finishing}, after)
+            db.commit()
+        self.batches += 1
+        self.rows += len(ids) + len(params)
+        return ids
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending_creates": len(self._creates),
+            "pending_updates": len(self._updates),
+            "batches": self.batches,
+            "rows": self.rows,
+            "errors": self.errors
+        }
+
+
+# Global run writer
+run_writer = RunWriter(settings.run_write_batch_ms / 1000, settings.run_write_batch_size)
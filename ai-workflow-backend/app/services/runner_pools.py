@@ -0,0 +1,254 @@
+"""Worker pools that keep synchronous node runners off the event loop."""
+import asyncio
+import importlib
+import inspect
+import logging
+import multiprocessing
+import pickle
+import threading
+from contextvars import ContextVar
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, Callable, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+ASYNC = "async"
+INLINE = "inline"
+IO_BOUND = "io"
+CPU_BOUND = "cpu"
+
+# State entries that only make sense inside the API process
+PROCESS_EXCLUDED_STATE_KEYS = {"background_tasks"}
+
+# Cancellation flag of the thread-pool job running in the current worker thread
+_cancel_event: ContextVar[Optional[threading.Event]] = ContextVar("runner_cancel_event", default=None)
+
+
+def cancellation_requested() -> bool:
+    """
+    True once the node running in this worker thread was cancelled or timed out.
+    
+    Threads cannot be interrupted, so long-running sync runners should poll
+    this between steps and return early.
+    """
+    event = _cancel_event.get()
+    return event is not None and event.is_set()
+
+
+class PoolMetrics:
+    """
+    Saturation counters for one worker pool.
+
+    Thread workers report when they actually start; process workers cannot,
+    so for them ``active`` is derived from in-flight jobs and pool size.
+    """
+
+    def __init__(self, name: str, max_workers: int, tracks_active: bool = True):
+        self.name = name
+        self.max_workers = max_workers
+        self.tracks_active = tracks_active
+        self.submitted = 0
+        self.active = 0
+        self.completed = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+
+    def submit(self):
+        with self._lock:
+            self.submitted += 1
+
+    def started(self):
+        with self._lock:
+            self.active += 1
+
+    def dropped(self):
+        """A queued job was cancelled before a worker picked it up."""
+        with self._lock:
+            self.failed += 1
+
+    def finished(self, ok: bool):
+        with self._lock:
+            if self.tracks_active:
+                self.active -= 1
+            if ok:
+                self.completed += 1
+            else:
+                self.failed += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            in_flight = self.submitted - self.completed - self.failed
+            active = self.active if self.tracks_active else min(in_flight, self.max_workers)
+            return {
+                "max_workers": self.max_workers,
+                "active": active,
+                "queued": max(0, in_flight - active),
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "saturation": round(active / self.max_workers, 3) if self.max_workers else 0.0
+            }
+
+
+# Runner instances created inside process-pool workers, keyed by "module:qualname"
+_process_runners: Dict[str, Any] = {}
+
+
+def _run_in_process(runner_path: str, payload: bytes) -> Dict[str, Any]:
+    """Process-pool entry point: import a runner class by dotted path and run it on the pickled ``(node_data, state)``."""
+    node_data, state = pickle.loads(payload)
+    runner = _process_runners.get(runner_path)
+    if runner is None:
+        module_name, qualname = runner_path.split(":", 1)
+        runner = getattr(importlib.import_module(module_name), qualname)()
+        _process_runners[runner_path] = runner
+    return runner.run(node_data, state)
+
+
+class RunnerPools:
+    """
+    Classifies runners once and dispatches their ``run`` to the right place.
+
+    Async runners are awaited directly, ``inline`` runners run on the loop,
+    I/O-bound sync runners go to a bounded thread pool and CPU-bound sync
+    runners to a process pool (or the thread pool when it is disabled).
+    """
+
+    def __init__(self, thread_workers: int, process_workers: int):
+        self.thread_workers = max(1, thread_workers)
+        self.process_workers = max(0, process_workers)
+        self._threads = ThreadPoolExecutor(max_workers=self.thread_workers, thread_name_prefix="runner")
+        self._processes = None
+        self._process_lock = threading.Lock()
+        self._modes: Dict[int, tuple] = {}
+        self.thread_metrics = PoolMetrics("thread", self.thread_workers)
+        self.process_metrics = PoolMetrics("process", self.process_workers, tracks_active=False)
+
+    def classify(self, runner) -> str:
+        """Return the execution mode of a runner, computing it only once."""
+        cached = self._modes.get(id(runner))
+        if cached is not None:
+            return cached[1]
+
+        target = runner.run if hasattr(runner, "run") else runner
+        if inspect.iscoroutinefunction(target):
+            mode = ASYNC
+        else:
+            mode = getattr(runner, "execution_mode", IO_BOUND)
+            if mode == CPU_BOUND and (not hasattr(runner, "run") or not self.process_workers):
+                # Plain functions cannot be re-imported by path; no process pool means threads
+                mode = IO_BOUND
+        # Keep a reference to the runner so its id() can never be reused
+        self._modes[id(runner)] = (runner, mode)
+        return mode
+
+    async def run(self, runner, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a runner according to its execution mode."""
+        mode = self.classify(runner)
+        target = runner.run if hasattr(runner, "run") else runner
+
+        if mode == ASYNC:
+            return await target(node_data, state)
+        if mode == INLINE:
+            return target(node_data, state)
+        if mode == CPU_BOUND:
+            payload = self._process_payload(runner, node_data, state)
+            if payload is not None:
+                return await self._run_in_processes(runner, payload)
+        return await self._run_in_threads(target, node_data, state)
+
+    async def _run_in_threads(self, target: Callable, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
+        metrics = self.thread_metrics
+        cancel_event = threading.Event()
+        job_lock = threading.Lock()
+        job = {"started": False, "dropped": False}
+
+        def call():
+            with job_lock:
+                if job["dropped"]:
+                    return None
+                job["started"] = True
+            metrics.started()
+            token = _cancel_event.set(cancel_event)
+            ok = False
+            try:
+                result = target(node_data, state)
+                ok = True
+                return result
+            finally:
+                _cancel_event.reset(token)
+                metrics.finished(ok)
+
+        metrics.submit()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._threads, call)
+        except asyncio.CancelledError:
+            # Signal a running job cooperatively; a queued one never starts
+            cancel_event.set()
+            with job_lock:
+                if not job["started"]:
+                    job["dropped"] = True
+                    metrics.dropped()
+            raise
+
+    def _process_payload(self, runner, node_data: Dict[str, Any], state: Dict[str, Any]) -> Optional[bytes]:
+        """``(node_data, state)`` pickled for the process pool, or None to fall back to threads."""
+        process_state = {k: v for k, v in state.items() if k not in PROCESS_EXCLUDED_STATE_KEYS}
+        try:
+            # Sent as these bytes, so the state is only pickled once
+            return pickle.dumps((node_data, process_state), protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.warning(f"⚠️ State not picklable for {type(runner).__name__} ({e}); using thread pool.")
+            return None
+
+    async def _run_in_processes(self, runner, payload: bytes) -> Dict[str, Any]:
+        runner_path = f"{type(runner).__module__}:{type(runner).__qualname__}"
+        metrics = self.process_metrics
+        metrics.submit()
+        ok = False
+        try:
+            future = self._process_pool().submit(_run_in_process, runner_path, payload)
+            result = await asyncio.wrap_future(future)
+            ok = True
+            return result
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM); start a fresh pool for the next job
+            with self._process_lock:
+                self._processes = None
+            raise
+        finally:
+            metrics.finished(ok)
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        # Created lazily so importing the executor never starts workers; spawned, not
+        # forked, since forking a process running threads can copy locks held mid-use
+        with self._process_lock:
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(
+                    max_workers=self.process_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._processes
+
+    def metrics(self) -> Dict[str, Any]:
+        """Saturation snapshot of both pools."""
+        return {
+            "thread_pool": self.thread_metrics.snapshot(),
+            "process_pool": self.process_metrics.snapshot()
+        }
+
+    def shutdown(self):
+        """Stop both pools without waiting for queued work."""
+        self._threads.shutdown(wait=False, cancel_futures=True)
+        if self._processes is not None:
+            self._processes.shutdown(wait=False, cancel_futures=True)
+
+
+# Global runner pools
+runner_pools = RunnerPools(
+    thread_workers=settings.runner_thread_pool_size,
+    process_workers=settings.runner_process_pool_size
+)
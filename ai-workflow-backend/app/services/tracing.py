@@ -0,0 +1,254 @@
+"""Sampled, low-overhead tracing for flow runs and their Chrome trace export."""
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import time
+from typing import Dict, Any, List, Optional
+
+from app.config import settings
+
+logger = logging.getLogger("app.trace")
+
+
+class Span:
+    """One timed section of a run: a node, a phase of a node, or an emitted event."""
+
+    __slots__ = ("name", "start", "end", "attrs", "index", "parent")
+
+    def __init__(self, name: str, start: float, attrs: Dict[str, Any], index: int, parent: Optional[int] = None):
+        self.name = name
+        self.start = start
+        self.end = None
+        self.attrs = attrs
+        self.index = index
+        self.parent = parent
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end or time.perf_counter()) - self.start) * 1000
+
+    def to_dict(self, origin: float) -> Dict[str, Any]:
+        span = {
+            "name": self.name,
+            "start_ms": round((self.start - origin) * 1000, 3),
+            "duration_ms": round(self.duration_ms, 3),
+            **self.attrs
+        }
+        if self.parent is not None:
+            span["parent"] = self.parent
+        return span
+
+
+class RunTrace:
+    """
+    Spans of one sampled run.
+
+    The executor calls ``start``/``finish`` unconditionally; unsampled runs
+    get ``NULL_TRACE`` whose methods do nothing, so the hot path pays one
+    attribute check per node instead of timing and formatting.
+    """
+
+    sampled = True
+
+    def __init__(self, run_id: str = None, log: bool = True):
+        self.run_id = run_id
+        # Whether the spans are logged when the run ends (profiles may be kept without logging)
+        self.log = log
+        self.origin = time.perf_counter()
+        self.spans: List[Span] = []
+        self._ready: Dict[Any, float] = {}
+        # Summary recorded elsewhere (a worker process) for this run
+        self._adopted: Optional[Dict[str, Any]] = None
+
+    def ready(self, key: Any):
+        """Mark a node as ready to run; its span reports the wait until it starts."""
+        self._ready.setdefault(key, time.perf_counter())
+
+    def start(self, name: str, key: Any = None, parent: Optional[Span] = None, **attrs) -> Span:
+        span = Span(name, time.perf_counter(), attrs, len(self.spans), parent.index if parent is not None else None)
+        ready_at = self._ready.pop(key, None) if key is not None else None
+        if ready_at is not None:
+            span.attrs["queue_ms"] = round((span.start - ready_at) * 1000, 3)
+        self.spans.append(span)
+        return span
+
+    def finish(self, span: Optional[Span], **attrs):
+        if span is None:
+            return
+        span.end = time.perf_counter()
+        span.attrs.update(attrs)
+
+    def adopt(self, summary: Dict[str, Any]):
+        """Report the spans a worker process recorded for this run (see app.services.execution_pool)."""
+        self._adopted = summary
+
+    def summary(self) -> Dict[str, Any]:
+        if self._adopted is not None:
+            return dict(self._adopted)
+        return {
+            "run_id": self.run_id,
+            "duration_ms": round((time.perf_counter() - self.origin) * 1000, 3),
+            "spans": [span.to_dict(self.origin) for span in self.spans]
+        }
+
+
+class _NullTrace:
+    """Trace of an unsampled run."""
+
+    sampled = False
+    run_id = None
+    spans: List[Span] = []
+
+    def ready(self, key: Any):
+        pass
+
+    def start(self, name: str, key: Any = None, parent: Optional[Span] = None, **attrs) -> None:
+        return None
+
+    def finish(self, span: Optional[Span], **attrs):
+        pass
+
+    def summary(self) -> Dict[str, Any]:
+        return {}
+
+
+NULL_TRACE = _NullTrace()
+
+
+class _LazyJSON:
+    """Log argument that is only serialized if a handler formats the record."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __str__(self) -> str:
+        return json.dumps(self.value, default=str, separators=(",", ":"))
+
+
+class Tracer:
+    """Decides which runs are traced and reports their spans when they end."""
+
+    def __init__(self, sample_rate: float):
+        self.sample_rate = sample_rate
+
+    def start_run(self, run_id: str = None, force: bool = False):
+        """
+        RunTrace for a sampled run, otherwise NULL_TRACE. ``force`` always
+        records spans (e.g. for a persisted profile) but only sampled runs are logged.
+        """
+        sampled = self.sample_rate > 0 and random.random() < self.sample_rate
+        if sampled or force:
+            return RunTrace(run_id, log=sampled)
+        return NULL_TRACE
+
+    def finish_run(self, trace, status: str = "success"):
+        """Log the spans of a sampled run as one structured record."""
+        if not trace.sampled or not trace.log or not logger.isEnabledFor(logging.INFO):
+            return
+        summary = trace.summary()
+        summary["status"] = status
+        logger.info("trace run=%s status=%s %s", trace.run_id, status, _LazyJSON(summary), extra={"trace": summary})
+
+
+def payload_size(result: Any) -> int:
+    """Approximate size of a node result: the length of its top-level string values."""
+    if not isinstance(result, dict):
+        return 0
+    return sum(len(value) for value in result.values() if isinstance(value, str))
+
+
+def chrome_trace(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a stored run profile (``RunTrace.summary()``) to Chrome Trace Event
+    JSON, loadable in chrome://tracing or ui.perfetto.dev.
+
+    Nodes that overlap in time are spread over separate tracks so parallel
+    branches show side by side; a node's phases (credentials, cache, runner)
+    nest under it and emitted events sit on their own track.
+    """
+    spans = profile.get("spans", [])
+    run_label = f"Flow run {profile.get('run_id')}"
+    events = [
+        {"name": "process_name", "ph": "M", "pid": 1, "tid": 0, "args": {"name": run_label}},
+        {"name": "thread_name", "ph": "M", "pid": 1, "tid": 0, "args": {"name": "events"}}
+    ]
+
+    # Greedy track assignment: each top-level node goes on the first track free at its start
+    tracks: List[float] = []
+    tids: Dict[int, int] = {}
+    ordered = sorted(
+        (i for i, span in enumerate(spans) if span.get("parent") is None and span["name"] != "emit"),
+        key=lambda i: spans[i]["start_ms"]
+    )
+    for i in ordered:
+        start, end = spans[i]["start_ms"], spans[i]["start_ms"] + spans[i]["duration_ms"]
+        for track, busy_until in enumerate(tracks):
+            if busy_until <= start:
+                tracks[track] = end
+                break
+        else:
+            tracks.append(end)
+            track = len(tracks) - 1
+            events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": track + 1, "args": {"name": f"track {track + 1}"}})
+        tids[i] = track + 1
+
+    for i, span in enumerate(spans):
+        parent = span.get("parent")
+        root = i
+        while spans[root].get("parent") is not None:
+            root = spans[root]["parent"]
+        args = {k: v for k, v in span.items() if k not in ("name", "start_ms", "duration_ms", "parent")}
+        if span["name"] == "node":
+            name = f"{span.get('node_type')} {span.get('node_id')}"
+        elif span["name"] == "emit":
+            name = f"emit {span.get('event')}"
+        else:
+            name = span["name"]
+        events.append({
+            "name": name,
+            "cat": span["name"] if parent is None else "phase",
+            "ph": "X",
+            "ts": round(span["start_ms"] * 1000, 1),
+            "dur": round(span["duration_ms"] * 1000, 1),
+            "pid": 1,
+            "tid": tids.get(root, 0),
+            "args": args
+        })
+
+    events.append({
+        "name": "run", "cat": "run", "ph": "X", "ts": 0, "dur": round(profile.get("duration_ms", 0) * 1000, 1),
+        "pid": 1, "tid": 0, "args": {"status": profile.get("status")}
+    })
+    return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"run_id": profile.get("run_id")}}
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def install_queue_logging():
+    """
+    Move the root logger's handlers behind a QueueHandler so request and node
+    code never block on console or file I/O; a background thread writes records.
+    """
+    global _listener
+    root = logging.getLogger()
+    if _listener is not None or not root.handlers:
+        return
+    log_queue = queue.SimpleQueue()
+    handlers = list(root.handlers)
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    # Flush whatever is still queued when the process exits
+    atexit.register(_listener.stop)
+
+
+# Global tracer
+tracer = Tracer(settings.trace_sample_rate)
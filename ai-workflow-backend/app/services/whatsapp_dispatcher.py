@@ -0,0 +1,130 @@
+"""Ordered per-sender processing of incoming WhatsApp messages."""
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from typing import Awaitable, Callable, Deque, Dict, Any, NamedTuple, Optional
+
+from app.config import settings
+from app.services.run_scheduler import QueueFull
+
+logger = logging.getLogger(__name__)
+
+
+class WhatsAppMessage(NamedTuple):
+    sender: str
+    content: str
+    received: float
+
+
+class WhatsAppDispatcher:
+    """
+    Hands incoming messages to ``handler(sender, content)`` so that each
+    sender's messages are processed strictly one after another, in arrival
+    order, while up to ``max_senders`` senders are processed at once.
+
+    Messages whose bridge ID was already seen are dropped. With a
+    ``coalesce_window`` (seconds), messages a sender sends within that window
+    of the first one of a burst are joined with newlines and handled as one
+    message. ``submit`` raises QueueFull once ``max_pending`` messages wait.
+    """
+
+    def __init__(self, max_senders: int, max_pending: int, coalesce_window: float, dedupe_size: int,
+                 handler: Callable[[str, str], Awaitable[None]] = None):
+        self.max_pending = max_pending
+        self.coalesce_window = coalesce_window
+        self.dedupe_size = dedupe_size
+        # Set by the webhook module, which owns message processing
+        self.handler = handler
+        self._slots = asyncio.Semaphore(max_senders) if max_senders > 0 else None
+        self._queues: Dict[str, Deque[WhatsAppMessage]] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+        self._pending = 0
+        self.processed = 0
+        self.duplicates = 0
+        self.coalesced = 0
+        self.shed = 0
+
+    def submit(self, sender: str, content: str, message_id: Optional[str] = None) -> bool:
+        """Queue a message; returns False for a duplicate. Raises QueueFull when too many messages wait."""
+        if message_id:
+            if message_id in self._seen:
+                self._seen.move_to_end(message_id)
+                self.duplicates += 1
+                return False
+        if self.max_pending and self._pending >= self.max_pending:
+            self.shed += 1
+            logger.warning("🚦 WhatsApp queue full (%d waiting); shedding message from %s", self._pending, sender)
+            raise QueueFull(f"WhatsApp message queue is full ({self._pending} waiting)")
+        if message_id:
+            self._seen[message_id] = None
+            if len(self._seen) > self.dedupe_size:
+                self._seen.popitem(last=False)
+
+        self._queues.setdefault(sender, deque()).append(WhatsAppMessage(sender, content, time.monotonic()))
+        self._pending += 1
+        if sender not in self._workers:
+            self._workers[sender] = asyncio.create_task(self._drain(sender), name=f"whatsapp-{sender}")
+        return True
+
+    async def _drain(self, sender: str):
+        """Process one sender's queue until it is empty."""
+        queue = self._queues[sender]
+        try:
+            while queue:
+                if self.coalesce_window:
+                    # Let the rest of the burst arrive, then take it all
+                    delay = queue[0].received + self.coalesce_window - time.monotonic()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    batch = list(queue)
+                    queue.clear()
+                else:
+                    batch = [queue.popleft()]
+                self._pending -= len(batch)
+                self.coalesced += len(batch) - 1
+                content = "\n".join(message.content for message in batch)
+                if self._slots is not None:
+                    async with self._slots:
+                        await self._handle(sender, content)
+                else:
+                    await self._handle(sender, content)
+        finally:
+            self._pending -= len(queue)
+            del self._queues[sender]
+            del self._workers[sender]
+
+    async def _handle(self, sender: str, content: str):
+        try:
+            await self.handler(sender, content)
+        except Exception as e:
+            # One failing message must not stall the sender's later ones
+            logger.error("❌ WhatsApp message from %s failed: %s", sender, e, exc_info=True)
+        self.processed += 1
+
+    async def shutdown(self):
+        """Drop waiting messages and cancel the ones being processed."""
+        tasks = list(self._workers.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "active_senders": len(self._workers),
+            "pending": self._pending,
+            "processed": self.processed,
+            "duplicates": self.duplicates,
+            "coalesced": self.coalesced,
+            "shed": self.shed
+        }
+
+
+# Global WhatsApp dispatcher
+whatsapp_dispatcher = WhatsAppDispatcher(
+    settings.whatsapp_max_concurrent_senders,
+    settings.whatsapp_queue_size,
+    settings.whatsapp_coalesce_ms / 1000,
+    settings.whatsapp_dedupe_size
+)
@@ -1,13 +1,30 @@
 import os
 import subprocess
-import requests
+import asyncio
 import logging
+import random
 import time
 import threading
-from typing import Optional, Dict, Any
+from typing import NamedTuple, Optional, Dict, Any, List
+
+import httpx
+
+from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Seconds before the first retry of a failed send; doubled for each further attempt
+_BACKOFF_BASE = 0.5
+
+# Raised before a request reached the bridge; anything later may already have been sent, so it is not retried
+_NOT_SENT = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class _Outgoing(NamedTuple):
+    to: str
+    message: str
+    result: asyncio.Future
+
 class WhatsAppService:
     def __init__(self, bridge_path: str = None, port: int = 3001):
         # Calculate absolute path to bridge directory
@@ -21,10 +38,29 @@ class WhatsAppService:
         self.port = port
         self.base_url = f"http://localhost:{port}"
         self.process = None
-        self._start_bridge_in_background()
+        # Off when something else serves the bridge port (a separately run bridge, benchmarks.fake_bridge)
+        self.autostart = settings.whatsapp_bridge_autostart
+        self.status_ttl = settings.whatsapp_status_cache_ttl
+        self.retries = settings.whatsapp_send_retries
+        self.batch_size = max(1, settings.whatsapp_send_batch_size)
+        # Assumed until the bridge answers 404 to a batch
+        self._batch_supported = self.batch_size > 1
+        self._status: Optional[tuple] = None  # (fetched at, status)
+        self._status_request: Optional[asyncio.Future] = None
+        self._loop = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._outbox: Optional[asyncio.Queue] = None
+        self._senders: List[asyncio.Task] = []
+
+    def start(self):
+        """Launch the Node.js bridge (called from app startup, not at import)."""
+        if self.process is None or self.process.poll() is not None:
+            self._start_bridge_in_background()
 
     def _start_bridge_in_background(self):
         """Starts the Node.js bridge in a separate thread/process."""
+        if not self.autostart:
+            return
         def run_bridge():
             try:
                 # Check if node_modules exists
@@ -51,42 +87,216 @@ class WhatsAppService:
         thread = threading.Thread(target=run_bridge, daemon=True)
         thread.start()
 
-    def get_status(self) -> Dict[str, Any]:
-        """Gets the connection status and QR code from the bridge."""
+    async def get_status(self) -> Dict[str, Any]:
+        """
+        Gets the connection status and QR code from the bridge. Results are
+        reused for ``status_ttl`` seconds and concurrent callers share one
+        request, so frontend polling does not reach the bridge every time.
+        """
+        self._bind_loop()
+        if self._status is not None and time.monotonic() - self._status[0] < self.status_ttl:
+            return self._status[1]
+        if self._status_request is None:
+            self._status_request = asyncio.ensure_future(self._fetch_status())
+        request = self._status_request
         try:
-            response = requests.get(f"{self.base_url}/status", timeout=5)
+            return await asyncio.shield(request)
+        finally:
+            if request.done() and self._status_request is request:
+                self._status_request = None
+
+    async def _fetch_status(self) -> Dict[str, Any]:
+        try:
+            response = await self._http().get("/status", timeout=5)
             if response.status_code == 200:
-                return response.json()
+                status = response.json()
+                self._status = (time.monotonic(), status)
+                return status
         except Exception as e:
             logger.error(f"Error getting bridge status: {str(e)}")
             # If bridge unreachable, try to restart it
             logger.info("⚡ Bridge unreachable, attempting restart...")
             self._start_bridge_in_background()
             
-        return {"status": "connecting", "message": "Bridge is starting up..."}
+        status = {"status": "connecting", "message": "Bridge is starting up..."}
+        # Cached too, so polling a down bridge does not trigger a restart per request
+        self._status = (time.monotonic(), status)
+        return status
+
+    async def send(self, to: str, message: str) -> bool:
+        """
+        Sends a message via the WhatsApp bridge and reports whether it was
+        delivered. Messages wait in a bounded outbound queue (callers wait
+        while it is full) and are retried with jittered backoff when the
+        bridge is unreachable or answers 5xx/429.
+        """
+        # Ensure the JID is formatted correctly
+        if "@" not in to:
+            to = f"{to}@s.whatsapp.net"
+        self._bind_loop()
+        if not self._senders:
+            self._senders = [
+                asyncio.create_task(self._send_loop(), name=f"whatsapp-send-{i}")
+                for i in range(max(1, settings.whatsapp_send_concurrency))
+            ]
+        result = asyncio.get_running_loop().create_future()
+        await self._outbox.put(_Outgoing(to, message, result))
+        return await result
+
+    async def _send_loop(self):
+        while True:
+            batch = [await self._outbox.get()]
+            # Whatever else is already waiting goes out in the same request
+            while len(batch) < self.batch_size and not self._outbox.empty():
+                batch.append(self._outbox.get_nowait())
+            try:
+                await self._deliver(batch)
+            except Exception as e:
+                logger.error(f"Error sending WhatsApp message: {str(e)}")
+                self._settle(batch, False)
+
+    async def _deliver(self, batch: List["_Outgoing"]):
+        pending = batch
+        for attempt in range(self.retries + 1):
+            if attempt:
+                # Exponential backoff with jitter, so retries from many runs do not arrive together
+                await asyncio.sleep(_BACKOFF_BASE * 2 ** (attempt - 1) * random.uniform(0.5, 1.5))
+            pending = await self._post(pending)
+            if not pending:
+                return
+        logger.error(f"❌ Giving up on {len(pending)} WhatsApp message(s) after {self.retries + 1} attempts")
+        self._settle(pending, False)
+
+    async def _post(self, items: List["_Outgoing"]) -> List["_Outgoing"]:
+        """Send items, settling those that succeed or cannot succeed; returns the ones worth retrying."""
+        if len(items) > 1 and self._batch_supported:
+            retry = await self._post_batch(items)
+            if retry is not None:
+                return retry
+        results = await asyncio.gather(*(self._post_one(item) for item in items))
+        return [item for item, retry in zip(items, results) if retry]
 
-    def send_message(self, to: str, message: str) -> bool:
-        """Sends a message via the WhatsApp bridge."""
+    async def _post_batch(self, items: List["_Outgoing"]) -> Optional[List["_Outgoing"]]:
         try:
-            # Ensure the JID is formatted correctly
-            if "@" not in to:
-                to = f"{to}@s.whatsapp.net"
-                
-            response = requests.post(
-                f"{self.base_url}/send",
-                json={"to": to, "message": message},
-                timeout=20
+            response = await self._http().post(
+                "/send-batch", json={"messages": [{"to": i.to, "message": i.message} for i in items]}, timeout=20 + 5 * len(items)
             )
-            
-            if response.status_code == 428 or response.status_code == 401:
-                logger.error(f"❌ WhatsApp connection lost ({response.status_code}). Please re-scan QR code if needed.")
-                # We could trigger a restart, but usually Baileys handles reconnects unless the session is dead
-                return False
-                
-            return response.status_code == 200
-        except Exception as e:
-            logger.error(f"Error sending WhatsApp message: {str(e)}")
+        except _NOT_SENT as e:
+            logger.warning(f"WhatsApp bridge unreachable: {str(e)}")
+            return items
+        except httpx.HTTPError as e:
+            logger.error(f"❌ WhatsApp batch of {len(items)} may or may not have been sent, not retrying: {type(e).__name__}")
+            self._settle(items, False)
+            return []
+        if response.status_code == 404:
+            logger.info("ℹ️ WhatsApp bridge has no /send-batch; sending messages one by one")
+            self._batch_supported = False
+            return None
+        if self._retriable(response.status_code):
+            return items
+        if response.status_code != 200:
+            self._connection_lost(response.status_code)
+            self._settle(items, False)
+            return []
+        results = response.json().get("results", [])
+        for index, item in enumerate(items):
+            result = results[index] if index < len(results) else {}
+            if result.get("status") != "success":
+                logger.error(f"❌ WhatsApp bridge failed to send a batched message: {result.get('error', 'no result')}")
+            self._settle([item], result.get("status") == "success")
+        return []
+
+    async def _post_one(self, item: "_Outgoing") -> bool:
+        """Send one item; returns True if it should be retried."""
+        try:
+            response = await self._http().post("/send", json={"to": item.to, "message": item.message}, timeout=20)
+        except _NOT_SENT as e:
+            logger.warning(f"WhatsApp bridge unreachable: {str(e)}")
+            return True
+        except httpx.HTTPError as e:
+            logger.error(f"❌ WhatsApp message may or may not have been sent, not retrying: {type(e).__name__}")
+            self._settle([item], False)
             return False
+        if self._retriable(response.status_code):
+            return True
+        self._connection_lost(response.status_code)
+        self._settle([item], response.status_code == 200)
+        return False
+
+    @staticmethod
+    def _retriable(status_code: int) -> bool:
+        return status_code == 429 or status_code >= 500
+
+    @staticmethod
+    def _connection_lost(status_code: int):
+        if status_code == 428 or status_code == 401:
+            logger.error(f"❌ WhatsApp connection lost ({status_code}). Please re-scan QR code if needed.")
+
+    @staticmethod
+    def _settle(items: List["_Outgoing"], success: bool):
+        for item in items:
+            if not item.result.done():
+                item.result.set_result(success)
+
+    def _http(self) -> httpx.AsyncClient:
+        """Keep-alive connection pool to the bridge, one per event loop."""
+        if self._client is None:
+            pool = settings.whatsapp_bridge_pool_size
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                limits=httpx.Limits(max_connections=pool, max_keepalive_connections=pool)
+            )
+        return self._client
+
+    def _bind_loop(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        # Clients, queues and tasks belong to one loop (tests and worker processes run their own)
+        if self._loop is not None:
+            self._release_loop()
+        self._loop = loop
+        self._outbox = asyncio.Queue(maxsize=settings.whatsapp_send_queue_size)
+        self._status_request = None
+
+    def _release_loop(self):
+        """Stop the senders and close the client of the loop this service is bound to, from outside that loop."""
+        old_loop, client, senders = self._loop, self._client, self._senders
+        self._loop, self._client, self._senders = None, None, []
+        waiting = self._outbox.qsize() if self._outbox is not None else 0
+        if waiting:
+            logger.warning("⚠️ Dropping %d WhatsApp messages queued on a previous event loop", waiting)
+        if old_loop.is_running() and not old_loop.is_closed():
+            # Still serving another thread: clean up there
+            for task in senders:
+                old_loop.call_soon_threadsafe(task.cancel)
+            if client is not None:
+                asyncio.run_coroutine_threadsafe(client.aclose(), old_loop)
+        else:
+            # A stopped loop never runs its tasks again; dropping them and the client frees their sockets
+            logger.debug("Abandoning %d WhatsApp senders of a stopped event loop", len(senders))
+
+    async def close(self):
+        """Stop the outbound senders and close the bridge connections (at shutdown)."""
+        if self._loop is None:
+            return
+        if self._loop is not asyncio.get_running_loop():
+            self._release_loop()
+            return
+        for task in self._senders:
+            task.cancel()
+        await asyncio.gather(*self._senders, return_exceptions=True)
+        self._senders = []
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "outbox": self._outbox.qsize() if self._outbox is not None else 0,
+            "batch_supported": self._batch_supported,
+            "status_cached": self._status is not None and time.monotonic() - self._status[0] < self.status_ttl
+        }
 
     def reset_bridge(self):
         """Kills the bridge, clears auth data, and restarts."""
@@ -112,6 +322,7 @@ class WhatsAppService:
                 logger.error(f"Failed to delete auth folder: {e}")
 
         # Restart
+        self._status = None
         self._start_bridge_in_background()
         return True
 
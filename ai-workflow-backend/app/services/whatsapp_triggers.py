@@ -0,0 +1,169 @@
+"""In-memory index of flows triggered by incoming WhatsApp messages."""
+import asyncio
+import logging
+import time
+from datetime import timezone
+from typing import Dict, Any, FrozenSet, NamedTuple, Optional
+
+from app.config import settings
+from app.models import Flow, SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_number(value: str) -> str:
+    """Digits only, so "+91 98765-43210" and "919876543210@s.whatsapp.net" compare equal."""
+    return "".join(filter(str.isdigit, value))
+
+
+def sender_number(sender_jid: str) -> str:
+    return normalize_number(sender_jid.split("@")[0])
+
+
+class WhatsAppTrigger(NamedTuple):
+    flow_id: int
+    name: str
+    order: tuple  # Higher wins: most recently changed flow first, then highest id
+    allowed: Optional[FrozenSet[str]]  # None = everyone
+
+
+def _changed_at(flow: Flow) -> float:
+    value = flow.updated_at or flow.created_at
+    if value is None:
+        return time.time()
+    return (value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value).timestamp()
+
+
+def trigger_for(flow: Flow) -> Optional[WhatsAppTrigger]:
+    """The WhatsApp trigger of a flow (its first whatsAppInput node), or None if it has none."""
+    nodes = (flow.flow_data or {}).get("nodes", [])
+    node = next((n for n in nodes if n.get("type") == "whatsAppInput"), None)
+    if node is None:
+        return None
+    node_data = node.get("data") or {}
+    allowed = None
+    if node_data.get("mode", "everyone") == "specific":
+        raw = str(node_data.get("allowedNumbers") or "").replace(",", " ").split()
+        allowed = frozenset(filter(None, (normalize_number(n) for n in raw)))
+    return WhatsAppTrigger(flow.id, flow.name, (_changed_at(flow), flow.id), allowed)
+
+
+class WhatsAppTriggerIndex:
+    """
+    WhatsApp triggers of all flows, routed by sender number with dictionary
+    lookups. Saves, updates and deletes in this process update it in place;
+    a full rebuild every ``ttl`` seconds picks up changes made elsewhere
+    (other API processes, migration scripts). Rebuilds scan on a worker
+    thread; only the first waits, later ones run in the background while
+    messages are matched against the current index.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._triggers: Dict[int, WhatsAppTrigger] = {}
+        self._everyone: Optional[WhatsAppTrigger] = None
+        self._by_number: Dict[str, WhatsAppTrigger] = {}
+        self._loaded_at: Optional[float] = None
+        self._rebuild_task: Optional[asyncio.Task] = None
+        # Flow id -> trigger (None = removed) changed in this process while a rebuild scans
+        self._changes: Optional[Dict[int, Optional[WhatsAppTrigger]]] = None
+        self.rebuilds = 0
+
+    async def match(self, sender_jid: str) -> Optional[WhatsAppTrigger]:
+        """The flow a message from ``sender_jid`` triggers: the most recently changed flow whose trigger allows the sender."""
+        if self._loaded_at is None:
+            await asyncio.shield(self._start_rebuild())
+            if self._loaded_at is None:
+                raise RuntimeError("WhatsApp trigger index could not be built")
+        elif time.monotonic() - self._loaded_at > self.ttl:
+            self._start_rebuild()
+        candidates = [t for t in (self._everyone, self._by_number.get(sender_number(sender_jid))) if t is not None]
+        return max(candidates, key=lambda t: t.order, default=None)
+
+    def _start_rebuild(self) -> asyncio.Task:
+        loop = asyncio.get_running_loop()
+        task = self._rebuild_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = self._rebuild_task = loop.create_task(self._rebuild())
+        return task
+
+    async def _rebuild(self):
+        """Reload every flow's trigger with one scan, keeping changes made here while it ran."""
+        self._changes = {}
+        try:
+            triggers = await asyncio.to_thread(self._scan)
+        except Exception as e:
+            logger.error("❌ Failed to index WhatsApp-triggered flows: %s", e, exc_info=True)
+            return
+        finally:
+            changes, self._changes = self._changes, None
+        for flow_id, trigger in changes.items():
+            if trigger is None:
+                triggers.pop(flow_id, None)
+            else:
+                triggers[flow_id] = trigger
+        self._triggers = triggers
+        self._reindex()
+        self._loaded_at = time.monotonic()
+        self.rebuilds += 1
+        logger.info("📇 Indexed %d WhatsApp-triggered flows", len(triggers))
+
+    @staticmethod
+    def _scan() -> Dict[int, WhatsAppTrigger]:
+        # Runs on a worker thread with its own session
+        triggers = {}
+        with SessionLocal() as db:
+            for flow in db.query(Flow).yield_per(200):
+                trigger = trigger_for(flow)
+                if trigger is not None:
+                    triggers[flow.id] = trigger
+        return triggers
+
+    def update(self, flow: Flow):
+        """Re-read one flow's trigger after it was saved or updated."""
+        trigger = trigger_for(flow)
+        if self._changes is not None:
+            self._changes[flow.id] = trigger
+        if self._loaded_at is None:
+            return  # Built in full on the first message
+        if trigger is None and flow.id not in self._triggers:
+            return
+        if trigger is None:
+            del self._triggers[flow.id]
+        else:
+            self._triggers[flow.id] = trigger
+        self._reindex()
+
+    def remove(self, flow_id: int):
+        if self._changes is not None:
+            self._changes[flow_id] = None
+        if self._triggers.pop(flow_id, None) is not None:
+            self._reindex()
+
+    def _reindex(self):
+        # Only runs when flows change, so the message path stays two lookups
+        everyone = None
+        by_number: Dict[str, WhatsAppTrigger] = {}
+        for trigger in self._triggers.values():
+            if trigger.allowed is None:
+                if everyone is None or trigger.order > everyone.order:
+                    everyone = trigger
+                continue
+            for number in trigger.allowed:
+                current = by_number.get(number)
+                if current is None or trigger.order > current.order:
+                    by_number[number] = trigger
+        self._everyone = everyone
+        self._by_number = by_number
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "flows": len(self._triggers),
+            "numbers": len(self._by_number),
+            "open_to_everyone": self._everyone.flow_id if self._everyone else None,
+            "rebuilds": self.rebuilds
+        }
+
+
+# Global WhatsApp trigger index
+whatsapp_triggers = WhatsAppTriggerIndex(settings.whatsapp_trigger_index_ttl)
@@ -0,0 +1 @@
+"""Executor overhead benchmarks: synthetic flows run through FlowExecutor with stub runners."""
@@ -0,0 +1,222 @@
+"""Executor overhead benchmarks.
+
+Runs synthetic flows (benchmarks.flows) through ``FlowExecutor.execute`` with
+stub runners (benchmarks.stubs) and reports, per scenario:
+
+- engine overhead per executed node (wall time minus the stub latency on the
+  critical path, divided by the nodes that ran),
+- events per second streamed by ``execute``,
+- plan compile time and peak RSS growth while the scenario ran.
+
+Results are compared against a stored baseline and the exit code is 1 when a
+scenario's overhead regressed by more than ``--tolerance``. Baselines are
+machine specific: refresh them with ``--save-baseline`` on the machine that
+runs the comparison.
+
+Usage (from ai-workflow-backend/):
+    python -m benchmarks
+    python -m benchmarks --shapes linear fanout --sizes 10 1000 --repeat 5
+    python -m benchmarks --save-baseline
+"""
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import os
+import platform
+import sys
+import threading
+import time
+from typing import Dict, Any, List, Optional
+
+import psutil
+
+BACKEND_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_ROOT)
+
+from benchmarks.flows import SHAPES  # noqa: E402
+from benchmarks.stubs import stub_registry  # noqa: E402
+from app.services.flow_executor import FlowExecutor  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+class PeakRSS:
+    """Samples the process RSS in a background thread and keeps the maximum."""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self._process = psutil.Process()
+        self._stop = threading.Event()
+        self.start_rss = self.peak_rss = self._process.memory_info().rss
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self.peak_rss = max(self.peak_rss, self._process.memory_info().rss)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak_rss = max(self.peak_rss, self._process.memory_info().rss)
+
+
+async def run_once(executor: FlowExecutor, flow_data: Dict[str, Any], max_concurrency: int) -> Dict[str, Any]:
+    """Execute a flow once and count the events it streams."""
+    # Start every run from a clean heap so earlier runs' garbage is not collected on this one's clock
+    gc.collect()
+    events = 0
+    started = time.perf_counter()
+    async for _ in executor.execute(flow_data, "benchmark", max_concurrency=max_concurrency, timeout=0):
+        events += 1
+    return {"wall_s": time.perf_counter() - started, "events": events}
+
+
+async def run_scenario(shape: str, size: int, latency: float, repeat: int, max_concurrency: int,
+                       min_time: float = 0.2) -> Dict[str, Any]:
+    """
+    Fastest of at least ``repeat`` runs (and at least ``min_time`` seconds of
+    runs, so tiny flows are measured often enough) after one warm-up run.
+    """
+    flow_data, executed, critical_path = SHAPES[shape](size)
+    executor = FlowExecutor(runners=stub_registry(latency))
+
+    compile_started = time.perf_counter()
+    executor.plans.get_or_compile(flow_data, executor.runners.get)
+    compile_ms = (time.perf_counter() - compile_started) * 1000
+
+    best = None
+    with PeakRSS() as rss:
+        await run_once(executor, flow_data, max_concurrency)
+        runs, measured = 0, 0.0
+        while runs < max(1, repeat) or measured < min_time:
+            result = await run_once(executor, flow_data, max_concurrency)
+            runs += 1
+            measured += result["wall_s"]
+            if best is None or result["wall_s"] < best["wall_s"]:
+                best = result
+
+    overhead_s = max(0.0, best["wall_s"] - critical_path * latency)
+    return {
+        "shape": shape,
+        "nodes": size,
+        "latency_ms": latency * 1000,
+        "executed": executed,
+        "wall_ms": round(best["wall_s"] * 1000, 3),
+        "compile_ms": round(compile_ms, 3),
+        "overhead_us_per_node": round(overhead_s / max(1, executed) * 1e6, 2),
+        "events_per_s": round(best["events"] / best["wall_s"], 1) if best["wall_s"] else None,
+        "peak_rss_mb": round((rss.peak_rss - rss.start_rss) / (1024 * 1024), 2)
+    }
+
+
+def scenario_key(result: Dict[str, Any]) -> str:
+    return f"{result['shape']}/{result['nodes']}/{result['latency_ms']:g}ms"
+
+
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float, min_delta_us: float) -> List[str]:
+    """
+    Scenarios whose per-node overhead exceeds the baseline by more than
+    ``tolerance`` (relative) and ``min_delta_us`` (absolute, to ignore timer noise).
+    """
+    regressions = []
+    scenarios = baseline.get("scenarios", {})
+    for result in results:
+        reference = scenarios.get(scenario_key(result))
+        if not reference:
+            continue
+        allowed = max(reference["overhead_us_per_node"] * (1 + tolerance), reference["overhead_us_per_node"] + min_delta_us)
+        if result["overhead_us_per_node"] > allowed:
+            regressions.append(
+                f"{scenario_key(result)}: {result['overhead_us_per_node']:.1f} us/node "
+                f"(baseline {reference['overhead_us_per_node']:.1f}, limit {allowed:.1f})"
+            )
+    return regressions
+
+
+def print_table(results: List[Dict[str, Any]], baseline: Optional[Dict[str, Any]]):
+    scenarios = (baseline or {}).get("scenarios", {})
+    print(f"{'scenario':<30}{'wall ms':>10}{'us/node':>10}{'base':>8}{'events/s':>12}{'compile ms':>12}{'RSS MB':>8}")
+    for result in results:
+        reference = scenarios.get(scenario_key(result), {}).get("overhead_us_per_node")
+        print(
+            f"{scenario_key(result):<30}{result['wall_ms']:>10.1f}{result['overhead_us_per_node']:>10.1f}"
+            f"{(f'{reference:.1f}' if reference is not None else '-'):>8}{result['events_per_s'] or 0:>12.0f}"
+            f"{result['compile_ms']:>12.1f}{result['peak_rss_mb']:>8.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure FlowExecutor scheduling overhead with stub runners.")
+    parser.add_argument("--shapes", nargs="+", choices=sorted(SHAPES), default=sorted(SHAPES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10, 100, 1000, 5000])
+    parser.add_argument("--latency-ms", type=float, default=1.0, help="Latency of the fixed-latency stub runner")
+    parser.add_argument("--latency-max-nodes", type=int, default=1000,
+                        help="Largest flow also run with the fixed-latency stub (0 = no-op stubs only)")
+    parser.add_argument("--repeat", type=int, default=5, help="Minimum runs per scenario; the fastest is reported")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds of measured runs per scenario")
+    parser.add_argument("--max-concurrency", type=int, default=64)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed relative overhead growth over the baseline")
+    parser.add_argument("--min-delta-us", type=float, default=25.0, help="Overhead growth (us/node) always treated as noise")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    # Per-node engine messages are DEBUG; keep INFO chatter (plan compiles) out of the timings
+    logging.basicConfig(level=logging.WARNING)
+
+    scenarios = []
+    for shape in args.shapes:
+        for size in args.sizes:
+            scenarios.append((shape, size, 0.0))
+            if args.latency_ms > 0 and size <= args.latency_max_nodes:
+                scenarios.append((shape, size, args.latency_ms / 1000))
+
+    async def run_all():
+        return [
+            await run_scenario(shape, size, latency, args.repeat, args.max_concurrency, args.min_time)
+            for shape, size, latency in scenarios
+        ]
+
+    results = asyncio.run(run_all())
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_table(results, baseline)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump({
+                "machine": {"python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count()},
+                "scenarios": {scenario_key(result): result for result in results}
+            }, f, indent=2)
+            f.write("\n")
+        print(f"💾 Baseline saved to {args.baseline}")
+        return
+
+    if baseline is None:
+        print(f"ℹ️ No baseline at {args.baseline}; run with --save-baseline to create one.")
+        return
+    regressions = compare(results, baseline, args.tolerance, args.min_delta_us)
+    if regressions:
+        print(f"❌ {len(regressions)} scenario(s) regressed:")
+        for line in regressions:
+            print(f"   {line}")
+        sys.exit(1)
+    print("✅ No overhead regressions against the baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Local stand-in for the WhatsApp bridge that records when replies are sent.
+
+Implements the bridge endpoints the backend calls (``/status``, ``/send`` and
+``/send-batch``) without a WhatsApp connection. Every outbound message is
+searched for load-test tokens (``lt:<n>``) and the time each token reached
+the bridge is kept, so the load generator can compute webhook-to-send
+latency on the same clock.
+
+Run on its own (start the backend with WHATSAPP_BRIDGE_AUTOSTART=false):
+    python -m benchmarks.fake_bridge --port 3001
+"""
+import argparse
+import asyncio
+import re
+import threading
+import time
+from typing import Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+TOKEN = re.compile(r"lt:(\d+)")
+
+
+class FakeBridge:
+    """The bridge app plus the delivery log it fills."""
+
+    def __init__(self, send_latency: float = 0.0, batch: bool = True):
+        self.send_latency = send_latency
+        self.batch = batch
+        self.delivered: Dict[int, float] = {}  # Token -> time.perf_counter() of its first delivery
+        self.messages = 0
+        self.requests = 0
+        self.status_requests = 0
+        self.app = self._build()
+
+    def record(self, message: str):
+        now = time.perf_counter()
+        self.messages += 1
+        for token in TOKEN.findall(message or ""):
+            self.delivered.setdefault(int(token), now)
+
+    def _build(self) -> FastAPI:
+        app = FastAPI(title="Fake WhatsApp bridge")
+
+        @app.get("/status")
+        async def status():
+            self.status_requests += 1
+            return {"status": "connected", "qr": None}
+
+        @app.post("/send")
+        async def send(request: Request):
+            body = await request.json()
+            self.requests += 1
+            if not body.get("to") or not body.get("message"):
+                return JSONResponse({"error": "Missing to or message"}, status_code=400)
+            if self.send_latency:
+                await asyncio.sleep(self.send_latency)
+            self.record(body["message"])
+            return {"status": "success"}
+
+        @app.post("/send-batch")
+        async def send_batch(request: Request):
+            if not self.batch:
+                return JSONResponse({"detail": "Not Found"}, status_code=404)
+            body = await request.json()
+            self.requests += 1
+            results = []
+            for item in body.get("messages", []):
+                if self.send_latency:
+                    await asyncio.sleep(self.send_latency)
+                self.record(item.get("message"))
+                results.append({"status": "success"})
+            return {"results": results}
+
+        return app
+
+
+def serve_in_background(bridge: FakeBridge, port: int) -> "uvicorn.Server":
+    """Serve the fake bridge from a daemon thread; returns once it accepts connections."""
+    import uvicorn
+
+    server = uvicorn.Server(uvicorn.Config(bridge.app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, name="fake-bridge", daemon=True).start()
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if time.monotonic() > deadline:
+            raise RuntimeError(f"Fake bridge did not start on port {port}")
+        time.sleep(0.05)
+    return server
+
+
+def main(argv: Optional[List[str]] = None):
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Serve a fake WhatsApp bridge that records deliveries.")
+    parser.add_argument("--port", type=int, default=3001)
+    parser.add_argument("--send-latency-ms", type=float, default=0.0, help="Simulated time per sent message")
+    parser.add_argument("--no-batch", action="store_true", help="Answer /send-batch with 404, like older bridges")
+    args = parser.parse_args(argv)
+    bridge = FakeBridge(args.send_latency_ms / 1000, batch=not args.no_batch)
+    uvicorn.run(bridge.app, host="127.0.0.1", port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
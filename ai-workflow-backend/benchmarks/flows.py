@@ -0,0 +1,72 @@
+"""Synthetic flow generators.
+
+Each generator returns ``(flow_data, executed, critical_path)``: the React
+Flow style ``{"nodes", "edges"}`` document, how many nodes a run executes and
+how many nodes lie on its longest dependency chain (used to subtract the stub
+latency that any scheduler has to pay).
+"""
+from typing import Dict, Any, List, Tuple
+
+FlowSpec = Tuple[Dict[str, Any], int, int]
+
+
+def _node(node_id: str, node_type: str = "stub") -> Dict[str, Any]:
+    return {"id": node_id, "type": node_type, "data": {}}
+
+
+def _edge(source: str, target: str, handle: str = None) -> Dict[str, Any]:
+    edge = {"id": f"e{source}-{target}", "source": source, "target": target}
+    if handle:
+        edge["sourceHandle"] = handle
+    return edge
+
+
+def linear(n: int) -> FlowSpec:
+    """A single chain n0 -> n1 -> ... -> n(n-1)."""
+    nodes = [_node(f"n{i}") for i in range(n)]
+    edges = [_edge(f"n{i}", f"n{i + 1}") for i in range(n - 1)]
+    return {"nodes": nodes, "edges": edges}, n, n
+
+
+def fanout(n: int) -> FlowSpec:
+    """One root feeding n-2 independent nodes that all join into one sink."""
+    width = max(1, n - 2)
+    nodes = [_node("root")] + [_node(f"w{i}") for i in range(width)] + [_node("sink")]
+    edges = [_edge("root", f"w{i}") for i in range(width)] + [_edge(f"w{i}", "sink") for i in range(width)]
+    return {"nodes": nodes, "edges": edges}, width + 2, 3
+
+
+def diamonds(n: int) -> FlowSpec:
+    """Diamonds (split into two branches and join) chained one after another."""
+    count = max(1, n // 3)
+    nodes: List[Dict[str, Any]] = [_node("d0")]
+    edges: List[Dict[str, Any]] = []
+    for i in range(count):
+        top, left, right, bottom = f"d{i}", f"l{i}", f"r{i}", f"d{i + 1}"
+        nodes += [_node(left), _node(right), _node(bottom)]
+        edges += [_edge(top, left), _edge(top, right), _edge(left, bottom), _edge(right, bottom)]
+    return {"nodes": nodes, "edges": edges}, len(nodes), 2 * count + 1
+
+
+def condition_tree(n: int) -> FlowSpec:
+    """
+    A complete binary tree of condition nodes whose "true"/"false" handles lead
+    to the children. Only one root-to-leaf path runs; every other subtree is
+    deactivated, which exercises branch pruning.
+    """
+    nodes = [_node(f"c{i}", "stubCondition") for i in range(n)]
+    edges = []
+    for i in range(n):
+        for child, handle in ((2 * i + 1, "true"), (2 * i + 2, "false")):
+            if child < n:
+                edges.append(_edge(f"c{i}", f"c{child}", handle))
+    depth = n.bit_length()
+    return {"nodes": nodes, "edges": edges}, depth, depth
+
+
+SHAPES = {
+    "linear": linear,
+    "fanout": fanout,
+    "diamonds": diamonds,
+    "condition_tree": condition_tree,
+}
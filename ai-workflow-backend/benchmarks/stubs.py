@@ -0,0 +1,50 @@
+"""Stub runners that stand in for the real ones so only engine overhead is measured."""
+import asyncio
+from typing import Dict, Any
+
+from app.runners.registry import RunnerRegistry
+
+
+class NoopRunner:
+    """Returns immediately without touching the thread pool."""
+
+    execution_mode = "inline"
+
+    def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
+        return {"output": node_data["node_id"]}
+
+
+class LatencyRunner:
+    """Waits a fixed time without blocking the event loop, like an I/O-bound node."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
+        await asyncio.sleep(self.latency)
+        return {"output": node_data["node_id"]}
+
+
+class ConditionStub:
+    """Always takes the "true" branch so a condition tree runs one deterministic path."""
+
+    execution_mode = "inline"
+
+    def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
+        return {"path": "true", "output": node_data["node_id"]}
+
+
+class LatencyConditionStub(LatencyRunner):
+    """ConditionStub with a fixed latency."""
+
+    async def run(self, node_data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
+        await asyncio.sleep(self.latency)
+        return {"path": "true", "output": node_data["node_id"]}
+
+
+def stub_registry(latency: float = 0.0) -> RunnerRegistry:
+    """Registry holding only the stub node types used by benchmarks.flows."""
+    registry = RunnerRegistry(paths={})
+    registry.register("stub", LatencyRunner(latency) if latency > 0 else NoopRunner())
+    registry.register("stubCondition", LatencyConditionStub(latency) if latency > 0 else ConditionStub())
+    return registry
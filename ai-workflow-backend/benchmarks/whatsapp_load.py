@@ -0,0 +1,230 @@
+"""WhatsApp webhook load test.
+
+Posts synthetic ``WhatsAppWebhookRequest`` payloads to a running backend at
+a series of fixed rates (open loop: sends are not held back by slow
+responses) from a configurable number of distinct senders. A local fake
+bridge (benchmarks.fake_bridge) receives the replies, so every message's
+end-to-end latency, from posting it to the webhook until its reply reaches
+the bridge, is measured on one clock.
+
+The test saves an echo flow (WhatsApp Input -> Prompt Template ->
+WhatsApp Output) through the API, which becomes the newest WhatsApp-triggered
+flow and so receives every message, and deletes it afterwards. Each step
+reports accepted/shed webhooks, delivery ratio and p50/p99 latency; the
+maximum sustainable rate is the highest step that delivered at least
+``--min-delivery`` of its messages with nothing shed and p99 within
+``--max-p99-ms``.
+
+Usage (from ai-workflow-backend/, with the backend started as
+``WHATSAPP_BRIDGE_AUTOSTART=false uvicorn app.main:app``):
+    python -m benchmarks.whatsapp_load
+    python -m benchmarks.whatsapp_load --rates 20 50 100 200 400 --duration 15 --senders 500
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import sys
+import time
+import uuid
+from typing import Dict, Any, List, Optional
+
+import httpx
+
+BACKEND_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_ROOT)
+
+from benchmarks.fake_bridge import FakeBridge, serve_in_background  # noqa: E402
+
+
+def echo_flow() -> Dict[str, Any]:
+    """Replies with the incoming text, which carries the message's load-test token."""
+    return {
+        "nodes": [
+            {"id": "in", "type": "whatsAppInput", "data": {"mode": "everyone"}},
+            {"id": "echo", "type": "promptTemplate", "data": {"template": "{input}"}},
+            {"id": "out", "type": "whatsAppOutput", "data": {}}
+        ],
+        "edges": [
+            {"id": "e1", "source": "in", "target": "echo"},
+            {"id": "e2", "source": "echo", "target": "out"}
+        ]
+    }
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))]
+
+
+async def run_step(client: httpx.AsyncClient, bridge: FakeBridge, tokens: itertools.count, rate: float, duration: float,
+                   senders: int, drain: float) -> Dict[str, Any]:
+    """Offer ``rate`` messages per second for ``duration`` seconds, then wait up to ``drain`` seconds for replies."""
+    run = uuid.uuid4().hex[:8]
+    sent: Dict[int, float] = {}
+    statuses: Dict[str, int] = {}
+    webhook_ms: List[float] = []
+
+    async def post(token: int, sender: int):
+        started = time.perf_counter()
+        sent[token] = started
+        try:
+            response = await client.post("/api/whatsapp/webhook", json={
+                "id": f"lt-{run}-{token}",
+                "from": f"{9100000000 + sender}@s.whatsapp.net",
+                "name": f"Load {sender}",
+                "content": f"lt:{token}",
+                "timestamp": int(time.time())
+            })
+            key = str(response.status_code)
+        except httpx.HTTPError as e:
+            key = type(e).__name__
+        webhook_ms.append((time.perf_counter() - started) * 1000)
+        statuses[key] = statuses.get(key, 0) + 1
+        if key != "200":
+            # Shed or failed: never replied to, so not part of the delivery ratio
+            sent.pop(token, None)
+
+    total = max(1, int(rate * duration))
+    tasks = []
+    started = time.perf_counter()
+    for i in range(total):
+        delay = started + i / rate - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(post(next(tokens), i % senders)))
+    await asyncio.gather(*tasks)
+    offered_s = time.perf_counter() - started
+
+    deadline = time.perf_counter() + drain
+    while time.perf_counter() < deadline and any(token not in bridge.delivered for token in sent):
+        await asyncio.sleep(0.05)
+
+    latencies = [(bridge.delivered[token] - at) * 1000 for token, at in sent.items() if token in bridge.delivered]
+    accepted = statuses.get("200", 0)
+    return {
+        "rate": rate,
+        "offered": total,
+        "achieved_rate": round(total / offered_s, 1) if offered_s else None,
+        "accepted": accepted,
+        "shed": statuses.get("429", 0),
+        "errors": total - accepted - statuses.get("429", 0),
+        "delivered": len(latencies),
+        "delivery_ratio": round(len(latencies) / accepted, 4) if accepted else 0.0,
+        "p50_ms": round(percentile(latencies, 0.5), 1) if latencies else None,
+        "p99_ms": round(percentile(latencies, 0.99), 1) if latencies else None,
+        "webhook_p99_ms": round(percentile(webhook_ms, 0.99), 1) if webhook_ms else None,
+        "statuses": statuses
+    }
+
+
+def sustainable(result: Dict[str, Any], min_delivery: float, max_p99_ms: float) -> bool:
+    return (
+        result["accepted"] > 0
+        and result["shed"] == 0
+        and result["errors"] == 0
+        and result["delivery_ratio"] >= min_delivery
+        and result["p99_ms"] is not None
+        and result["p99_ms"] <= max_p99_ms
+    )
+
+
+def print_header():
+    print(f"{'rate/s':>8}{'sent/s':>9}{'accepted':>10}{'shed':>7}{'errors':>8}{'delivered':>11}{'p50 ms':>9}{'p99 ms':>9}{'hook p99':>10}  ok")
+
+
+def print_row(r: Dict[str, Any], ok: bool):
+    # Printed as each step finishes, since a full run takes minutes
+    print(
+        f"{r['rate']:>8g}{r['achieved_rate'] or 0:>9.1f}{r['accepted']:>10}{r['shed']:>7}{r['errors']:>8}"
+        f"{r['delivery_ratio'] * 100:>10.1f}%{r['p50_ms'] if r['p50_ms'] is not None else '-':>9}"
+        f"{r['p99_ms'] if r['p99_ms'] is not None else '-':>9}{r['webhook_p99_ms'] or '-':>10}"
+        f"  {'✅' if ok else '❌'}",
+        flush=True
+    )
+
+
+async def run(args) -> Dict[str, Any]:
+    bridge = FakeBridge(args.send_latency_ms / 1000, batch=not args.no_batch)
+    serve_in_background(bridge, args.bridge_port)
+    limits = httpx.Limits(max_connections=args.connections, max_keepalive_connections=args.connections)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=args.timeout) as client:
+        # Status goes through the backend's bridge client, so this also checks it reaches the fake bridge
+        status = (await client.get("/api/whatsapp/status")).json()
+        if status.get("status") != "connected":
+            raise SystemExit(
+                f"❌ Backend does not see the fake bridge on port {args.bridge_port} (status: {status.get('status')}). "
+                "Start it with WHATSAPP_BRIDGE_AUTOSTART=false so the real bridge does not take the port."
+            )
+        saved = await client.post("/api/flow/save", json={
+            "name": f"whatsapp-load-test-{uuid.uuid4().hex[:8]}",
+            "description": "Temporary echo flow created by benchmarks.whatsapp_load",
+            "flow_data": echo_flow()
+        })
+        saved.raise_for_status()
+        flow_id = saved.json()["id"]
+        tokens = itertools.count(1)
+        results = []
+        try:
+            # Warm-up: plan compile, runner imports, connection pools
+            await run_step(client, bridge, tokens, rate=min(5.0, args.rates[0]), duration=1, senders=args.senders, drain=args.drain)
+            if not args.json:
+                print_header()
+            for rate in args.rates:
+                result = await run_step(client, bridge, tokens, rate, args.duration, args.senders, args.drain)
+                results.append(result)
+                ok = sustainable(result, args.min_delivery, args.max_p99_ms)
+                if not args.json:
+                    print_row(result, ok)
+                if not ok and not args.all_rates:
+                    break
+                await asyncio.sleep(args.pause)
+        finally:
+            if not args.keep_flow:
+                await client.delete(f"/api/flow/{flow_id}")
+    passing = [r["rate"] for r in results if sustainable(r, args.min_delivery, args.max_p99_ms)]
+    return {
+        "senders": args.senders,
+        "duration_s": args.duration,
+        "bridge_requests": bridge.requests,
+        "max_sustainable_rate": max(passing) if passing else None,
+        "steps": results
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the WhatsApp message rate the backend sustains end to end.")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="Backend base URL")
+    parser.add_argument("--rates", nargs="+", type=float, default=[10, 25, 50, 100, 200, 400], help="Messages per second, one step each")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds each rate is offered")
+    parser.add_argument("--senders", type=int, default=200, help="Distinct sender JIDs messages rotate through")
+    parser.add_argument("--drain", type=float, default=15.0, help="Seconds to wait for outstanding replies after a step")
+    parser.add_argument("--pause", type=float, default=2.0, help="Seconds between steps")
+    parser.add_argument("--min-delivery", type=float, default=0.99, help="Fraction of accepted messages that must be replied to")
+    parser.add_argument("--max-p99-ms", type=float, default=5000.0, help="Highest end-to-end p99 a sustainable rate may have")
+    parser.add_argument("--all-rates", action="store_true", help="Keep stepping after the first unsustainable rate")
+    parser.add_argument("--connections", type=int, default=200, help="Concurrent connections to the backend")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Webhook request timeout in seconds")
+    parser.add_argument("--bridge-port", type=int, default=3001, help="Port of the fake bridge (the backend calls localhost:3001)")
+    parser.add_argument("--send-latency-ms", type=float, default=0.0, help="Simulated bridge time per sent message")
+    parser.add_argument("--no-batch", action="store_true", help="Fake bridge answers /send-batch with 404")
+    parser.add_argument("--keep-flow", action="store_true", help="Do not delete the echo flow afterwards")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    rate = report["max_sustainable_rate"]
+    if rate is None:
+        print(f"❌ No rate was sustainable (delivery >= {args.min_delivery:.0%}, p99 <= {args.max_p99_ms:g} ms, nothing shed).")
+        sys.exit(1)
+    print(f"✅ Maximum sustainable rate: {rate:g} messages/s with {args.senders} senders")
+
+
+if __name__ == "__main__":
+    main()
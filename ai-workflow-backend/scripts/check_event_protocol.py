@@ -0,0 +1,52 @@
+"""Event protocol v2 check: results the frontend reads as structures stay renderable.
+
+Encodes an IDE node result with a file larger than the inline limit the way
+a protocol=2 stream does and fails (exit code 1) unless ``ide_data`` reaches
+the client unchanged, i.e. IDEView gets file contents rather than artifact refs.
+Other large strings must still be sent as refs.
+
+Usage (from ai-workflow-backend/):
+    python scripts/check_event_protocol.py
+"""
+import json
+import os
+import sys
+
+BACKEND_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_ROOT)
+
+from app.services.event_protocol import CompactEventEncoder  # noqa: E402
+
+
+def main():
+    encoder = CompactEventEncoder(inline_limit=4096)
+    encoder.run_id = 0
+    content = "print('hello')\n" * 400  # ~6 KB
+    ide_data = {
+        "files": [{"path": "backend/app/main.py", "content": content}],
+        "project_name": "Large project",
+        "entry_point": "backend/app/main.py",
+        "port": None
+    }
+    result = {"ide_data": ide_data, "output": content}
+
+    finish = json.loads(encoder.encode({"type": "node_finish", "node_id": "ide", "node_type": "ide", "status": "success", "result": result}))
+    final = json.loads(encoder.encode({"type": "final", "output": content, "failed_nodes": [], "state": {**result, "ide_data": dict(ide_data)}}))
+
+    failures = []
+    if finish["result"]["ide_data"] != ide_data:
+        failures.append("node_finish ide_data was compacted")
+    if final["state"].get("ide_data", ide_data) != ide_data:
+        failures.append("final ide_data was compacted")
+    if not isinstance(finish["result"]["output"], dict) or "$ref" not in finish["result"]["output"]:
+        failures.append("large output was not sent as an artifact ref")
+
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        sys.exit(1)
+    print(f"✅ IDE result with a {len(content)} character file is sent inline")
+
+
+if __name__ == "__main__":
+    main()
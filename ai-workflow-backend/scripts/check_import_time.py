@@ -0,0 +1,71 @@
+"""Cold-start import budget check.
+
+Runs ``python -X importtime -c "import app.main"`` in a fresh interpreter and
+fails (exit code 1) when the cumulative import time of the app exceeds the
+budget, listing the slowest modules so regressions are easy to track down.
+
+Usage (from ai-workflow-backend/):
+    python scripts/check_import_time.py --budget-ms 1500 --top 15
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+BACKEND_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(module: str):
+    """Return (total_us, [(cumulative_us, self_us, module_name), ...]) for importing a module."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_ROOT,
+        capture_output=True,
+        text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{proc.stderr[-2000:]}")
+
+    entries = []
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        cumulative_us = int(cumulative_us)
+        entries.append((cumulative_us, int(self_us), name.strip()))
+        # Top-level imports carry no indentation; their cumulative times add up to the total
+        if not name[1:].startswith(" "):
+            total_us += cumulative_us
+    entries.sort(reverse=True)
+    return total_us, entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fail when app cold-start imports exceed a time budget.")
+    parser.add_argument("--module", default="app.main", help="Module to import (default: app.main)")
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("IMPORT_TIME_BUDGET_MS", 1500)))
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest modules to list")
+    parser.add_argument("--runs", type=int, default=3, help="Measurements to take; the fastest is used")
+    args = parser.parse_args()
+
+    best_total, best_entries = None, None
+    for _ in range(max(1, args.runs)):
+        total_us, entries = measure(args.module)
+        if best_total is None or total_us < best_total:
+            best_total, best_entries = total_us, entries
+
+    total_ms = best_total / 1000
+    print(f"⏱️  import {args.module}: {total_ms:.0f} ms (budget {args.budget_ms:.0f} ms)")
+    print(f"   Slowest modules (cumulative ms):")
+    for cumulative_us, self_us, name in best_entries[:args.top]:
+        print(f"   {cumulative_us / 1000:8.1f}  {name}")
+
+    if total_ms > args.budget_ms:
+        print(f"❌ Import budget exceeded by {total_ms - args.budget_ms:.0f} ms")
+        sys.exit(1)
+    print("✅ Within import budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@ import React, { useState, useEffect, lazy, Suspense } from 'react';
 import { useSelector, useDispatch } from 'react-redux';
 import {
     setNodes, setEdges, setFlowId, setCurrentFlowName,
-    setSavedFlows, setIsLoadingFlows, setActiveAgentId, resetWorkflow
+    setSavedFlows, appendSavedFlows, setSavedFlowsCursor, setIsLoadingFlows, setActiveAgentId, resetWorkflow
 } from './store/workflowSlice';
 import { toggleTheme, setCustomGradient, setIsThemeAnimated } from './store/themeSlice';
 
@@ -23,7 +23,7 @@ const SimpleFlowCard = lazy(() => import('./components/SimpleFlowCard'));
 const FlowTable = lazy(() => import('./components/FlowTable'));
 const KnowledgeBase = lazy(() => import('./pages/KnowledgeBase'));
 
-import { listFlows, runFlow, deleteFlow, shareFlow, getPublicFlow } from './services/api';
+import { listFlows, getFlow, runFlow, deleteFlow, shareFlow, getPublicFlow } from './services/api';
 import GlowButton from './components/GlowButton';
 import KnowledgeNode from './components/Nodes/KnowledgeNode';
 
@@ -99,6 +99,7 @@ function App() {
     const flowId = useSelector(state => state.workflow.flowId);
     const currentFlowName = useSelector(state => state.workflow.currentFlowName);
     const savedFlows = useSelector(state => state.workflow.savedFlows);
+    const savedFlowsCursor = useSelector(state => state.workflow.savedFlowsCursor);
     const isLoadingFlows = useSelector(state => state.workflow.isLoadingFlows);
     const activeAgentId = useSelector(state => state.workflow.activeAgentId);
 
@@ -122,6 +123,7 @@ function App() {
     const [runEdges, setRunEdges] = useState([]);
     const [dashboardViewMode, setDashboardViewMode] = useState('grid'); // 'grid' or 'table'
     const [canvasResetKey, setCanvasResetKey] = useState(0);
+    const [isLoadingMoreFlows, setIsLoadingMoreFlows] = useState(false);
 
     const [agents] = useState([
         { id: 'default-flow', name: 'Main Canvas', icon: '🎨', color: '#ff7a00' },
@@ -141,8 +143,10 @@ function App() {
 
         dispatch(setIsLoadingFlows(true));
         try {
-            const flows = await listFlows();
-            dispatch(setSavedFlows(flows));
+            // First page only; further pages are fetched with "Load more"
+            const page = await listFlows();
+            dispatch(setSavedFlows(page.items));
+            dispatch(setSavedFlowsCursor(page.next_cursor));
         } catch (error) {
             console.error('Failed to load flows:', error);
         } finally {
@@ -150,6 +154,21 @@ function App() {
         }
     };
 
+    const loadMoreFlows = async () => {
+        if (!savedFlowsCursor || isLoadingMoreFlows) return;
+
+        setIsLoadingMoreFlows(true);
+        try {
+            const page = await listFlows(savedFlowsCursor);
+            dispatch(appendSavedFlows(page.items));
+            dispatch(setSavedFlowsCursor(page.next_cursor));
+        } catch (error) {
+            console.error('Failed to load more flows:', error);
+        } finally {
+            setIsLoadingMoreFlows(false);
+        }
+    };
+
 
     // Handle initial route for shared links
     useEffect(() => {
@@ -191,11 +210,12 @@ function App() {
 
     const activeAgent = agents.find(a => a.id === activeAgentId);
 
-    const handleEditFlow = (flow) => {
+    const handleEditFlow = async (flow) => {
         console.log("Edit clicked for flow:", flow);
         alert("Loading workflow: " + flow.name);
         try {
-            const flowData = flow.flow_data;
+            // The flow list only carries summaries; load the graph itself
+            const flowData = (await getFlow(flow.id)).flow_data;
             console.log("Flow Data:", flowData);
 
             if (flowData.nodes) {
@@ -220,11 +240,11 @@ function App() {
         }
     };
 
-    const handleRunFlow = (flow) => {
+    const handleRunFlow = async (flow) => {
         console.log("Run clicked for flow:", flow);
         try {
             // Prepare nodes for execution - clear previous error styles
-            const flowData = flow.flow_data;
+            const flowData = (await getFlow(flow.id)).flow_data;
             if (flowData.nodes) {
                 const cleanedNodes = flowData.nodes.map(node => ({
                     ...node,
@@ -490,6 +510,26 @@ function App() {
                                     ))}
                                 </div>
                             )}
+                            {!isLoadingFlows && savedFlowsCursor && (
+                                <div style={{ display: 'flex', justifyContent: 'center', padding: '2rem 0' }}>
+                                    <button
+                                        onClick={loadMoreFlows}
+                                        disabled={isLoadingMoreFlows}
+                                        style={{
+                                            padding: '10px 24px',
+                                            borderRadius: '10px',
+                                            border: '1px solid var(--border-color)',
+                                            background: 'var(--bg-tertiary)',
+                                            color: 'var(--text-primary)',
+                                            fontWeight: '600',
+                                            cursor: isLoadingMoreFlows ? 'default' : 'pointer',
+                                            opacity: isLoadingMoreFlows ? 0.6 : 1
+                                        }}
+                                    >
+                                        {isLoadingMoreFlows ? 'Loading...' : 'Load more'}
+                                    </button>
+                                </div>
+                            )}
                         </Suspense>
                     </div>
                 )}
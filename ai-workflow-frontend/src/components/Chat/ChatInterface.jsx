@@ -1,5 +1,5 @@
 import React, { useState, useRef, useEffect } from 'react';
-import { runFlow, runPublicFlow, sendEmail, exportPythonFlow } from '../../services/api';
+import { runFlow, runPublicFlow, sendEmail, exportPythonFlow, resolveArtifact } from '../../services/api';
 import CodeViewModal from '../CodeViewModal';
 import IDEView from './IDE/IDEView';
 
@@ -76,6 +76,8 @@ const ChatInterface = ({ nodes, edges, onClose, onExecutionResult, theme, shareT
             const decoder = new TextDecoder();
             let accumulatedContent = "";
             let streamingId = `msg_${Date.now()}`;
+            // Protocol v2 leaves logs out of the final event; rebuild them from node events
+            const runLogs = [];
 
             // Add placeholder assistant message
             setMessages((prev) => [
@@ -105,6 +107,7 @@ const ChatInterface = ({ nodes, edges, onClose, onExecutionResult, theme, shareT
                                     m.id === streamingId ? { ...m, text: `⏳ Executing: **${event.node_type}**...` } : m
                                 ));
                             } else if (event.type === 'node_finish') {
+                                runLogs.push({ node_id: event.node_id, node_type: event.node_type, status: event.status });
                                 setMessages(prev => prev.map(m => {
                                     if (m.id === streamingId) {
                                         const currentLogs = m.logs || [];
@@ -117,23 +120,26 @@ const ChatInterface = ({ nodes, edges, onClose, onExecutionResult, theme, shareT
                                 }));
 
                                 if (event.result?.ide_data) {
-                                    setCurrentIdeData(event.result.ide_data);
+                                    setCurrentIdeData(await resolveArtifact(event.result.ide_data));
                                 }
                             } else if (event.type === 'final') {
                                 const state = event.state || {};
                                 const cumulativeHtml = state.cumulative_html || [];
-                                let finalHtml = cumulativeHtml.map(h => h.content).join('\n<hr style="border: 1px solid #444; margin: 25px 0;">\n');
+                                const htmlParts = await Promise.all(cumulativeHtml.map(h => resolveArtifact(h.content)));
+                                let finalHtml = htmlParts.join('\n<hr style="border: 1px solid #444; margin: 25px 0;">\n');
+                                const output = await resolveArtifact(event.output);
+                                const logs = event.logs || runLogs;
 
                                 setMessages(prev => prev.map(m =>
                                     m.id === streamingId ? {
                                         ...m,
-                                        text: event.output,
+                                        text: output,
                                         htmlPreview: finalHtml,
-                                        logs: event.logs
+                                        logs: logs
                                     } : m
                                 ));
 
-                                if (onExecutionResult) onExecutionResult(event.logs);
+                                if (onExecutionResult) onExecutionResult(logs);
                             } else if (event.type === 'error') {
                                 setMessages(prev => prev.map(m =>
                                     m.id === streamingId ? { ...m, text: `❌ Error: ${event.message}`, status: 'error' } : m
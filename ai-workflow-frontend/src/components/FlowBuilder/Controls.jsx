@@ -4,7 +4,7 @@ import ChatInterface from '../Chat/ChatInterface';
 import { saveFlow, updateFlow, listFlows } from '../../services/api';
 import { useDispatch } from 'react-redux';
 import {
-    setNodes, setFlowId, setCurrentFlowName, setSavedFlows, resetWorkflow, setActiveAgentId
+    setNodes, setFlowId, setCurrentFlowName, setSavedFlows, setSavedFlowsCursor, resetWorkflow, setActiveAgentId
 } from '../../store/workflowSlice';
 
 const Controls = ({ nodes, edges, activeAgent, onBack, flowId, flowName, theme, isReadOnly = false, shareToken = null }) => {
@@ -51,9 +51,10 @@ const Controls = ({ nodes, edges, activeAgent, onBack, flowId, flowName, theme,
                 dispatch(setFlowId(savedFlow.id));
             }
 
-            // Refresh the saved flows list in Redux
-            const flows = await listFlows();
-            dispatch(setSavedFlows(flows));
+            // Refresh the saved flows list in Redux (first page; the dashboard loads more on demand)
+            const page = await listFlows();
+            dispatch(setSavedFlows(page.items));
+            dispatch(setSavedFlowsCursor(page.next_cursor));
 
             setShowSaveModal(false);
             alert('Flow saved successfully!');
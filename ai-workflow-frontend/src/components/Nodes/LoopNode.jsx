@@ -25,10 +25,33 @@ const LoopNode = ({ id, data, isConnectable }) => {
                     />
                 </div>
 
+                <div className="input-field">
+                    <label>Iterate Over (State Key)</label>
+                    <input
+                        type="text"
+                        value={data.itemsKey || ''}
+                        onChange={(e) => data.onChange?.(id, { itemsKey: e.target.value })}
+                        placeholder="e.g. extracted_data"
+                        className="nodrag"
+                    />
+                </div>
+
+                <div className="input-field">
+                    <label>Parallel Iterations</label>
+                    <input
+                        type="number"
+                        value={data.parallelism || 4}
+                        onChange={(e) => data.onChange?.(id, { parallelism: e.target.value })}
+                        min="1"
+                        max="50"
+                        className="nodrag"
+                    />
+                </div>
+
                 <div className="info-text">
                     Executes iterative sub-branches ⚡
                     <br />
-                    <small>Loop resets state on each pass</small>
+                    <small>Each pass gets its own copy of the state; results are collected in loop_results</small>
                 </div>
             </div>
 
@@ -115,6 +138,7 @@ const LoopNode = ({ id, data, isConnectable }) => {
                     color: #1e293b;
                 }
                 input:focus { outline: none; border-color: #f59e0b; background: white; }
+                .input-field + .input-field { margin-top: 10px; }
                 .info-text { font-size: 11px; margin-top: 15px; color: #4b5563; font-weight: 600; }
                 .info-text small { font-size: 9px; color: #94a3b8; }
 
@@ -27,7 +27,8 @@ export const deleteFlow = async (flowId) => {
 
 export const runFlow = async (flowData, input) => {
     // We use fetch for streaming instead of axios
-    const response = await fetch(`${API_BASE_URL}/flow/run`, {
+    // protocol=2: large outputs arrive as artifact references (see resolveArtifact)
+    const response = await fetch(`${API_BASE_URL}/flow/run?protocol=2`, {
         method: 'POST',
         headers: {
             'Content-Type': 'application/json',
@@ -40,6 +41,14 @@ export const runFlow = async (flowData, input) => {
     return response; // Return the raw response for stream reading
 };
 
+// Event protocol v2 sends large values as { $ref, bytes, media_type }; fetch them on demand
+export const resolveArtifact = async (value) => {
+    if (!value || typeof value !== 'object' || !value.$ref) return value;
+    const response = await fetch(value.$ref);
+    if (!response.ok) throw new Error(`Artifact unavailable (${response.status})`);
+    return response.text();
+};
+
 // WhatsApp API
 export const getWhatsAppStatus = async () => {
     try {
@@ -51,8 +60,10 @@ export const getWhatsAppStatus = async () => {
     }
 };
 
-export const listFlows = async () => {
-    const response = await api.get('/flows');
+// One page of saved flow summaries (without flow_data), newest first; pass the previous page's next_cursor for the next one
+export const listFlows = async (cursor = null, limit = 50) => {
+    const params = cursor ? { limit, cursor } : { limit };
+    const response = await api.get('/flows', { params });
     return response.data;
 };
 
@@ -93,7 +104,7 @@ export const executePublicFlow = async (shareToken, input) => {
 };
 
 export const runPublicFlow = async (shareToken, input) => {
-    const response = await fetch(`${API_BASE_URL}/public/execute/${shareToken}`, {
+    const response = await fetch(`${API_BASE_URL}/public/execute/${shareToken}?protocol=2`, {
         method: 'POST',
         headers: {
             'Content-Type': 'application/json',
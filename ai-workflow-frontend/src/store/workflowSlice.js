@@ -6,6 +6,7 @@ const initialState = {
     flowId: null,
     currentFlowName: 'Main Canvas Workflow',
     savedFlows: [],
+    savedFlowsCursor: null, // next_cursor of the last loaded page; null when all are loaded
     files: [],
     isLoadingFlows: false,
     activeAgentId: localStorage.getItem('active-agent-id') || 'default-flow',
@@ -30,6 +31,12 @@ const workflowSlice = createSlice({
         setSavedFlows: (state, action) => {
             state.savedFlows = action.payload;
         },
+        appendSavedFlows: (state, action) => {
+            state.savedFlows = [...state.savedFlows, ...action.payload];
+        },
+        setSavedFlowsCursor: (state, action) => {
+            state.savedFlowsCursor = action.payload;
+        },
         setFiles: (state, action) => {
             state.files = action.payload;
         },
@@ -59,6 +66,8 @@ export const {
     setFlowId,
     setCurrentFlowName,
     setSavedFlows,
+    appendSavedFlows,
+    setSavedFlowsCursor,
     setFiles,
     setIsLoadingFlows,
     setActiveAgentId,
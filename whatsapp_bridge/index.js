@@ -82,6 +82,7 @@ async function connectToWhatsApp() {
                     try {
                         console.log(`Forwarding message to ${BACKEND_URL}...`);
                         await axios.post(BACKEND_URL, {
+                            id: msg.key.id,
                             from,
                             name,
                             content,
@@ -112,6 +113,30 @@ async function connectToWhatsApp() {
         }
     });
 
+    // Send several messages in one request; results are per message, in order
+    app.post('/send-batch', async (req, res) => {
+        const { messages } = req.body;
+        if (!Array.isArray(messages)) {
+            return res.status(400).json({ error: 'Missing messages' });
+        }
+
+        const results = [];
+        for (const { to, message } of messages) {
+            if (!to || !message) {
+                results.push({ error: 'Missing to or message' });
+                continue;
+            }
+            try {
+                await sock.sendMessage(to, { text: message });
+                results.push({ status: 'success' });
+            } catch (err) {
+                console.error('Error sending message:', err);
+                results.push({ error: err.message });
+            }
+        }
+        res.json({ results });
+    });
+
     // Expose status endpoint
     app.get('/status', (req, res) => {
         res.json({ status: connStatus, qr: lastQr });